@@ -84,6 +84,23 @@ class ChargeResolutionCalculator:
         if self._n_bytes > self._max_bytes:
             self._amalgamate()
 
+    def merge(self, other):
+        """
+        Contribute the values of another ChargeResolutionCalculator, e.g.
+        one filled from a different file in another process
+
+        Parameters
+        ----------
+        other : ChargeResolutionCalculator
+        """
+        if other._df.index.size > 0:
+            self._df_list.append(other._df)
+            self._n_bytes += other._df.memory_usage(index=True, deep=True).sum()
+        self._df_list.extend(other._df_list)
+        self._n_bytes += other._n_bytes
+        if self._n_bytes > self._max_bytes:
+            self._amalgamate()
+
     def _amalgamate(self):
         """
         Concatenate the dataframes inside the list, and sum together
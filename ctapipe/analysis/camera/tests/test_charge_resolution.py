@@ -98,3 +98,28 @@ def test_result_mc_true():
             chargeres.charge_res(true, sum_, n))
     assert (df_p['charge_resolution_abs'].values[0] ==
             chargeres.charge_res_abs(true, sum_, n))
+
+
+def test_merge():
+    true_charge = np.arange(1, 101)
+    measured_charge = true_charge + np.random.normal(size=100)
+
+    chargeres = ChargeResolutionCalculator()
+    chargeres.add(0, true_charge, measured_charge)
+    other = ChargeResolutionCalculator()
+    other.add(0, true_charge, measured_charge)
+    other._amalgamate()
+    other.add(1, true_charge, measured_charge)
+    chargeres.merge(other)
+
+    expected = ChargeResolutionCalculator()
+    expected.add(0, true_charge, measured_charge)
+    expected.add(0, true_charge, measured_charge)
+    expected.add(1, true_charge, measured_charge)
+
+    df_p, df_c = chargeres.finish()
+    expected_p, expected_c = expected.finish()
+    assert_almost_equal(df_p['charge_resolution'].values,
+                        expected_p['charge_resolution'].values)
+    assert_almost_equal(df_c['charge_resolution'].values,
+                        expected_c['charge_resolution'].values)
@@ -0,0 +1,16 @@
+"""
+Performance benchmarks of the DL0 to DL2 processing.
+
+The benchmarks follow the conventions of `asv <https://asv.readthedocs.io>`_:
+classes with ``params``, a ``setup`` method and ``time_*`` methods, which
+are called with each combination of the parameters. All input data is
+generated with `ctapipe.image.toymodel` and `ctapipe.io.toymodel`, so
+no network access or data files apart from the camera and optics
+descriptions of ``ctapipe-extra`` are needed.
+
+Run them either with asv, using the ``asv.conf.json`` in the repository
+root, e.g. ``asv run`` or ``asv continuous master HEAD``, or without any
+additional dependency with::
+
+    python -m ctapipe.benchmarks [--filter REGEX] [--repeat N]
+"""
@@ -0,0 +1,5 @@
+from .runner import main
+
+# asv imports every module of the benchmark directory during discovery
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+"""
+Benchmarks of the charge extraction from the waveforms
+"""
+import numpy as np
+
+from ctapipe.image import charge_extractors
+from .common import CAMERAS, SEED, get_geometry, make_waveforms
+
+EXTRACTORS = [
+    name for name in charge_extractors.__all__ if name != 'ChargeExtractor'
+]
+
+
+class ChargeExtraction:
+    params = [CAMERAS, EXTRACTORS]
+    param_names = ['camera', 'extractor']
+
+    def setup(self, camera, extractor):
+        rng = np.random.RandomState(SEED)
+        geom = get_geometry(camera)
+        self.waveforms = make_waveforms(geom, rng)
+
+        self.extractor = getattr(charge_extractors, extractor)()
+        if self.extractor.requires_neighbours():
+            self.extractor.neighbours = geom.neighbor_matrix_where
+
+    def time_extract_charge(self, camera, extractor):
+        self.extractor.extract_charge(self.waveforms)
@@ -0,0 +1,127 @@
+"""
+Generation of the benchmark inputs
+"""
+from functools import lru_cache
+
+import astropy.units as u
+import numpy as np
+from scipy.stats import norm
+
+from ctapipe.image import hillas_parameters, tailcuts_clean, toymodel
+from ctapipe.instrument import (
+    CameraGeometry,
+    OpticsDescription,
+    SubarrayDescription,
+    TelescopeDescription,
+)
+
+__all__ = [
+    'CAMERAS',
+    'N_SAMPLES',
+    'get_geometry',
+    'make_image',
+    'make_waveforms',
+    'make_subarray',
+    'make_hillas_dict',
+]
+
+# from small to large number of pixels
+CAMERAS = ['CHEC', 'NectarCam', 'LSTCam', 'SCTCam']
+
+# telescope type and equivalent focal length of the telescopes
+# carrying each camera
+_OPTICS = {
+    'CHEC': ('SST', 2.283 * u.m),
+    'NectarCam': ('MST', 16.0 * u.m),
+    'LSTCam': ('LST', 28.0 * u.m),
+    'SCTCam': ('MST', 5.586 * u.m),
+}
+
+N_SAMPLES = 25
+SEED = 0
+
+
+@lru_cache(maxsize=None)
+def get_geometry(camera):
+    """ the geometry of ``camera``, only read once """
+    return CameraGeometry.from_name(camera)
+
+
+def make_image(geom, rng, intensity=1000, nsb_level_pe=3):
+    """
+    a toy model shower image in the central part of the camera
+
+    Parameters
+    ----------
+    geom: ctapipe.instrument.CameraGeometry
+        camera geometry
+    rng: numpy.random.RandomState
+        random state, the numpy global state is seeded from it, as the
+        toy model uses that
+    """
+    np.random.seed(rng.randint(2**31))
+
+    # scale the shower to the pixel size, so images of all cameras
+    # have a similar number of pixels surviving the cleaning
+    radius = geom.pix_x.max().value
+    pixel_width = np.sqrt(geom.pix_area[0].value)
+    centroid = rng.uniform(-0.3 * radius, 0.3 * radius, 2)
+    length = rng.uniform(2, 4) * pixel_width
+    width = rng.uniform(0.3, 0.5) * length
+    psi = f'{rng.uniform(0, 360)}d'
+
+    model = toymodel.generate_2d_shower_model(centroid, width, length, psi)
+    image, _, _ = toymodel.make_toymodel_shower_image(
+        geom, model.pdf, intensity=intensity, nsb_level_pe=nsb_level_pe,
+    )
+    return image.astype(np.float64)
+
+
+def make_waveforms(geom, rng, n_channels=1, n_samples=N_SAMPLES):
+    """
+    waveforms of shape (n_channels, n_pixels, n_samples) of a toy model
+    shower image, like `ctapipe.io.toymodel.toymodel_event_source` creates
+    them
+    """
+    image = make_image(geom, rng)
+    t = np.arange(n_samples)
+    means = rng.normal(15, 1, (geom.n_pixels, 1))
+    stds = rng.uniform(3, 6, (geom.n_pixels, 1))
+    samples = image[:, np.newaxis] * norm.pdf(t, means, stds)
+    return np.repeat(samples[np.newaxis], n_channels, axis=0)
+
+
+def make_subarray(camera, n_telescopes=4, spacing=100 * u.m):
+    """ a subarray of ``n_telescopes`` on a square grid """
+    tel_type, focal_length = _OPTICS[camera]
+    optics = OpticsDescription(
+        mirror_type='DC', tel_type=tel_type, tel_subtype='',
+        equivalent_focal_length=focal_length,
+    )
+    description = TelescopeDescription(optics, get_geometry(camera))
+
+    n_rows = int(np.ceil(np.sqrt(n_telescopes)))
+    positions = {
+        tel_id: u.Quantity([
+            (tel_id - 1) // n_rows * spacing,
+            (tel_id - 1) % n_rows * spacing,
+            0 * u.m,
+        ])
+        for tel_id in range(1, n_telescopes + 1)
+    }
+    return SubarrayDescription(
+        camera,
+        tel_positions=positions,
+        tel_descriptions={tel_id: description for tel_id in positions},
+    )
+
+
+def make_hillas_dict(subarray, rng):
+    """ hillas parameters of toy images of all telescopes in ``subarray`` """
+    hillas_dict = {}
+    for tel_id, description in subarray.tel.items():
+        geom = description.camera
+        image = make_image(geom, rng)
+        mask = tailcuts_clean(geom, image, 10, 5)
+        hillas_dict[tel_id] = hillas_parameters(geom[mask], image[mask])
+    return hillas_dict
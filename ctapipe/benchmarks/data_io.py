@@ -0,0 +1,68 @@
+"""
+Benchmarks of writing tables and seeking through events
+"""
+import os
+import tempfile
+
+import numpy as np
+
+from ctapipe.io.containers import HillasParametersContainer
+from ctapipe.io.eventseeker import EventSeeker
+from ctapipe.io.hdf5tableio import HDF5TableWriter
+from ctapipe.io.toymodel import toymodel_event_source
+from .common import CAMERAS, SEED, get_geometry
+
+
+class TableWriting:
+    params = [1, 1000]
+    param_names = ['n_rows']
+
+    def setup(self, n_rows):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, 'benchmark.h5')
+        self.containers = [
+            HillasParametersContainer(intensity=float(i)) for i in range(n_rows)
+        ]
+
+    def teardown(self, n_rows):
+        self.tempdir.cleanup()
+
+    def time_hdf5_table_writer(self, n_rows):
+        with HDF5TableWriter(self.path, group_name='dl1') as writer:
+            for container in self.containers:
+                writer.write('hillas', container)
+
+
+class _ToyModelReader:
+    """
+    The minimal interface of an `~ctapipe.io.EventSource` needed by the
+    `EventSeeker` around `toymodel_event_source`
+    """
+    is_stream = False
+
+    def __init__(self, geoms, max_events):
+        self.geoms = geoms
+        self.max_events = max_events
+
+    def __iter__(self):
+        np.random.seed(SEED)
+        return toymodel_event_source(
+            self.geoms, max_events=self.max_events, p_trigger=1.0,
+        )
+
+    def __len__(self):
+        return self.max_events
+
+
+class EventSeeking:
+    params = CAMERAS
+    param_names = ['camera']
+
+    def setup(self, camera):
+        geoms = [get_geometry(camera)] * 2
+        self.seeker = EventSeeker(_ToyModelReader(geoms, max_events=10))
+
+    def time_seek(self, camera):
+        # seeking backwards restarts the iteration from the first event
+        self.seeker[9]
+        self.seeker[0]
@@ -0,0 +1,62 @@
+"""
+Benchmarks of the image cleaning and parametrization
+"""
+import numpy as np
+
+from ctapipe.image import (
+    concentration,
+    hillas_parameters,
+    leakage,
+    tailcuts_clean,
+)
+from ctapipe.image.cleaning import number_of_islands
+from ctapipe.image.timing_parameters import timing_parameters
+from .common import CAMERAS, SEED, get_geometry, make_image
+
+
+class Cleaning:
+    params = CAMERAS
+    param_names = ['camera']
+
+    def setup(self, camera):
+        rng = np.random.RandomState(SEED)
+        self.geom = get_geometry(camera)
+        self.image = make_image(self.geom, rng)
+        self.mask = tailcuts_clean(self.geom, self.image, 10, 5)
+
+    def time_tailcuts_clean(self, camera):
+        tailcuts_clean(self.geom, self.image, 10, 5)
+
+    def time_number_of_islands(self, camera):
+        number_of_islands(self.geom, self.mask)
+
+
+class Parameters:
+    params = CAMERAS
+    param_names = ['camera']
+
+    def setup(self, camera):
+        rng = np.random.RandomState(SEED)
+        self.geom = get_geometry(camera)
+        self.image = make_image(self.geom, rng)
+        self.mask = tailcuts_clean(self.geom, self.image, 10, 5)
+        self.peakpos = rng.normal(10, 1, self.geom.n_pixels)
+
+        self.clean_geom = self.geom[self.mask]
+        self.clean_image = self.image[self.mask]
+        self.clean_peakpos = self.peakpos[self.mask]
+        self.hillas = hillas_parameters(self.clean_geom, self.clean_image)
+
+    def time_hillas_parameters(self, camera):
+        hillas_parameters(self.clean_geom, self.clean_image)
+
+    def time_leakage(self, camera):
+        leakage(self.geom, self.image, self.mask)
+
+    def time_concentration(self, camera):
+        concentration(self.clean_geom, self.clean_image, self.hillas)
+
+    def time_timing_parameters(self, camera):
+        timing_parameters(
+            self.clean_geom, self.clean_image, self.clean_peakpos, self.hillas
+        )
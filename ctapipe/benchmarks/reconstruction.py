@@ -0,0 +1,57 @@
+"""
+Benchmarks of the geometrical shower reconstruction
+"""
+from copy import deepcopy
+
+import astropy.units as u
+import numpy as np
+from astropy.coordinates import AltAz, SkyCoord
+
+from ctapipe.io.containers import InstrumentContainer
+from ctapipe.reco import HillasReconstructor
+from ctapipe.reco.hillas_intersection import HillasIntersection
+from .common import SEED, make_hillas_dict, make_subarray
+
+
+class Reconstruction:
+    # the camera does not matter after the image parametrization
+    params = [2, 4, 16]
+    param_names = ['n_telescopes']
+
+    def setup(self, n_telescopes):
+        rng = np.random.RandomState(SEED)
+        subarray = make_subarray('NectarCam', n_telescopes)
+        self.inst = InstrumentContainer()
+        self.inst.subarray = subarray
+        self.hillas_dict = make_hillas_dict(subarray, rng)
+
+        self.pointing_alt = {tel_id: 70 * u.deg for tel_id in self.hillas_dict}
+        self.pointing_az = {tel_id: 0 * u.deg for tel_id in self.hillas_dict}
+        self.hillas_reconstructor = HillasReconstructor()
+
+        # HillasIntersection expects the hillas parameters in the
+        # nominal frame
+        self.nominal_hillas_dict = {}
+        for tel_id, hillas in self.hillas_dict.items():
+            focal_length = subarray.tel[tel_id].optics.equivalent_focal_length
+            nominal = deepcopy(hillas)
+            for field in ('x', 'y', 'length', 'width'):
+                nominal[field] = (hillas[field] / focal_length) * u.rad
+            self.nominal_hillas_dict[tel_id] = nominal
+
+        self.tel_x = {t: subarray.positions[t][0] for t in self.hillas_dict}
+        self.tel_y = {t: subarray.positions[t][1] for t in self.hillas_dict}
+        self.array_direction = SkyCoord(alt=70 * u.deg, az=0 * u.deg,
+                                        frame=AltAz())
+        self.hillas_intersection = HillasIntersection()
+
+    def time_hillas_reconstructor(self, n_telescopes):
+        self.hillas_reconstructor.predict(
+            self.hillas_dict, self.inst, self.pointing_alt, self.pointing_az
+        )
+
+    def time_hillas_intersection(self, n_telescopes):
+        self.hillas_intersection.predict(
+            self.nominal_hillas_dict, self.tel_x, self.tel_y,
+            self.array_direction,
+        )
@@ -0,0 +1,131 @@
+"""
+Minimal runner of the asv style benchmarks, used by
+``python -m ctapipe.benchmarks``
+"""
+import argparse
+import importlib
+import inspect
+import itertools
+import re
+import timeit
+
+__all__ = ['BENCHMARK_MODULES', 'find_benchmarks', 'run_benchmark', 'main']
+
+BENCHMARK_MODULES = [
+    'ctapipe.benchmarks.charge_extraction',
+    'ctapipe.benchmarks.data_io',
+    'ctapipe.benchmarks.image',
+    'ctapipe.benchmarks.reconstruction',
+]
+
+
+def _parameter_sets(cls):
+    """ all combinations of the parameters of a benchmark class """
+    params = getattr(cls, 'params', None)
+    if params is None:
+        return [()]
+    # asv allows a single list of values for one parameter
+    if not params or not isinstance(params[0], (list, tuple)):
+        params = [params]
+    return list(itertools.product(*params))
+
+
+def find_benchmarks(pattern=None, modules=BENCHMARK_MODULES):
+    """
+    Find all benchmarks
+
+    Parameters
+    ----------
+    pattern: str or None
+        only return benchmarks whose name matches this regular expression
+    modules: list(str)
+        names of the modules to search
+
+    Returns
+    -------
+    benchmarks: list(tuple)
+        tuples of (name, class, method name, parameters), the name is
+        ``<module>.<class>.<method>(<parameters>)``
+    """
+    benchmarks = []
+    for module_name in modules:
+        module = importlib.import_module(module_name)
+        classes = [
+            cls for _, cls in inspect.getmembers(module, inspect.isclass)
+            if cls.__module__ == module_name and not cls.__name__.startswith('_')
+        ]
+
+        for cls in classes:
+            methods = [m for m in dir(cls) if m.startswith('time_')]
+            for method, params in itertools.product(methods, _parameter_sets(cls)):
+                name = '{}.{}.{}({})'.format(
+                    module_name.rsplit('.', 1)[-1], cls.__name__, method,
+                    ', '.join(map(str, params)),
+                )
+                if pattern is None or re.search(pattern, name):
+                    benchmarks.append((name, cls, method, params))
+
+    return benchmarks
+
+
+def run_benchmark(cls, method, params, repeat=5, number=None):
+    """
+    Time one benchmark
+
+    Parameters
+    ----------
+    repeat: int
+        number of timing repetitions, the fastest is returned
+    number: int or None
+        number of calls per repetition, if None it is chosen so that a
+        repetition takes at least 0.2 s
+
+    Returns
+    -------
+    time: float
+        the fastest time per call in seconds
+    """
+    benchmark = cls()
+    if hasattr(benchmark, 'setup'):
+        benchmark.setup(*params)
+
+    try:
+        func = getattr(benchmark, method)
+        timer = timeit.Timer(lambda: func(*params))
+        if number is None:
+            number, _ = timer.autorange()
+        return min(timer.repeat(repeat=repeat, number=number)) / number
+    finally:
+        if hasattr(benchmark, 'teardown'):
+            benchmark.teardown(*params)
+
+
+def _format_time(seconds):
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('µs', 1e-6)):
+        if seconds >= scale:
+            return f'{seconds / scale:.3g} {unit}'
+    return f'{seconds / 1e-9:.3g} ns'
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description='Run the ctapipe benchmarks without asv'
+    )
+    parser.add_argument(
+        '-f', '--filter',
+        help='only run benchmarks whose name matches this regular expression'
+    )
+    parser.add_argument(
+        '-r', '--repeat', type=int, default=5,
+        help='number of timing repetitions, the fastest is reported'
+    )
+    args = parser.parse_args(args)
+
+    for name, cls, method, params in find_benchmarks(args.filter):
+        try:
+            result = _format_time(
+                run_benchmark(cls, method, params, repeat=args.repeat)
+            )
+        except Exception as err:
+            result = f'failed: {err!r}'
+        print(f'{name:<75} {result}', flush=True)
@@ -5,6 +5,7 @@ This calibrator will apply the calibrations found in r1.py, dl0.py and dl1.py.
 """
 
 from ctapipe.core import Component
+from ctapipe.core.instrumentation import instrumented
 from ctapipe.calib.camera import (
     CameraR1Calibrator,
     CameraDL0Reducer,
@@ -107,6 +108,7 @@ class CameraCalibrator(Component):
                                        extractor=extractor,
                                        cleaner=cleaner)
 
+    @instrumented()
     def calibrate(self, event):
         """
         Perform the full camera calibration from R0 to DL1. Any calibration
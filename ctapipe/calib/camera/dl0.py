@@ -9,6 +9,7 @@ if a reducer from `ctapipe.image.reducers` is passed to the
 `CameraDL0Reducer`, then the reduction will be applied.
 """
 from ctapipe.core import Component
+from ctapipe.core.instrumentation import instrumented
 
 __all__ = ['CameraDL0Reducer']
 
@@ -70,6 +71,7 @@ class CameraDL0Reducer(Component):
                 self._r1_empty_warn = True
             return False
 
+    @instrumented()
     def reduce(self, event):
         """
         Perform the conversion from raw R1 data to dl0 data
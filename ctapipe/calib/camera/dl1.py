@@ -10,6 +10,7 @@ from `ctapipe.image.charge_extractors`.
 import numpy as np
 
 from ...core import Component
+from ...core.instrumentation import instrumented
 from ...core.traits import Float
 from ...image import NeighbourPeakIntegrator, NullWaveformCleaner
 
@@ -181,6 +182,7 @@ class CameraDL1Calibrator(Component):
             # a reference pulse shape
             return np.ones(event.dl0.tel[telid].waveform.shape[0])
 
+    @instrumented()
     def calibrate(self, event):
         """
         Fill the dl1 container with the calibration data that results from the
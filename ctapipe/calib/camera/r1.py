@@ -17,6 +17,7 @@ from abc import abstractmethod
 import numpy as np
 
 from ...core import Component
+from ...core.instrumentation import instrumented
 from ...core.traits import Unicode
 
 __all__ = [
@@ -159,6 +160,7 @@ class NullR1Calibrator(CameraR1Calibrator):
         self.log.info("Using NullR1Calibrator, if event source is at "
                       "the R0 level, then r1 samples will equal r0 samples")
 
+    @instrumented()
     def calibrate(self, event):
         for telid in event.r0.tels_with_data:
             if self.check_r0_exists(event, telid):
@@ -201,6 +203,7 @@ class HESSIOR1Calibrator(CameraR1Calibrator):
     """
     # TODO: Handle calib_scale differently per simlated telescope
 
+    @instrumented()
     def calibrate(self, event):
         if event.meta['origin'] != 'hessio':
             raise ValueError('Using HESSIOR1Calibrator to calibrate a '
@@ -298,6 +301,7 @@ class TargetIOR1Calibrator(CameraR1Calibrator):
                              "r1 samples will equal r0 samples.")
             self.calibrate = self.fake_calibrate
 
+    @instrumented('TargetIOR1Calibrator.calibrate')
     def fake_calibrate(self, event):
         """
         Don't perform any calibration on the waveforms, just fill the
@@ -315,6 +319,7 @@ class TargetIOR1Calibrator(CameraR1Calibrator):
             samples = event.r0.tel[self.telid].waveform
             event.r1.tel[self.telid].waveform = samples.astype('float32')
 
+    @instrumented('TargetIOR1Calibrator.calibrate')
     def real_calibrate(self, event):
         """
         Apply the R1 calibration defined in target_calib and fill the
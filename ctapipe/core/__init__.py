@@ -2,6 +2,7 @@
 
 from .component import Component, non_abstract_children
 from .container import Container, Field, Map
+from .instrumentation import Instrumentation
 from .provenance import Provenance
 from .tool import Tool, ToolConfigurationError
 
@@ -10,6 +11,7 @@ __all__ = [
     'Container',
     'Tool',
     'Field',
+    'Instrumentation',
     'Map',
     'Provenance',
     'ToolConfigurationError',
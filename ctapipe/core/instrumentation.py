@@ -0,0 +1,302 @@
+"""
+Opt-in timing instrumentation of the processing stages.
+
+Functions and methods decorated with `instrumented` record their number of
+calls, wall-clock and CPU time into the global `Instrumentation` once it is
+enabled, e.g. by setting ``Tool.instrument = True``. When it is disabled,
+the only overhead is the check of a global flag, so the decorators can stay
+in production code.
+"""
+import math
+import os
+import sys
+from functools import wraps
+from time import perf_counter, process_time
+
+import psutil
+
+from .support import Singleton
+
+__all__ = [
+    'Instrumentation',
+    'StageStatistics',
+    'instrumented',
+    'peak_rss',
+]
+
+# wall time histograms use log-spaced bins, from 1 µs to 1000 s
+HISTOGRAM_MIN_EXPONENT = -6
+HISTOGRAM_MAX_EXPONENT = 3
+HISTOGRAM_BINS_PER_DECADE = 4
+HISTOGRAM_N_BINS = (
+    (HISTOGRAM_MAX_EXPONENT - HISTOGRAM_MIN_EXPONENT) * HISTOGRAM_BINS_PER_DECADE
+)
+
+# module level, so that the check in `instrumented` is as cheap as possible
+_enabled = False
+
+
+def peak_rss():
+    """
+    Peak resident set size of the current process in bytes
+    """
+    try:
+        import resource
+    except ImportError:  # not available on windows
+        memory_info = psutil.Process().memory_info()
+        return getattr(memory_info, 'peak_wset', memory_info.rss)
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports kilobytes, macOS bytes
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+class StageStatistics:
+    """
+    Counters and wall time histogram of one processing stage
+
+    Attributes
+    ----------
+    name: str
+        name of the stage
+    n_calls: int
+        number of calls
+    wall_time: float
+        total wall-clock time in seconds
+    cpu_time: float
+        total CPU time of the process in seconds
+    n_bytes: int
+        number of bytes read or written by the stage, if known
+    histogram: list
+        number of calls per wall time bin, see `histogram_bin_edges`
+    """
+    __slots__ = ('name', 'n_calls', 'wall_time', 'cpu_time', 'n_bytes', 'histogram')
+
+    def __init__(self, name):
+        self.name = name
+        self.n_calls = 0
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.n_bytes = 0
+        self.histogram = [0] * HISTOGRAM_N_BINS
+
+    def add(self, wall_time, cpu_time):
+        """ record one call """
+        self.n_calls += 1
+        self.wall_time += wall_time
+        self.cpu_time += cpu_time
+
+        if wall_time > 0:
+            index = int(
+                (math.log10(wall_time) - HISTOGRAM_MIN_EXPONENT)
+                * HISTOGRAM_BINS_PER_DECADE
+            )
+        else:
+            index = 0
+        self.histogram[min(max(index, 0), HISTOGRAM_N_BINS - 1)] += 1
+
+    def merge(self, other):
+        """ add the statistics of ``other``, e.g. from another process """
+        self.n_calls += other.n_calls
+        self.wall_time += other.wall_time
+        self.cpu_time += other.cpu_time
+        self.n_bytes += other.n_bytes
+        self.histogram = [a + b for a, b in zip(self.histogram, other.histogram)]
+
+    @staticmethod
+    def histogram_bin_edges():
+        """ edges of the wall time histogram bins in seconds """
+        return [
+            10**(HISTOGRAM_MIN_EXPONENT + i / HISTOGRAM_BINS_PER_DECADE)
+            for i in range(HISTOGRAM_N_BINS + 1)
+        ]
+
+    @property
+    def calls_per_second(self):
+        return self.n_calls / self.wall_time if self.wall_time > 0 else math.nan
+
+    @property
+    def megabytes_per_second(self):
+        if self.n_bytes == 0 or self.wall_time == 0:
+            return math.nan
+        return self.n_bytes / 1e6 / self.wall_time
+
+    def as_dict(self):
+        """ statistics as json serializable dict """
+        return dict(
+            name=self.name,
+            n_calls=self.n_calls,
+            wall_time_s=self.wall_time,
+            cpu_time_s=self.cpu_time,
+            mean_wall_time_s=self.wall_time / self.n_calls if self.n_calls else None,
+            calls_per_s=self.calls_per_second if self.wall_time > 0 else None,
+            n_bytes=self.n_bytes,
+            mb_per_s=(
+                self.megabytes_per_second
+                if self.n_bytes and self.wall_time > 0 else None
+            ),
+            # only the non-empty bins, keyed by their lower edge
+            wall_time_histogram={
+                f'{edge:.3g}': count
+                for edge, count in zip(self.histogram_bin_edges(), self.histogram)
+                if count > 0
+            },
+        )
+
+
+class _StageTimer:
+    """ context manager measuring the time spent in its block """
+    __slots__ = ('instrumentation', 'name', 'wall_start', 'cpu_start')
+
+    def __init__(self, instrumentation, name):
+        self.instrumentation = instrumentation
+        self.name = name
+
+    def __enter__(self):
+        self.wall_start = perf_counter()
+        self.cpu_start = process_time()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if _enabled:
+            self.instrumentation.record(
+                self.name,
+                perf_counter() - self.wall_start,
+                process_time() - self.cpu_start,
+            )
+
+
+class Instrumentation(metaclass=Singleton):
+    """
+    Collect the timing statistics of the instrumented processing stages.
+
+    Recording is disabled by default, use `enable` to switch it on. The
+    `ctapipe.core.Tool` does this if its ``instrument`` option is set and
+    reports the `summary` at the end of the run.
+    """
+
+    def __init__(self):
+        self._stages = {}
+
+    @property
+    def enabled(self):
+        return _enabled
+
+    def enable(self):
+        """ start recording """
+        global _enabled
+        _enabled = True
+
+    def disable(self):
+        """ stop recording, already recorded statistics are kept """
+        global _enabled
+        _enabled = False
+
+    def reset(self):
+        """ remove all recorded statistics """
+        self._stages = {}
+
+    def stage(self, name):
+        """ statistics of stage ``name``, created if needed """
+        stage = self._stages.get(name)
+        if stage is None:
+            stage = self._stages[name] = StageStatistics(name)
+        return stage
+
+    @property
+    def stages(self):
+        return list(self._stages.values())
+
+    def record(self, name, wall_time, cpu_time):
+        """ record one call of stage ``name`` """
+        self.stage(name).add(wall_time, cpu_time)
+
+    def add_bytes(self, name, n_bytes):
+        """ add to the number of bytes read or written by stage ``name`` """
+        if _enabled:
+            self.stage(name).n_bytes += n_bytes
+
+    def merge(self, stages):
+        """
+        add the statistics of ``stages``, e.g. recorded in worker processes
+
+        Parameters
+        ----------
+        stages: list(StageStatistics)
+        """
+        for stage in stages:
+            self.stage(stage.name).merge(stage)
+
+    def timer(self, name):
+        """
+        context manager recording the execution of its block as a call
+        of stage ``name``
+        """
+        return _StageTimer(self, name)
+
+    def summary(self):
+        """ statistics of all stages and the peak memory usage as dict """
+        return dict(
+            stages=[stage.as_dict() for stage in self._stages.values()],
+            peak_rss_mb=peak_rss() / 1e6,
+        )
+
+    def format_summary(self):
+        """ human readable table of the statistics of all stages """
+        lines = [
+            '{:<45} {:>9} {:>11} {:>11} {:>11} {:>10}'.format(
+                'stage', 'calls', 'wall [s]', 'cpu [s]', 'calls/s', 'MB/s'
+            )
+        ]
+        stages = sorted(self._stages.values(), key=lambda s: -s.wall_time)
+        for stage in stages:
+            lines.append(
+                '{:<45} {:>9d} {:>11.3f} {:>11.3f} {:>11.1f} {:>10.1f}'.format(
+                    stage.name[:45], stage.n_calls, stage.wall_time,
+                    stage.cpu_time, stage.calls_per_second,
+                    stage.megabytes_per_second,
+                )
+            )
+        lines.append(f'peak RSS: {peak_rss() / 1e6:.1f} MB')
+        return '\n'.join(lines)
+
+
+def instrumented(name=None):
+    """
+    Decorator recording the calls of a function or method into the
+    `Instrumentation`, when it is enabled.
+
+    Parameters
+    ----------
+    name: str or None
+        name of the stage, defaults to the qualified name of the function
+    """
+    def decorator(func):
+        stage_name = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+
+            wall_start = perf_counter()
+            cpu_start = process_time()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                Instrumentation().record(
+                    stage_name,
+                    perf_counter() - wall_start,
+                    process_time() - cpu_start,
+                )
+
+        return wrapper
+    return decorator
+
+
+def file_size(path):
+    """ size of a file in bytes, 0 if it cannot be determined """
+    try:
+        return os.path.getsize(path)
+    except (OSError, TypeError):
+        return 0
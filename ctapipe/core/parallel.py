@@ -0,0 +1,218 @@
+"""
+Processing of many input files in parallel by a Tool, see the
+``input_glob`` option of `ctapipe.core.Tool`.
+"""
+import logging
+import multiprocessing
+from copy import deepcopy
+from functools import partial
+from numbers import Number
+
+from .instrumentation import Instrumentation
+from .provenance import Provenance
+
+__all__ = [
+    'process_files',
+    'merge_results',
+    'merge_hdf5_tables',
+]
+
+log = logging.getLogger(__name__)
+
+
+def _process_file(tool_class, config, path):
+    """
+    Run setup and start of a new ``tool_class`` instance on one input
+    file, in a worker process.
+
+    Returns
+    -------
+    results: dict or None
+        the values of the ``merge_attributes`` of the tool, None if the
+        processing failed
+    provenance: dict
+        the provenance of the processing of the file
+    stages: list(StageStatistics)
+        the timing statistics of the processing, empty if the tool's
+        ``instrument`` option is not set
+    """
+    config = deepcopy(config)
+    class_name, trait_name = tool_class.input_trait.split('.')
+    config[class_name][trait_name] = path
+
+    # the worker records only its own activity, the parent process
+    # adds it to the activity of the tool
+    provenance = Provenance()
+    provenance.clear()
+    provenance.stream_to(None)
+    provenance.start_activity(f'{tool_class.name}:{path}')
+
+    instrumentation = Instrumentation()
+    instrumentation.reset()
+
+    results = None
+    status = 'completed'
+    try:
+        tool = tool_class(config=config)
+        if tool.instrument:
+            instrumentation.enable()
+        tool.setup()
+        tool.start()
+        results = {name: getattr(tool, name) for name in tool.merge_attributes}
+    except Exception:
+        log.exception("Processing of '%s' failed", path)
+        status = 'error'
+    finally:
+        instrumentation.disable()
+
+    provenance.finish_activity(status=status)
+    return (
+        results,
+        provenance.finished_activities[-1].provenance,
+        instrumentation.stages,
+    )
+
+
+def process_files(tool_class, config, paths, n_jobs=1):
+    """
+    Process each of ``paths`` with a separate instance of ``tool_class``
+    in a pool of ``n_jobs`` processes and merge the results.
+
+    Each worker sets the ``tool_class.input_trait`` of ``config`` to one
+    of the files, runs `~ctapipe.core.Tool.setup` and
+    `~ctapipe.core.Tool.start` and returns the values of the attributes
+    listed in ``tool_class.merge_attributes``, which are merged with
+    `merge_results`. The provenance of each worker is added to the
+    current activity and its timing statistics to the `Instrumentation`,
+    files for which the processing failed are skipped.
+
+    The workers are started with the ``spawn`` method, so they do not
+    inherit the threads, e.g. the resource sampling of the provenance,
+    or the profiler of the calling process. ``tool_class`` must
+    therefore be importable, i.e. not be defined in a function.
+
+    Parameters
+    ----------
+    tool_class: type
+        a `~ctapipe.core.Tool` subclass defining ``input_trait`` and
+        ``merge_attributes``
+    config: traitlets.config.Config
+        the configuration of the tool
+    paths: list(str)
+        the input files
+    n_jobs: int
+        number of worker processes
+
+    Returns
+    -------
+    merged: dict
+        the merged value of each of the ``merge_attributes``
+    failed: list(str)
+        the files for which the processing failed
+    """
+    collected = {name: [] for name in tool_class.merge_attributes}
+    failed = []
+
+    worker = partial(_process_file, tool_class, config)
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(n_jobs) as pool:
+        outputs = pool.imap(worker, paths)
+        for path, (results, provenance, stages) in zip(paths, outputs):
+            Provenance().add_sub_activity(provenance)
+            Instrumentation().merge(stages)
+            if results is None:
+                failed.append(path)
+                continue
+            for name, value in results.items():
+                collected[name].append(value)
+
+    merged = {
+        name: merge_results(values)
+        for name, values in collected.items()
+        if len(values) > 0
+    }
+    return merged, failed
+
+
+def merge_results(results):
+    """
+    Merge the results of the processing of several files.
+
+    Supported are astropy tables, which are stacked, objects with a
+    ``merge`` method like `~ctapipe.utils.Histogram` and
+    `~ctapipe.analysis.camera.charge_resolution.ChargeResolutionCalculator`,
+    numbers, which are summed, lists, which are concatenated, and dicts
+    of these, which are merged per key.
+
+    Parameters
+    ----------
+    results: list
+        the results of the same type of each file, they may be modified
+
+    Returns
+    -------
+    merged
+        the combined result
+    """
+    # imported here, as ctapipe.core is imported by every module
+    from astropy.table import Table, vstack
+
+    if len(results) == 0:
+        raise ValueError('No results to merge')
+
+    first = results[0]
+    if isinstance(first, Table):
+        return vstack(results, metadata_conflicts='silent')
+
+    if hasattr(first, 'merge'):
+        for result in results[1:]:
+            first.merge(result)
+        return first
+
+    if isinstance(first, dict):
+        return {
+            key: merge_results([result[key] for result in results])
+            for key in first
+        }
+
+    if isinstance(first, list):
+        return [value for result in results for value in result]
+
+    if isinstance(first, Number):
+        return sum(results)
+
+    raise TypeError(f'Cannot merge results of type {type(first).__name__}')
+
+
+def merge_hdf5_tables(input_paths, output_path):
+    """
+    Concatenate the tables of several HDF5 files, e.g. written by
+    `~ctapipe.io.HDF5TableWriter` for different input files, into one
+    file. Tables with the same path are appended to each other, their
+    attributes are taken from the first file containing them.
+
+    Parameters
+    ----------
+    input_paths: list(str)
+        the files to merge
+    output_path: str
+        the merged file, overwritten if it exists
+    """
+    import tables
+
+    with tables.open_file(output_path, mode='w') as output:
+        for path in input_paths:
+            Provenance().add_input_file(path)
+            with tables.open_file(path, mode='r') as input_file:
+                for table in input_file.walk_nodes('/', classname='Table'):
+                    if table._v_pathname in output:
+                        output.get_node(table._v_pathname).append(table.read())
+                        continue
+
+                    parent = table._v_parent._v_pathname
+                    if parent not in output:
+                        group, name = parent.rsplit('/', 1)
+                        output.create_group(group or '/', name, createparents=True)
+                    table.copy(newparent=output.get_node(parent))
+
+    Provenance().add_output_file(output_path, role='merged')
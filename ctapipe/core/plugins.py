@@ -1,16 +1,86 @@
+"""
+Detection of ctapipe plugins.
+
+Plugins are found in two ways:
+
+* modules registered under an entry point group, e.g. a plugin package
+  declaring ``entry_points={'ctapipe_io': ['lst = ctapipe_io_lst']}`` in its
+  ``setup.py``. Reading the entry points only needs the installed package
+  metadata.
+* top-level modules named with a given prefix, e.g. ``ctapipe_io_lst``.
+  This needs a scan of all modules on ``sys.path``, which is done only once
+  per prefix and process.
+"""
 import importlib
 import pkgutil
+from functools import lru_cache
+
+__all__ = [
+    'IO_PLUGIN_GROUP',
+    'IO_PLUGIN_PREFIX',
+    'find_plugin_entry_points',
+    'detect_and_import_plugins',
+    'detect_and_import_io_plugins',
+]
+
+IO_PLUGIN_GROUP = 'ctapipe_io'
+IO_PLUGIN_PREFIX = 'ctapipe_io_'
+
+
+def find_plugin_entry_points(group):
+    """
+    Find the entry points registered for ``group`` by installed packages.
+
+    Returns
+    -------
+    dict: maps entry point names to the name of the module they point to
+    """
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:  # python < 3.8
+        from pkg_resources import iter_entry_points
+        return {ep.name: ep.module_name for ep in iter_entry_points(group)}
 
+    eps = entry_points()
+    if hasattr(eps, 'select'):
+        eps = eps.select(group=group)
+    else:
+        eps = eps.get(group, [])
 
-def detect_and_import_plugins(prefix):
-    ''' detect and import  plugin modules with given prefix, '''
-    return {
-        name: importlib.import_module(name)
+    return {ep.name: ep.value.split(':')[0] for ep in eps}
+
+
+@lru_cache(maxsize=None)
+def _find_modules_with_prefix(prefix):
+    """names of all top-level modules starting with prefix, cached"""
+    return tuple(
+        name
         for finder, name, ispkg
         in pkgutil.iter_modules()
         if name.startswith(prefix)
-    }
+    )
+
+
+def detect_and_import_plugins(prefix, group=None):
+    '''
+    detect and import plugin modules with given prefix and,
+    if given, the modules registered under the entry point group
+    '''
+    names = list(_find_modules_with_prefix(prefix))
+    if group is not None:
+        names.extend(find_plugin_entry_points(group).values())
+
+    return {name: importlib.import_module(name) for name in names}
+
+
+@lru_cache(maxsize=None)
+def _io_plugins():
+    return detect_and_import_plugins(prefix=IO_PLUGIN_PREFIX, group=IO_PLUGIN_GROUP)
 
 
 def detect_and_import_io_plugins():
-    return detect_and_import_plugins(prefix='ctapipe_io_')
+    '''
+    detect and import the io plugins, only the first call does the
+    detection
+    '''
+    return dict(_io_plugins())
@@ -0,0 +1,123 @@
+"""
+Profiling of Tools, see the ``profile`` option of `ctapipe.core.Tool`.
+"""
+import cProfile
+import inspect
+import io
+import pstats
+
+from .component import Component
+
+__all__ = ['ToolProfiler']
+
+
+def _find_component_classes(names):
+    """ map the given names to the Component subclasses with that name """
+    classes = {}
+    stack = [Component]
+    while stack:
+        cls = stack.pop()
+        if cls.__name__ in names:
+            classes[cls.__name__] = cls
+        stack.extend(cls.__subclasses__())
+    return classes
+
+
+def _class_functions(cls):
+    """ the python functions defined in the body of ``cls`` """
+    for attribute in vars(cls).values():
+        if isinstance(attribute, (staticmethod, classmethod)):
+            attribute = attribute.__func__
+        elif isinstance(attribute, property):
+            attribute = attribute.fget
+
+        if inspect.isfunction(attribute):
+            # line profile the undecorated function, e.g. of @instrumented
+            yield inspect.unwrap(attribute)
+
+
+class ToolProfiler:
+    """
+    Deterministic profile of a Tool run using `cProfile`, optionally
+    combined with a line-by-line profile of the methods of selected
+    components using the ``line_profiler`` package.
+
+    Parameters
+    ----------
+    line_components: list(str)
+        names of `Component` subclasses, e.g. ``['CameraDL1Calibrator']``,
+        whose methods are profiled line by line.
+    """
+
+    def __init__(self, line_components=()):
+        self.profiler = cProfile.Profile()
+        self.line_components = list(line_components)
+        self.line_profiler = None
+
+        if self.line_components:
+            try:
+                from line_profiler import LineProfiler
+            except ImportError:
+                raise ImportError(
+                    'Line-level profiling needs the line_profiler package'
+                )
+            self.line_profiler = LineProfiler()
+
+    def add_line_profiled_components(self):
+        """
+        Register the methods of the line profiled components, needs to be
+        called after the modules defining them were imported.
+
+        Returns
+        -------
+        missing: list(str)
+            the names of components that were not found
+        """
+        if self.line_profiler is None:
+            return []
+
+        classes = _find_component_classes(set(self.line_components))
+        for cls in classes.values():
+            for function in _class_functions(cls):
+                self.line_profiler.add_function(function)
+
+        return [name for name in self.line_components if name not in classes]
+
+    def enable(self):
+        self.profiler.enable()
+        if self.line_profiler is not None:
+            self.line_profiler.enable_by_count()
+
+    def disable(self):
+        self.profiler.disable()
+        if self.line_profiler is not None:
+            self.line_profiler.disable_by_count()
+
+    def format_stats(self, n_functions=20, sort='cumulative'):
+        """ the ``n_functions`` top functions as table """
+        stream = io.StringIO()
+        stats = pstats.Stats(self.profiler, stream=stream)
+        stats.sort_stats(sort).print_stats(n_functions)
+        return stream.getvalue()
+
+    def write(self, path):
+        """
+        Write the profile in `pstats` format to ``path``, e.g. for
+        ``snakeviz`` or ``python -m pstats``. The line profile is
+        written to ``path + '.lprof'``, readable with
+        ``python -m line_profiler``.
+
+        Returns
+        -------
+        paths: list(str)
+            all written files
+        """
+        self.profiler.dump_stats(path)
+        paths = [path]
+
+        if self.line_profiler is not None:
+            line_path = path + '.lprof'
+            self.line_profiler.dump_stats(line_path)
+            paths.append(line_path)
+
+        return paths
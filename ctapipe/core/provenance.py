@@ -5,11 +5,13 @@ TODO: have this register whenever ctapipe is loaded
 
 """
 
+import hashlib
 import json
 import logging
 import os
 import platform
 import sys
+import threading
 import uuid
 from contextlib import contextmanager
 from os.path import abspath
@@ -25,6 +27,10 @@ log = logging.getLogger(__name__)
 
 __all__ = ['Provenance']
 
+# maximum number of resource samples stored per activity, the peak and
+# mean values in the resource usage summary include all samples
+MAX_STORED_SAMPLES = 100
+
 _interesting_env_vars = [
     'CONDA_DEFAULT_ENV',
     'CONDA_PREFIX',
@@ -57,11 +63,27 @@ class Provenance(metaclass=Singleton):
     def __init__(self):
         self._activities = []  # stack of active activities
         self._finished_activities = []
+        self._log_file = None
+
+    def start_activity(self, activity_name=sys.executable,
+                       sampling_interval=None, compact=False):
+        """ push activity onto the stack
 
-    def start_activity(self, activity_name=sys.executable):
-        """ push activity onto the stack"""
-        activity = _ActivityProvenance(activity_name)
-        activity.start()
+        Parameters
+        ----------
+        activity_name: str
+            name of the activity
+        sampling_interval: float or None
+            if given, the CPU, memory, I/O and open file usage of the process
+            is sampled in a background thread every ``sampling_interval``
+            seconds until the activity is finished
+        compact: bool
+            if True, the inputs and outputs of the activity are summarized
+            per role and directory instead of being listed one by one,
+            see `_ActivityProvenance`
+        """
+        activity = _ActivityProvenance(activity_name, compact=compact)
+        activity.start(sampling_interval=sampling_interval)
         self._activities.append(activity)
         log.debug(f"started activity: {activity_name}")
 
@@ -106,6 +128,32 @@ class Provenance(metaclass=Singleton):
         """
         self.current_activity.register_config(config)
 
+    def add_instrumentation(self, summary):
+        """
+        add the timing statistics of the processing stages to the current
+        activity
+
+        Parameters
+        ----------
+        summary: dict
+            as returned by `ctapipe.core.instrumentation.Instrumentation.summary`
+        """
+        self.current_activity.register_instrumentation(summary)
+
+    def add_sub_activity(self, provenance):
+        """
+        add a finished activity, e.g. of a worker process, to the current
+        activity. Its inputs and outputs become inputs and outputs of the
+        current activity and a summary of it is stored as sub-activity.
+
+        Parameters
+        ----------
+        provenance: dict
+            the provenance of the finished activity, see
+            `_ActivityProvenance.provenance`
+        """
+        self.current_activity.register_sub_activity(provenance)
+
     def finish_activity(self, status='completed', activity_name=None):
         """ end the current activity """
         activity = self._activities.pop()
@@ -117,6 +165,24 @@ class Provenance(metaclass=Singleton):
         self._finished_activities.append(activity)
         log.debug(f"finished activity: {activity.name}")
 
+        if self._log_file is not None:
+            with open(self._log_file, 'a') as f:
+                _write_json_line(activity.provenance, f)
+
+    def stream_to(self, filename):
+        """
+        Append the provenance of each activity finished from now on to
+        ``filename``, as one line of JSON per activity. This way the
+        provenance is written as soon as it is complete and a crash
+        later in the program does not lose it.
+
+        Parameters
+        ----------
+        filename: str or None
+            the provenance log file, None to stop writing
+        """
+        self._log_file = abspath(filename) if filename else None
+
     @contextmanager
     def activity(self, name):
         """ context manager for activities """
@@ -145,6 +211,14 @@ class Provenance(metaclass=Singleton):
         may be included, e.g. `indent=4`"""
         return json.dumps(self.provenance, **kwargs)
 
+    def write_json(self, fileobj):
+        """
+        Write all finished provenance to an open text file, one line of JSON
+        per activity, without building the full JSON string in memory.
+        """
+        for activity in self._finished_activities:
+            _write_json_line(activity.provenance, fileobj)
+
     @property
     def active_activity_names(self):
         return [x.name for x in self._activities]
@@ -166,7 +240,7 @@ class _ActivityProvenance:
     not this class directly.
     """
 
-    def __init__(self, activity_name=sys.executable):
+    def __init__(self, activity_name=sys.executable, compact=False):
         self._prov = {
             'activity_name': activity_name,
             'activity_uuid': str(uuid.uuid4()),
@@ -177,14 +251,35 @@ class _ActivityProvenance:
             'output': []
         }
         self.name = activity_name
-
-    def start(self):
+        self.compact = compact
+        # in compact mode only running summaries of the entities and
+        # sub-activities are kept
+        self._entity_summaries = {'input': {}, 'output': {}}
+        self._sub_activity_summary = _SubActivitySummary()
+        self._sampler = None
+        self._usage = _ResourceUsage()
+        # only every ``_sample_stride``-th sample is stored
+        self._sample_stride = 1
+
+    def start(self, sampling_interval=None):
         """ begin recording provenance for this activity. Set's up the system
         and startup provenance data. Generally should be called at start of a
-        program."""
+        program.
+
+        Parameters
+        ----------
+        sampling_interval: float or None
+            if given, start a background thread calling
+            `sample_cpu_and_memory` every ``sampling_interval`` seconds
+        """
         self._prov['start'].update(_sample_cpu_and_memory())
+        self._usage.add(self._prov['start'])
         self._prov['system'].update(_get_system_provenance())
 
+        if sampling_interval:
+            self._sampler = _ResourceSampler(self, sampling_interval)
+            self._sampler.start()
+
     def register_input(self, url, role=None):
         """
         Add a URL of a file to the list of inputs (can be a filename or full
@@ -197,7 +292,7 @@ class _ActivityProvenance:
         role: str
             role name that this input satisfies
         """
-        self._prov['input'].append(dict(url=url, role=role))
+        self._register_entity('input', url, role)
 
     def register_output(self, url, role=None):
         """
@@ -211,15 +306,57 @@ class _ActivityProvenance:
         role: str
             role name that this output satisfies
         """
-        self._prov['output'].append(dict(url=url, role=role))
+        self._register_entity('output', url, role)
+
+    def _register_entity(self, kind, url, role):
+        if not self.compact:
+            self._prov[kind].append(dict(url=url, role=role))
+            return
+
+        directory, name = os.path.split(url)
+        summaries = self._entity_summaries[kind]
+        if (role, directory) not in summaries:
+            summaries[role, directory] = _EntitySummary(role, directory)
+        summaries[role, directory].add(name)
 
     def register_config(self, config):
         """ add a dictionary of configuration parameters to this activity"""
         self._prov['config'] = config
 
+    def register_instrumentation(self, summary):
+        """ add the timing statistics of the processing stages """
+        self._prov['instrumentation'] = summary
+
+    def register_sub_activity(self, provenance):
+        """ add the entities and a summary of a finished activity, in compact
+        mode the summaries of all sub-activities are aggregated """
+        for entity in provenance['input']:
+            self.register_input(entity['url'], role=entity['role'])
+        for entity in provenance['output']:
+            self.register_output(entity['url'], role=entity['role'])
+
+        if self.compact:
+            self._sub_activity_summary.add(provenance)
+            return
+
+        summary = {
+            key: provenance.get(key)
+            for key in ('activity_name', 'activity_uuid', 'status',
+                        'duration_min', 'resource_usage')
+        }
+        self._prov.setdefault('sub_activities', []).append(summary)
+
     def finish(self, status='completed'):
         """ record final provenance information, normally called at shutdown."""
+        if self._sampler is not None:
+            self._sampler.stop()
+            self._sampler = None
+
         self._prov['stop'].update(_sample_cpu_and_memory())
+        self._usage.add(self._prov['stop'])
+        self._prov['resource_usage'] = self._usage.summary(
+            self._prov['start'], self._prov['stop'],
+        )
 
         # record the duration (wall-clock) for this activity
         t_start = Time(self._prov['start']['time_utc'], format='isot')
@@ -229,23 +366,50 @@ class _ActivityProvenance:
 
     @property
     def output(self):
-        return self._prov.get('output', None)
+        """ the output entities, per role and directory in compact mode """
+        return self.provenance.get('output', None)
 
     @property
     def input(self):
-        return self._prov.get('input', None)
+        """ the input entities, per role and directory in compact mode """
+        return self.provenance.get('input', None)
 
-    def sample_cpu_and_memory(self):
+    def sample_cpu_and_memory(self, process=None):
         """
-        Record a snapshot of current CPU and memory information.
+        Record a snapshot of current CPU, memory, I/O and open file
+        information.
+
+        At most `MAX_STORED_SAMPLES` samples are kept, evenly spaced over
+        the activity: when the limit is reached, every second sample is
+        dropped and only every second of the following samples is stored.
         """
-        if 'samples' not in self._prov:
-            self._prov['samples'] = []
-        self._prov['samples'].append(_sample_cpu_and_memory())
+        sample = _sample_cpu_and_memory(process)
+        self._usage.add(sample)
+
+        samples = self._prov.setdefault('samples', [])
+        if (self._usage.n_samples - 2) % self._sample_stride != 0:
+            return
+        samples.append(sample)
+        if len(samples) >= MAX_STORED_SAMPLES:
+            del samples[1::2]
+            self._sample_stride *= 2
 
     @property
     def provenance(self):
-        return self._prov
+        if not self.compact:
+            return self._prov
+
+        prov = dict(self._prov)
+        for kind, summaries in self._entity_summaries.items():
+            prov[kind] = [summary.as_dict() for summary in summaries.values()]
+        if self._sub_activity_summary.n_activities > 0:
+            prov['sub_activities'] = self._sub_activity_summary.as_dict()
+        return prov
+
+
+def _write_json_line(data, fileobj):
+    json.dump(data, fileobj, separators=(',', ':'))
+    fileobj.write('\n')
 
 
 def _get_system_provenance():
@@ -291,20 +455,202 @@ def _get_env_vars():
     return envvars
 
 
-def _sample_cpu_and_memory():
-    # times = np.asarray(psutil.cpu_times(percpu=True))
-    # mem = psutil.virtual_memory()
+def _sample_cpu_and_memory(process=None):
+    """
+    Snapshot of the resource usage of the current process
+
+    Parameters
+    ----------
+    process: psutil.Process or None
+        the process to sample, created if None
+    """
+    if process is None:
+        process = psutil.Process()
+
+    with process.oneshot():
+        cpu_times = process.cpu_times()
+        memory = process.memory_info()
+
+        # not available on all platforms or may need privileges
+        try:
+            io = process.io_counters()
+            io_counters = dict(
+                read_bytes=io.read_bytes,
+                write_bytes=io.write_bytes,
+                read_count=io.read_count,
+                write_count=io.write_count,
+            )
+        except (AttributeError, psutil.Error):
+            io_counters = None
+
+        try:
+            n_open_files = len(process.open_files())
+        except psutil.Error:
+            n_open_files = None
 
     return dict(
         time_utc=Time.now().utc.isot,
-        # memory=dict(total=mem.total,
-        #             inactive=mem.inactive,
-        #             available=mem.available,
-        #             free=mem.free,
-        #             wired=mem.wired),
-        # cpu=dict(ncpu=psutil.cpu_count(),
-        #          user=list(times[:, 0]),
-        #          nice=list(times[:, 1]),
-        #          system=list(times[:, 2]),
-        #          idle=list(times[:, 3])),
+        cpu_time_user_s=cpu_times.user,
+        cpu_time_system_s=cpu_times.system,
+        memory_rss_bytes=memory.rss,
+        memory_vms_bytes=memory.vms,
+        io_counters=io_counters,
+        n_open_files=n_open_files,
     )
+
+
+class _ResourceUsage:
+    """
+    Running peak and mean values of the resource samples of an activity,
+    so they do not depend on the number of stored samples.
+    """
+
+    def __init__(self):
+        self.n_samples = 0
+        self.peak_rss = 0
+        self.sum_rss = 0
+        self.n_open_files_samples = 0
+        self.peak_open_files = None
+        self.sum_open_files = 0
+
+    def add(self, sample):
+        self.n_samples += 1
+        self.peak_rss = max(self.peak_rss, sample['memory_rss_bytes'])
+        self.sum_rss += sample['memory_rss_bytes']
+
+        n_open_files = sample['n_open_files']
+        if n_open_files is not None:
+            self.n_open_files_samples += 1
+            self.sum_open_files += n_open_files
+            self.peak_open_files = max(self.peak_open_files or 0, n_open_files)
+
+    def summary(self, first, last):
+        """
+        Peak and mean values of all samples and the CPU time and I/O
+        between the ``first`` and ``last`` sample
+        """
+        duration = (
+            Time(last['time_utc'], format='isot')
+            - Time(first['time_utc'], format='isot')
+        ).to_value('s')
+        cpu_time = (
+            last['cpu_time_user_s'] + last['cpu_time_system_s']
+            - first['cpu_time_user_s'] - first['cpu_time_system_s']
+        )
+
+        n_files = self.n_open_files_samples
+        summary = dict(
+            n_samples=self.n_samples,
+            peak_rss_bytes=self.peak_rss,
+            mean_rss_bytes=self.sum_rss / self.n_samples,
+            cpu_time_s=cpu_time,
+            mean_cpu_percent=100 * cpu_time / duration if duration > 0 else None,
+            peak_open_files=self.peak_open_files,
+            mean_open_files=self.sum_open_files / n_files if n_files else None,
+        )
+
+        if first['io_counters'] is not None and last['io_counters'] is not None:
+            summary['io_read_bytes'] = (
+                last['io_counters']['read_bytes'] - first['io_counters']['read_bytes']
+            )
+            summary['io_write_bytes'] = (
+                last['io_counters']['write_bytes'] - first['io_counters']['write_bytes']
+            )
+
+        return summary
+
+
+class _EntitySummary:
+    """
+    Summary of the input or output entities of one role and directory:
+    the number of files, the first and last file name and a sha1 digest
+    of all file names, which identifies the full list.
+    """
+
+    def __init__(self, role, directory):
+        self.role = role
+        self.directory = directory
+        self.n_files = 0
+        self.first = None
+        self.last = None
+        self._digest = hashlib.sha1()
+
+    def add(self, name):
+        self.n_files += 1
+        if self.first is None:
+            self.first = name
+        self.last = name
+        self._digest.update(name.encode())
+        self._digest.update(b'\0')
+
+    def as_dict(self):
+        return dict(
+            role=self.role,
+            directory=self.directory,
+            n_files=self.n_files,
+            first=self.first,
+            last=self.last,
+            sha1=self._digest.hexdigest(),
+        )
+
+
+class _SubActivitySummary:
+    """
+    Aggregate of the finished sub-activities of an activity: the number of
+    activities per status, their summed duration and CPU time and the
+    peak memory of all of them.
+    """
+
+    def __init__(self):
+        self.n_activities = 0
+        self.n_status = {}
+        self.duration_min = 0.0
+        self.cpu_time_s = 0.0
+        self.peak_rss_bytes = 0
+
+    def add(self, provenance):
+        self.n_activities += 1
+        status = provenance.get('status')
+        self.n_status[status] = self.n_status.get(status, 0) + 1
+        self.duration_min += provenance.get('duration_min') or 0.0
+
+        usage = provenance.get('resource_usage') or {}
+        self.cpu_time_s += usage.get('cpu_time_s') or 0.0
+        self.peak_rss_bytes = max(
+            self.peak_rss_bytes, usage.get('peak_rss_bytes') or 0
+        )
+
+    def as_dict(self):
+        return dict(
+            n_activities=self.n_activities,
+            n_status=dict(self.n_status),
+            duration_min=self.duration_min,
+            cpu_time_s=self.cpu_time_s,
+            peak_rss_bytes=self.peak_rss_bytes,
+        )
+
+
+class _ResourceSampler(threading.Thread):
+    """
+    Daemon thread calling `_ActivityProvenance.sample_cpu_and_memory`
+    every ``interval`` seconds until `stop` is called.
+    """
+
+    def __init__(self, activity, interval):
+        super().__init__(
+            name=f'ResourceSampler({activity.name})',
+            daemon=True,
+        )
+        self.activity = activity
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._process = psutil.Process()
+
+    def run(self):
+        # Event.wait returns True once stop was called
+        while not self._stopped.wait(self.interval):
+            self.activity.sample_cpu_and_memory(self._process)
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
@@ -0,0 +1,129 @@
+import json
+import os
+from time import sleep
+
+import pytest
+
+from ..instrumentation import Instrumentation, StageStatistics, instrumented
+
+
+@pytest.fixture
+def instrumentation():
+    instrumentation = Instrumentation()
+    instrumentation.reset()
+    instrumentation.enable()
+    yield instrumentation
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_stage_statistics():
+    stage = StageStatistics('test')
+    stage.add(2e-3, 1e-3)
+    stage.add(3e-3, 1e-3)
+    stage.add(0.0, 0.0)
+    stage.n_bytes = 10**7
+
+    assert stage.n_calls == 3
+    assert stage.wall_time == pytest.approx(5e-3)
+    assert stage.cpu_time == pytest.approx(2e-3)
+    assert sum(stage.histogram) == 3
+    assert stage.megabytes_per_second == pytest.approx(2000)
+
+    # 2 ms and 3 ms end up in the bin starting at 1.78 ms
+    edges = stage.histogram_bin_edges()
+    assert edges[0] == pytest.approx(1e-6)
+    assert stage.as_dict()['wall_time_histogram'] == {'1e-06': 1, '0.00178': 2}
+
+    # must be serializable for the provenance
+    json.dumps(stage.as_dict())
+
+
+def test_instrumented(instrumentation):
+
+    @instrumented()
+    def sleeper(seconds):
+        sleep(seconds)
+        return seconds
+
+    class Stage:
+        @instrumented()
+        def process(self):
+            return 42
+
+    for _ in range(2):
+        assert sleeper(0.01) == 0.01
+    assert Stage().process() == 42
+
+    stage = instrumentation.stage(sleeper.__qualname__)
+    assert stage.n_calls == 2
+    assert stage.wall_time >= 0.02
+    # sleeping uses no cpu
+    assert stage.cpu_time < stage.wall_time
+
+    # the stage name defaults to the qualified name
+    assert instrumentation.stage(Stage.process.__qualname__).n_calls == 1
+
+    summary = instrumentation.summary()
+    assert len(summary['stages']) == 2
+    assert summary['peak_rss_mb'] > 0
+    assert 'sleeper' in instrumentation.format_summary()
+
+
+def test_instrumented_exception(instrumentation):
+
+    @instrumented('failing')
+    def failing():
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        failing()
+    assert instrumentation.stage('failing').n_calls == 1
+
+
+def test_disabled():
+    instrumentation = Instrumentation()
+    instrumentation.reset()
+    assert not instrumentation.enabled
+
+    @instrumented('disabled')
+    def func():
+        return 1
+
+    with instrumentation.timer('timer'):
+        func()
+    instrumentation.add_bytes('disabled', 100)
+
+    assert instrumentation.stages == []
+
+
+def test_timer(instrumentation):
+    with instrumentation.timer('block'):
+        sleep(0.01)
+    instrumentation.add_bytes('block', 10**6)
+
+    stage = instrumentation.stage('block')
+    assert stage.n_calls == 1
+    assert stage.wall_time >= 0.01
+    assert stage.n_bytes == 10**6
+
+
+def test_event_source(instrumentation):
+    from ctapipe.io import event_source
+    from ctapipe.utils import get_dataset_path
+
+    path = get_dataset_path('gamma_test_large.simtel.gz')
+    with event_source(path, max_events=3) as source:
+        n_events = sum(1 for _ in source)
+
+    stage = instrumentation.stage('SimTelEventSource.read')
+    assert stage.n_calls == n_events == 3
+    # the file was not read to the end
+    assert stage.n_bytes == 0
+
+    path = get_dataset_path('gamma_test.simtel.gz')
+    with event_source(path) as source:
+        for _ in source:
+            pass
+
+    assert stage.n_bytes == os.path.getsize(path)
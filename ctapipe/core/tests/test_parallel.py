@@ -0,0 +1,156 @@
+import numpy as np
+import pytest
+import tables
+from astropy.table import Table
+from traitlets import Unicode
+
+from ctapipe.core import Provenance, Tool
+from ctapipe.core.instrumentation import instrumented
+from ctapipe.core.parallel import merge_hdf5_tables, merge_results
+from ctapipe.utils import Histogram
+
+
+class NumberTool(Tool):
+    """ sums and histograms the numbers in a text file """
+    name = 'number_tool'
+    description = 'test'
+    input_trait = 'NumberTool.infile'
+    merge_attributes = ['table', 'histogram', 'total']
+
+    infile = Unicode('').tag(config=True)
+
+    def setup(self):
+        self.histogram = Histogram(nbins=[10], ranges=[[0, 10]])
+        self.total = 0
+
+    @instrumented()
+    def start(self):
+        Provenance().add_input_file(self.infile, role='numbers')
+        numbers = np.loadtxt(self.infile, ndmin=1)
+        self.table = Table({'number': numbers})
+        self.histogram.fill(numbers)
+        self.total = numbers.sum()
+
+    def finish(self):
+        self.log.info("Sum of all numbers: %s", self.total)
+
+
+def write_numbers(tmpdir, n_files):
+    numbers = []
+    for i in range(n_files):
+        values = np.arange(i, i + 3, dtype=float)
+        np.savetxt(str(tmpdir.join(f'numbers_{i:02d}.txt')), values)
+        numbers.append(values)
+    return np.concatenate(numbers)
+
+
+def test_merge_results():
+    hist1 = Histogram(nbins=[2], ranges=[[0, 2]])
+    hist1.fill([0.5])
+    hist2 = Histogram(nbins=[2], ranges=[[0, 2]])
+    hist2.fill([1.5])
+
+    merged = merge_results([
+        dict(table=Table({'a': [1, 2]}), n=2, hist=hist1, ids=[1]),
+        dict(table=Table({'a': [3]}), n=1, hist=hist2, ids=[2, 3]),
+    ])
+    assert list(merged['table']['a']) == [1, 2, 3]
+    assert merged['n'] == 3
+    assert list(merged['hist'].data) == [1, 1]
+    assert merged['ids'] == [1, 2, 3]
+
+    with pytest.raises(TypeError):
+        merge_results([object(), object()])
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_tool_input_files(tmpdir, n_jobs):
+    numbers = write_numbers(tmpdir, n_files=5)
+    tmpdir.join('numbers_broken.txt').write('not a number')
+
+    tool = NumberTool()
+    tool.run([
+        f'--Tool.input_glob={tmpdir}/numbers_*.txt',
+        f'--Tool.n_jobs={n_jobs}',
+    ])
+
+    assert np.all(np.sort(tool.table['number']) == np.sort(numbers))
+    assert tool.total == numbers.sum()
+    assert tool.histogram.data.sum() == len(numbers)
+
+    provenance = Provenance().provenance[-1]
+    assert provenance['activity_name'] == 'number_tool'
+    inputs = [entity['url'] for entity in provenance['input']]
+    assert len(inputs) == 6
+    statuses = [sub['status'] for sub in provenance['sub_activities']]
+    assert sorted(statuses) == ['completed'] * 5 + ['error']
+    Provenance().clear()
+
+
+def test_merge_hdf5_tables(tmpdir):
+    paths = []
+    for i in range(3):
+        path = str(tmpdir.join(f'input_{i}.h5'))
+        with tables.open_file(path, 'w') as f:
+            rows = np.array([(i,), (i + 1,)], dtype=[('x', 'f8')])
+            table = f.create_table(
+                '/dl1/events', 'tel_001', rows, createparents=True,
+            )
+            table.attrs['CTAPIPE_VERSION'] = 'test'
+        paths.append(path)
+
+    output = str(tmpdir.join('merged.h5'))
+    merge_hdf5_tables(paths, output)
+
+    with tables.open_file(output) as f:
+        table = f.get_node('/dl1/events/tel_001')
+        assert list(table.col('x')) == [0, 1, 1, 2, 2, 3]
+        assert table.attrs['CTAPIPE_VERSION'] == 'test'
+
+
+def test_tool_input_glob_instrument(tmpdir):
+    """ the timing statistics of the workers are collected """
+    write_numbers(tmpdir, n_files=3)
+
+    tool = NumberTool()
+    tool.run([
+        f'--Tool.input_glob={tmpdir}/numbers_*.txt',
+        '--Tool.n_jobs=2',
+        '--instrument',
+    ])
+
+    activity = Provenance().provenance[-1]
+    stages = {s['name']: s for s in activity['instrumentation']['stages']}
+    assert stages['NumberTool.start']['n_calls'] == 3
+    Provenance().clear()
+
+
+def test_tool_input_glob_profile(tmpdir):
+    """ profiling only the waiting parent process is refused """
+    write_numbers(tmpdir, n_files=2)
+
+    tool = NumberTool()
+    tool.run([
+        f'--Tool.input_glob={tmpdir}/numbers_*.txt',
+        '--profile',
+        f'--NumberTool.profile_output={tmpdir}/number_tool.prof',
+    ])
+
+    assert not hasattr(tool, 'table')
+    assert not tmpdir.join('number_tool.prof').exists()
+    Provenance().clear()
+
+
+def test_tool_input_glob_all_failed(tmpdir):
+    """ the tool stops with an error if no file could be processed """
+    for i in range(2):
+        tmpdir.join(f'numbers_{i}.txt').write('not a number')
+
+    tool = NumberTool()
+    tool.run([f'--Tool.input_glob={tmpdir}/numbers_*.txt', '--Tool.n_jobs=2'])
+
+    activity = Provenance().provenance[-1]
+    assert activity['status'] == 'error'
+    assert [sub['status'] for sub in activity['sub_activities']] == ['error'] * 2
+    assert not hasattr(tool, 'table')
+    Provenance().clear()
@@ -0,0 +1,29 @@
+import sys
+
+from ctapipe.core import plugins
+
+
+def test_detect_and_import_plugins(tmp_path, monkeypatch):
+    (tmp_path / 'ctapipe_test_plugin_foo.py').write_text('answer = 42\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    found = plugins.detect_and_import_plugins(prefix='ctapipe_test_plugin_')
+    assert list(found) == ['ctapipe_test_plugin_foo']
+    assert found['ctapipe_test_plugin_foo'].answer == 42
+
+    # the scan of sys.path is only done once per prefix
+    (tmp_path / 'ctapipe_test_plugin_bar.py').write_text('answer = 43\n')
+    found = plugins.detect_and_import_plugins(prefix='ctapipe_test_plugin_')
+    assert list(found) == ['ctapipe_test_plugin_foo']
+
+    del sys.modules['ctapipe_test_plugin_foo']
+
+
+def test_detect_io_plugins_cached():
+    first = plugins.detect_and_import_io_plugins()
+    assert plugins.detect_and_import_io_plugins() == first
+    assert plugins._io_plugins.cache_info().hits >= 1
+
+
+def test_find_plugin_entry_points():
+    assert plugins.find_plugin_entry_points('ctapipe_no_such_group') == {}
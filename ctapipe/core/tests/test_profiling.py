@@ -0,0 +1,47 @@
+import pytest
+
+from .. import Component
+from ..profiling import ToolProfiler, _class_functions, _find_component_classes
+
+
+class ProfiledComponent(Component):
+
+    def process(self, n):
+        return sum(range(n))
+
+    @staticmethod
+    def helper():
+        return 1
+
+
+def test_find_component_classes():
+    classes = _find_component_classes({'ProfiledComponent', 'DoesNotExist'})
+    assert classes == {'ProfiledComponent': ProfiledComponent}
+
+    names = {f.__name__ for f in _class_functions(ProfiledComponent)}
+    assert names == {'process', 'helper'}
+
+
+def test_tool_profiler(tmpdir):
+    profiler = ToolProfiler()
+    profiler.enable()
+    ProfiledComponent().process(100)
+    profiler.disable()
+
+    assert 'process' in profiler.format_stats(n_functions=None)
+
+    path = str(tmpdir.join('test.prof'))
+    assert profiler.write(path) == [path]
+
+
+def test_line_profiler(tmpdir):
+    pytest.importorskip('line_profiler')
+
+    profiler = ToolProfiler(['ProfiledComponent', 'DoesNotExist'])
+    assert profiler.add_line_profiled_components() == ['DoesNotExist']
+    profiler.enable()
+    ProfiledComponent().process(100)
+    profiler.disable()
+
+    path = str(tmpdir.join('test.prof'))
+    assert profiler.write(path) == [path, path + '.lprof']
@@ -1,4 +1,8 @@
+import io
 import json
+import os
+import threading
+from time import sleep
 
 from ctapipe.core import Provenance
 from ctapipe.core.provenance import _ActivityProvenance
@@ -41,6 +45,80 @@ def test_provenence_contextmanager():
     assert 'myactivity' not in prov.active_activity_names
 
 
+def test_resource_sampling():
+    prov = Provenance()
+    prov.start_activity("sampled", sampling_interval=0.01)
+    data = [bytearray(10**7)]
+    sleep(0.1)
+    del data
+    prov.finish_activity("sampled")
+
+    activity = prov.provenance[-1]
+    assert activity['activity_name'] == 'sampled'
+    assert len(activity['samples']) >= 2
+    sample = activity['samples'][0]
+    assert sample['memory_rss_bytes'] > 0
+    assert sample['cpu_time_user_s'] >= 0
+
+    usage = activity['resource_usage']
+    assert usage['n_samples'] == len(activity['samples']) + 2
+    assert usage['peak_rss_bytes'] >= usage['mean_rss_bytes'] > 0
+    assert usage['cpu_time_s'] >= 0
+
+    # no thread must be left running
+    assert not any(
+        t.name.startswith('ResourceSampler') for t in threading.enumerate()
+    )
+    json.dumps(activity)
+
+
+def test_compact_provenance():
+    prov = Provenance()
+    prov.start_activity("compact", compact=True)
+    for i in range(1000):
+        prov.add_input_file(f"/data/run_{i:04d}.simtel.gz", role="dl0")
+    prov.add_output_file("/out/merged.h5", role="dl1")
+    prov.finish_activity("compact")
+
+    activity = prov.provenance[-1]
+    assert activity['input'] == [dict(
+        role='dl0',
+        directory=os.path.abspath('/data'),
+        n_files=1000,
+        first='run_0000.simtel.gz',
+        last='run_0999.simtel.gz',
+        sha1=activity['input'][0]['sha1'],
+    )]
+    assert activity['output'][0]['n_files'] == 1
+    # the full list is not kept in memory
+    assert prov.finished_activities[-1].input == activity['input']
+    assert prov.finished_activities[-1]._prov['input'] == []
+
+
+def test_provenance_stream(tmpdir):
+    log_file = str(tmpdir.join('provenance.jsonl'))
+
+    prov = Provenance()
+    prov.stream_to(log_file)
+    try:
+        for name in ('stream1', 'stream2'):
+            with prov.activity(name):
+                prov.add_input_file('input.txt')
+    finally:
+        prov.stream_to(None)
+
+    with open(log_file) as f:
+        activities = [json.loads(line) for line in f]
+
+    assert [a['activity_name'] for a in activities] == ['stream1', 'stream2']
+
+    buffer = io.StringIO()
+    prov.write_json(buffer)
+    lines = buffer.getvalue().splitlines()
+    assert len(lines) == len(prov.finished_activities)
+    assert json.loads(lines[-1])['activity_name'] == 'stream2'
+
+
 if __name__ == '__main__':
 
     import logging
@@ -48,3 +126,60 @@ if __name__ == '__main__':
 
     prov = test_Provenance()
     print(json.dumps(prov.provenance, indent=4))
+
+
+def test_sub_activity():
+    worker = _ActivityProvenance('worker')
+    worker.start()
+    worker.register_input('/data/run1.simtel.gz', role='dl0.sub.evt')
+    worker.register_output('/out/run1.h5', role='dl1')
+    worker.finish()
+
+    prov = Provenance()
+    prov.start_activity('merge')
+    prov.add_sub_activity(worker.provenance)
+    prov.finish_activity('merge')
+
+    merged = prov.provenance[-1]
+    assert merged['input'] == [dict(url='/data/run1.simtel.gz', role='dl0.sub.evt')]
+    assert merged['output'] == [dict(url='/out/run1.h5', role='dl1')]
+    sub_activity, = merged['sub_activities']
+    assert sub_activity['activity_name'] == 'worker'
+    assert sub_activity['status'] == 'completed'
+    assert 'system' not in sub_activity
+
+
+def test_sub_activity_compact():
+    prov = Provenance()
+    prov.start_activity('merge', compact=True)
+    for i in range(100):
+        worker = _ActivityProvenance(f'worker_{i}')
+        worker.start()
+        worker.register_input(f'/data/run{i}.simtel.gz', role='dl0.sub.evt')
+        worker.finish(status='error' if i % 10 == 0 else 'completed')
+        prov.add_sub_activity(worker.provenance)
+    prov.finish_activity('merge')
+
+    merged = prov.provenance[-1]
+    assert merged['input'][0]['n_files'] == 100
+    summary = merged['sub_activities']
+    assert summary['n_activities'] == 100
+    assert summary['n_status'] == {'completed': 90, 'error': 10}
+    assert summary['peak_rss_bytes'] > 0
+    assert summary['duration_min'] >= 0
+    json.dumps(merged)
+
+
+def test_stored_samples_bounded():
+    from ctapipe.core.provenance import MAX_STORED_SAMPLES
+
+    activity = _ActivityProvenance('long')
+    activity.start()
+    n_samples = 3 * MAX_STORED_SAMPLES
+    for _ in range(n_samples):
+        activity.sample_cpu_and_memory()
+    activity.finish()
+
+    prov = activity.provenance
+    assert MAX_STORED_SAMPLES // 2 <= len(prov['samples']) < MAX_STORED_SAMPLES
+    assert prov['resource_usage']['n_samples'] == n_samples + 2
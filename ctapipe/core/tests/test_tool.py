@@ -1,7 +1,7 @@
 import pytest
 from traitlets import Float, TraitError
 
-from .. import Tool
+from .. import Tool, ToolConfigurationError
 
 
 def test_tool_simple():
@@ -31,3 +31,125 @@ def test_tool_version():
 
     tool = MyTool()
     assert tool.version_string != ""
+
+
+def test_tool_instrument():
+    """ the stage timing is stored in the provenance with --instrument """
+    from .. import Provenance
+    from ..instrumentation import instrumented
+
+    @instrumented('test_stage')
+    def stage():
+        pass
+
+    class MyTool(Tool):
+        name = "instrumented_tool"
+        description = "test"
+
+        def start(self):
+            for _ in range(3):
+                stage()
+
+    tool = MyTool()
+    tool.run(['--instrument'])
+    assert tool.instrument
+
+    activity = Provenance().provenance[-1]
+    assert activity['activity_name'] == 'instrumented_tool'
+    stages = {s['name']: s for s in activity['instrumentation']['stages']}
+    assert stages['test_stage']['n_calls'] == 3
+    assert activity['instrumentation']['peak_rss_mb'] > 0
+
+
+def test_tool_provenance_log(tmpdir):
+    """ the provenance is appended to the provenance log """
+    import json
+
+    class MyTool(Tool):
+        name = "logged_tool"
+        description = "test"
+
+    log_file = str(tmpdir.join('provenance.jsonl'))
+    tool = MyTool()
+    tool.run([f'--MyTool.provenance_log={log_file}'])
+    tool.run([f'--MyTool.provenance_log={log_file}'])
+
+    with open(log_file) as f:
+        activities = [json.loads(line) for line in f]
+    assert [a['activity_name'] for a in activities] == ['logged_tool'] * 2
+
+
+def test_tool_profile(tmpdir):
+    """ the profile is written and recorded in the provenance """
+    import pstats
+    from .. import Provenance
+
+    def expensive_function():
+        return sum(range(1000))
+
+    class MyTool(Tool):
+        name = "profiled_tool"
+        description = "test"
+
+        def start(self):
+            expensive_function()
+
+    profile_output = str(tmpdir.join('tool.prof'))
+    tool = MyTool()
+    tool.run(['--profile', f'--MyTool.profile_output={profile_output}'])
+
+    stats = pstats.Stats(profile_output)
+    functions = {name for _, _, name in stats.stats}
+    assert 'expensive_function' in functions
+
+    outputs = Provenance().provenance[-1]['output']
+    assert outputs == [dict(url=profile_output, role='profile')]
+
+
+@pytest.mark.parametrize('error', [ToolConfigurationError, ValueError])
+def test_tool_error_finishes_activity(error):
+    """ a failing tool leaves no activity or sampling thread behind """
+    import threading
+    from .. import Provenance
+
+    class FailingTool(Tool):
+        name = "failing_tool"
+        description = "test"
+
+        def setup(self):
+            raise error('setup failed')
+
+    tool = FailingTool()
+    if error is ToolConfigurationError:
+        tool.run(['--FailingTool.provenance_sampling_interval=0.01'])
+    else:
+        with pytest.raises(ValueError):
+            tool.run(['--FailingTool.provenance_sampling_interval=0.01'])
+
+    assert 'failing_tool' not in Provenance().active_activity_names
+    assert Provenance().provenance[-1]['status'] == 'error'
+    assert not any(
+        t.name.startswith('ResourceSampler') for t in threading.enumerate()
+    )
+
+
+def test_tool_compact_provenance(capsys):
+    """ in compact mode the number of output files is logged """
+    from .. import Provenance
+
+    class WritingTool(Tool):
+        name = "writing_tool"
+        description = "test"
+
+        def start(self):
+            for i in range(100):
+                Provenance().add_output_file(f'/out/file_{i:03d}.h5', role='dl1')
+
+    tool = WritingTool()
+    tool.run(['--WritingTool.compact_provenance=True'])
+
+    outputs = Provenance().provenance[-1]['output']
+    assert [output['n_files'] for output in outputs] == [100]
+    log = capsys.readouterr().err
+    assert 'file_050.h5' not in log
+    assert '100 files in' in log
@@ -1,11 +1,15 @@
 import logging
 from abc import abstractmethod
+from glob import glob
 
-from traitlets import Unicode
+from traitlets import Bool, Float, Int, List, Unicode
 from traitlets.config import Application
 
 from ctapipe import __version__ as version
+from .instrumentation import Instrumentation
 from .logging import ColoredFormatter
+from .parallel import process_files
+from .profiling import ToolProfiler
 from . import Provenance
 
 logging.basicConfig(level=logging.WARNING)
@@ -98,12 +102,88 @@ class Tool(Application):
     *entry_points*, it will become a command-line tool (see examples
     in the `ctapipe/tools` subdirectory).
 
+    Tools processing one input file can support running on many files
+    in parallel with the ``input_glob`` option by defining the
+    `input_trait` and `merge_attributes` class attributes. Each file is
+    then processed by `setup()` and `start()` of a separate instance in
+    a worker process, the `merge_attributes` of all instances are
+    merged with `ctapipe.core.parallel.merge_results` and set on the
+    tool, before `finish()` is called. `finish()` must therefore only
+    rely on the `merge_attributes` and the configuration.
+
+    .. code:: python
+
+        class MyTool(Tool):
+            input_trait = 'EventSource.input_url'
+            merge_attributes = ['table', 'histogram']
+
     """
 
+    #: the configurable trait taking the input file, e.g.
+    #: ``'SimTelEventSource.input_url'``, None if ``input_glob``
+    #: is not supported
+    input_trait = None
+
+    #: the attributes holding the results of processing one input file
+    merge_attributes = []
+
     config_file = Unicode('', help=("name of a configuration file with "
                                      "parameters to load in addition to "
                                      "command-line parameters")).tag(config=True)
 
+    instrument = Bool(False, help=("record the number of calls and the time "
+                                   "spent in each processing stage, report "
+                                   "them at the end of the run and store them "
+                                   "in the provenance")).tag(config=True)
+
+    profile = Bool(
+        False,
+        help=("profile setup, start and finish with cProfile, the profile "
+              "is written to `profile_output` and recorded in the provenance")
+    ).tag(config=True)
+
+    profile_output = Unicode(
+        '',
+        help="pstats output file of the profile, defaults to <tool name>.prof"
+    ).tag(config=True)
+
+    profile_components = List(
+        Unicode(),
+        help=("names of components, e.g. CameraDL1Calibrator, whose methods "
+              "are additionally profiled line by line, needs line_profiler")
+    ).tag(config=True)
+
+    provenance_log = Unicode(
+        '',
+        help=("file to which the provenance of each finished activity is "
+              "appended as one line of JSON")
+    ).tag(config=True)
+
+    compact_provenance = Bool(
+        False,
+        help=("summarize the input and output files per role and directory "
+              "and the sub-activities of input_glob in the provenance instead "
+              "of listing each of them, useful for tools processing thousands "
+              "of files")
+    ).tag(config=True)
+
+    provenance_sampling_interval = Float(
+        5.0,
+        help=("interval in seconds at which the CPU, memory, I/O and open "
+              "file usage is sampled into the provenance, 0 to disable")
+    ).tag(config=True)
+
+    input_glob = Unicode(
+        '',
+        help=("glob pattern of input files, each of which is processed by "
+              "setup and start of the tool in a separate process, the results "
+              "are merged before finish")
+    ).tag(config=True)
+
+    n_jobs = Int(
+        1, help="number of processes used to process the files of input_glob"
+    ).tag(config=True)
+
     _log_formatter_cls = ColoredFormatter
 
     def __init__(self, **kwargs):
@@ -111,12 +191,24 @@ class Tool(Application):
         if self.aliases:
             self.aliases['log-level'] = 'Application.log_level'
             self.aliases['config'] = 'Tool.config_file'
+            if self.input_trait is not None:
+                self.aliases['input-glob'] = 'Tool.input_glob'
+                self.aliases['n-jobs'] = 'Tool.n_jobs'
+        self.flags['instrument'] = (
+            {'Tool': {'instrument': True}},
+            'record and report the time spent in each processing stage',
+        )
+        self.flags['profile'] = (
+            {'Tool': {'profile': True}},
+            'profile the tool with cProfile',
+        )
 
         super().__init__(**kwargs)
         self.log_format = ('%(levelname)8s [%(name)s] '
                            '(%(module)s/%(funcName)s): %(message)s')
         self.log_level = logging.INFO
         self.is_setup = False
+        self._profiler = None
 
     def initialize(self, argv=None):
         """ handle config and any other low-level setup """
@@ -159,33 +251,157 @@ class Tool(Application):
         try:
             self.initialize(argv)
             self.log.info(f"Starting: {self.name}")
-            self.log.debug(f"CONFIG: {self.config}")
-            Provenance().start_activity(self.name)
+            self.log.debug("CONFIG: %s", self.config)
+            if self.profile:
+                if self.input_glob:
+                    # the work is done in the worker processes, the profile
+                    # would only show the waiting for them
+                    raise ToolConfigurationError(
+                        "Profiling is not supported together with input_glob"
+                    )
+                self._create_profiler()
+            if self.provenance_log:
+                Provenance().stream_to(self.provenance_log)
+            Provenance().start_activity(
+                self.name,
+                sampling_interval=self.provenance_sampling_interval,
+                compact=self.compact_provenance,
+            )
             Provenance().add_config(self.config)
-            self.setup()
-            self.is_setup = True
-            self.start()
+            if self.instrument:
+                Instrumentation().reset()
+                Instrumentation().enable()
+            if self._profiler is not None:
+                self._profiler.enable()
+            if self.input_glob:
+                self._process_input_glob()
+            else:
+                self.setup()
+                self.is_setup = True
+                if self._profiler is not None:
+                    self._add_line_profiled_components()
+                self.start()
             self.finish()
             self.log.info(f"Finished: {self.name}")
-            Provenance().finish_activity(activity_name=self.name)
+            self._finish_activity()
         except ToolConfigurationError as err:
             self.log.error(f'{err}.  Use --help for more info')
         except RuntimeError as err:
             self.log.error(f'Caught unexpected exception: {err}')
             self.finish()
-            Provenance().finish_activity(activity_name=self.name,
-                                         status='error')
+            self._finish_activity(status='error')
         except KeyboardInterrupt:
             self.log.warning("WAS INTERRUPTED BY CTRL-C")
             self.finish()
-            Provenance().finish_activity(activity_name=self.name,
-                                         status='interrupted')
+            self._finish_activity(status='interrupted')
         finally:
+            # e.g. after a ToolConfigurationError or an unexpected exception,
+            # finishing the activity also stops its resource sampling thread
+            if self.name in Provenance().active_activity_names:
+                self._finish_failed_activity()
+            if self._profiler is not None:
+                self._profiler.disable()
+                self._profiler = None
+            if self.instrument:
+                Instrumentation().disable()
+            if self.provenance_log:
+                Provenance().stream_to(None)
             for activity in Provenance().finished_activities:
-                output_str = ' '.join([x['url'] for x in activity.output])
+                if activity.compact:
+                    output_str = ', '.join(
+                        f"{x['n_files']} files in {x['directory']}"
+                        for x in activity.output
+                    )
+                else:
+                    output_str = ' '.join([x['url'] for x in activity.output])
                 self.log.info("Output: %s", output_str)
 
-            self.log.debug("PROVENANCE: '%s'", Provenance().as_json(indent=3))
+            # formatting the provenance is expensive for many activities
+            if self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug("PROVENANCE: '%s'", Provenance().as_json(indent=3))
+
+    def _process_input_glob(self):
+        """ process each file matching `input_glob` in a worker process and set
+        the merged results as attributes """
+        if self.input_trait is None:
+            raise ToolConfigurationError(
+                f"{self.name} does not support processing multiple input files"
+            )
+
+        paths = sorted(glob(self.input_glob))
+        if not paths:
+            raise ToolConfigurationError(
+                f"No input files match '{self.input_glob}'"
+            )
+
+        self.log.info("Processing %d input files with %d processes",
+                      len(paths), self.n_jobs)
+        merged, failed = process_files(
+            type(self), self.config, paths, n_jobs=self.n_jobs,
+        )
+        if failed:
+            self.log.warning("Processing of %d input files failed: %s",
+                             len(failed), ', '.join(failed))
+        if not merged:
+            # nothing to merge, so finish() cannot run either
+            raise ToolConfigurationError(
+                f"Processing of all files matching '{self.input_glob}' failed"
+            )
+
+        for name, value in merged.items():
+            setattr(self, name, value)
+
+    def _finish_activity(self, status='completed'):
+        """ add the profile and timing statistics to the provenance and
+        finish the tool's activity """
+        self._write_profile()
+        self._report_instrumentation()
+        Provenance().finish_activity(activity_name=self.name, status=status)
+
+    def _finish_failed_activity(self):
+        """ finish the tool's activity and any activities started within it
+        that were left open by an exception """
+        provenance = Provenance()
+        while provenance.current_activity.name != self.name:
+            provenance.finish_activity(status='error')
+        self._finish_activity(status='error')
+
+    def _create_profiler(self):
+        try:
+            self._profiler = ToolProfiler(self.profile_components)
+        except ImportError as err:
+            raise ToolConfigurationError(str(err))
+
+    def _add_line_profiled_components(self):
+        missing = self._profiler.add_line_profiled_components()
+        if missing:
+            self.log.warning("Components to line profile not found: %s",
+                             ', '.join(missing))
+
+    def _write_profile(self):
+        """ write the profile and record it as output of the activity """
+        if self._profiler is None:
+            return
+
+        self._profiler.disable()
+        self.log.info("Profile of the most expensive functions:\n%s",
+                      self._profiler.format_stats())
+
+        path = self.profile_output or f'{self.name}.prof'
+        for output in self._profiler.write(path):
+            self.log.info("Profile written to '%s'", output)
+            Provenance().add_output_file(output, role='profile')
+        self._profiler = None
+
+    def _report_instrumentation(self):
+        """ log the timing statistics and add them to the provenance """
+        if not self.instrument:
+            return
+
+        instrumentation = Instrumentation()
+        self.log.info("Timing of the processing stages:\n%s",
+                      instrumentation.format_summary())
+        Provenance().add_instrumentation(instrumentation.summary())
 
     @property
     def version_string(self):
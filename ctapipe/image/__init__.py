@@ -8,3 +8,4 @@ from .muon import *
 from .geometry_converter import *
 from .leakage import *
 from .concentration import concentration
+from .image_parameters import *
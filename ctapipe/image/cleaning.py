@@ -2,12 +2,35 @@
 Image Cleaning Algorithms (identification of noisy pixels)
 """
 
-__all__ = ['tailcuts_clean', 'dilate']
+__all__ = [
+    'tailcuts_clean',
+    'dilate',
+    'tailcuts_clean_batch',
+    'dilate_batch',
+    'apply_time_delta_cleaning_batch',
+    'fact_image_cleaning_batch',
+]
 
 import numpy as np
-from scipy.sparse.csgraph import connected_components
+from numba import njit
 
+from ..utils.grouping import group_sum
+from ..core.instrumentation import instrumented
 
+
+def _count_neighbors(geom, masks):
+    """
+    Number of neighbors inside the mask for each pixel of a stack of masks
+    with shape ``(n_images, n_pixels)``.
+
+    The neighbor matrix is symmetric, so all images are handled by a single
+    sparse matrix - dense matrix product.
+    """
+    masks = np.asanyarray(masks, dtype=bool)
+    return geom.neighbor_matrix_sparse.dot(masks.T.view(np.byte)).T
+
+
+@instrumented()
 def tailcuts_clean(geom, image, picture_thresh=7, boundary_thresh=5,
                    keep_isolated_pixels=False,
                    min_number_picture_neighbors=0):
@@ -113,24 +136,46 @@ def number_of_islands(geom, mask):
     num_islands: int
         Total number of clusters
     island_labels: ndarray
-        Contains cluster membership of each pixel.
+        Contains cluster membership of each pixel as integer label.
         Dimesion equals input mask.
         Entries range from 0 (not in the pixel mask) to num_islands.
     """
-    # compress sparse neighbor matrix
-    neighbor_matrix_compressed = geom.neighbor_matrix_sparse[mask][:, mask]
-    # pixels in no cluster have label == 0
-    island_labels = np.zeros(geom.n_pixels)
-
-    num_islands, island_labels_compressed = connected_components(
-        neighbor_matrix_compressed,
-        directed=False
-    )
+    indptr, indices = geom.neighbor_adjacency
+    return _label_islands(indptr, indices, np.asanyarray(mask, dtype=bool))
 
-    # count clusters from 1 onwards
-    island_labels[mask] = island_labels_compressed + 1
 
-    return num_islands, island_labels
+@njit
+def _label_islands(indptr, indices, mask):
+    """
+    Label the connected components of the masked pixels with a
+    breadth-first search on the adjacency list, only visiting masked pixels.
+    Islands are numbered from 1 in the order of their lowest pixel index.
+    """
+    n_pixels = len(mask)
+    labels = np.zeros(n_pixels, dtype=np.int32)
+    queue = np.empty(n_pixels, dtype=np.int32)
+    n_islands = 0
+
+    for seed in range(n_pixels):
+        if not mask[seed] or labels[seed] != 0:
+            continue
+
+        n_islands += 1
+        labels[seed] = n_islands
+        queue[0] = seed
+        head = 0
+        tail = 1
+        while head < tail:
+            pixel = queue[head]
+            head += 1
+            for i in range(indptr[pixel], indptr[pixel + 1]):
+                neighbor = indices[i]
+                if mask[neighbor] and labels[neighbor] == 0:
+                    labels[neighbor] = n_islands
+                    queue[tail] = neighbor
+                    tail += 1
+
+    return n_islands, labels
 
 
 def apply_time_delta_cleaning(geom, mask, arrival_times,
@@ -161,13 +206,13 @@ def apply_time_delta_cleaning(geom, mask, arrival_times,
     `image[~mask] = 0`
 
     """
-    pixels_to_remove = []
-    for pixel in np.where(mask)[0]:
-        neighbors = geom.neighbor_matrix_sparse[pixel].indices
-        time_diff = np.abs(arrival_times[neighbors] - arrival_times[pixel])
-        if sum(time_diff < time_limit) < min_number_neighbors:
-            pixels_to_remove.append(pixel)
-    mask[pixels_to_remove] = False
+    mask[:] = apply_time_delta_cleaning_batch(
+        geom,
+        mask[np.newaxis],
+        np.asanyarray(arrival_times)[np.newaxis],
+        min_number_neighbors,
+        time_limit,
+    )[0]
     return mask
 
 
@@ -255,3 +300,185 @@ def fact_image_cleaning(geom, image, arrival_times, picture_threshold=4,
                                                min_number_neighbors,
                                                time_limit)
     return pixels_to_keep
+
+
+def tailcuts_clean_batch(geom, images, picture_thresh=7, boundary_thresh=5,
+                         keep_isolated_pixels=False,
+                         min_number_picture_neighbors=0):
+    """
+    Apply `tailcuts_clean` to many images of the same camera at once.
+
+    Instead of one sparse matrix - vector product per image, the neighbor
+    counts of all images are obtained with one sparse matrix - matrix product.
+
+    Parameters
+    ----------
+    geom: `ctapipe.instrument.CameraGeometry`
+        Camera geometry information
+    images: array
+        pixel values with shape ``(n_images, n_pixels)``
+    picture_thresh: float or array
+        threshold above which all pixels are retained, a per-pixel array
+        of shape ``(n_pixels, )`` or ``(n_images, n_pixels)`` is supported
+    boundary_thresh: float or array
+        threshold above which pixels are retained if they have a neighbor
+        already above the picture_thresh
+    keep_isolated_pixels: bool
+        If True, pixels above the picture threshold will be included always,
+        if not they are only included if a neighbor is in the picture or
+        boundary
+    min_number_picture_neighbors: int
+        A picture pixel survives cleaning only if it has at least this number
+        of picture neighbors. This has no effect in case keep_isolated_pixels is True
+
+    Returns
+    -------
+    A boolean mask of *clean* pixels with shape ``(n_images, n_pixels)``
+    """
+    images = np.atleast_2d(images)
+    pixels_above_picture = images >= picture_thresh
+
+    if keep_isolated_pixels or min_number_picture_neighbors == 0:
+        pixels_in_picture = pixels_above_picture
+    else:
+        number_of_neighbors_above_picture = _count_neighbors(
+            geom, pixels_above_picture
+        )
+        pixels_in_picture = pixels_above_picture & (
+            number_of_neighbors_above_picture >= min_number_picture_neighbors
+        )
+
+    pixels_above_boundary = images >= boundary_thresh
+    pixels_with_picture_neighbors = _count_neighbors(geom, pixels_in_picture) > 0
+    if keep_isolated_pixels:
+        return (pixels_above_boundary
+                & pixels_with_picture_neighbors) | pixels_in_picture
+    else:
+        pixels_with_boundary_neighbors = _count_neighbors(
+            geom, pixels_above_boundary
+        ) > 0
+        return ((pixels_above_boundary & pixels_with_picture_neighbors) |
+                (pixels_in_picture & pixels_with_boundary_neighbors))
+
+
+def dilate_batch(geom, masks):
+    """
+    Add one row of neighbors to the True values of each pixel mask in a stack
+    of masks, see `dilate`.
+
+    Parameters
+    ----------
+    geom: `~ctapipe.instrument.CameraGeometry`
+        Camera geometry information
+    masks: ndarray
+        input masks (array of booleans) with shape ``(n_images, n_pixels)``
+    """
+    masks = np.atleast_2d(np.asanyarray(masks, dtype=bool))
+    return masks | (_count_neighbors(geom, masks) > 0)
+
+
+def apply_time_delta_cleaning_batch(geom, masks, arrival_times,
+                                    min_number_neighbors, time_limit):
+    """
+    Apply `apply_time_delta_cleaning` to many images of the same camera.
+
+    The arrival time differences are computed for all neighbor pairs of the
+    sparse neighbor matrix at once and summed per pixel, so there is no
+    loop over pixels or images.
+    In contrast to `apply_time_delta_cleaning`, the input masks are not
+    modified.
+
+    Parameters
+    ----------
+    geom: `ctapipe.instrument.CameraGeometry`
+        Camera geometry information
+    masks: array, boolean
+        boolean masks of *clean* pixels before time_delta_cleaning,
+        with shape ``(n_images, n_pixels)``
+    arrival_times: array
+        pixel timing information with shape ``(n_images, n_pixels)``
+    min_number_neighbors: int
+        Threshold to determine if a pixel survives cleaning steps.
+        These steps include checks of neighbor arrival time and value
+    time_limit: int or float
+        arrival time limit for neighboring pixels
+
+    Returns
+    -------
+    A boolean mask of *clean* pixels with shape ``(n_images, n_pixels)``
+    """
+    masks = np.atleast_2d(np.asanyarray(masks, dtype=bool))
+    arrival_times = np.atleast_2d(arrival_times)
+
+    neighbors = geom.neighbor_matrix_sparse
+    # row index of each stored neighbor pair, pairs are sorted by row
+    pixels = np.repeat(np.arange(neighbors.shape[0]), np.diff(neighbors.indptr))
+    time_diff = np.abs(
+        arrival_times[:, neighbors.indices] - arrival_times[:, pixels]
+    )
+    # shape (n_pixels, n_images)
+    n_in_time = group_sum(
+        (time_diff < time_limit).T.astype(np.int32), neighbors.indptr
+    )
+    return masks & (n_in_time.T >= min_number_neighbors)
+
+
+def fact_image_cleaning_batch(geom, images, arrival_times, picture_threshold=4,
+                              boundary_threshold=2, min_number_neighbors=2,
+                              time_limit=5):
+    """
+    Apply `fact_image_cleaning` to many images of the same camera at once.
+
+    Parameters
+    ----------
+    geom: `ctapipe.instrument.CameraGeometry`
+        Camera geometry information
+    images: array
+        pixel values with shape ``(n_images, n_pixels)``
+    arrival_times: array
+        pixel timing information with shape ``(n_images, n_pixels)``
+    picture_threshold: float or array
+        threshold above which all pixels are retained
+    boundary_threshold: float or array
+        threshold above which pixels are retained if they have a neighbor
+        already above the picture_thresh
+    min_number_neighbors: int
+        Threshold to determine if a pixel survives cleaning steps.
+        These steps include checks of neighbor arrival time and value
+    time_limit: int or float
+        arrival time limit for neighboring pixels
+
+    Returns
+    -------
+    A boolean mask of *clean* pixels with shape ``(n_images, n_pixels)``
+    """
+    images = np.atleast_2d(images)
+
+    # Step 1
+    pixels_to_keep = images >= picture_threshold
+
+    # Step 2
+    number_of_neighbors_above_picture = _count_neighbors(geom, pixels_to_keep)
+    pixels_to_keep &= number_of_neighbors_above_picture >= min_number_neighbors
+
+    # Step 3
+    pixels_above_boundary = images >= boundary_threshold
+    pixels_to_keep = dilate_batch(geom, pixels_to_keep) & pixels_above_boundary
+
+    # nothing else to do if min_number_neighbors <= 0
+    if min_number_neighbors <= 0:
+        return pixels_to_keep
+
+    # Step 4
+    pixels_to_keep = apply_time_delta_cleaning_batch(
+        geom, pixels_to_keep, arrival_times, min_number_neighbors, time_limit
+    )
+
+    # Step 5
+    number_of_neighbors = _count_neighbors(geom, pixels_to_keep)
+    pixels_to_keep &= number_of_neighbors >= min_number_neighbors
+
+    # Step 6
+    return apply_time_delta_cleaning_batch(
+        geom, pixels_to_keep, arrival_times, min_number_neighbors, time_limit
+    )
@@ -9,6 +9,7 @@ import numpy as np
 from astropy.coordinates import Angle
 from astropy.units import Quantity
 from ..io.containers import HillasParametersContainer
+from ..core.instrumentation import instrumented
 
 
 __all__ = [
@@ -58,6 +59,7 @@ class HillasParameterizationError(RuntimeError):
     pass
 
 
+@instrumented()
 def hillas_parameters(geom, image):
     """
     Compute Hillas parameters for a given shower image.
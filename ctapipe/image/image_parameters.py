@@ -0,0 +1,205 @@
+"""
+Computation of all standard DL1 image parameters in a single pass.
+"""
+
+import astropy.units as u
+import numpy as np
+from astropy.coordinates import Angle
+
+from ..core import Component
+from ..io.containers import (
+    HillasParametersContainer,
+    LeakageContainer,
+    ConcentrationContainer,
+    TimingParametersContainer,
+    ImageParametersContainer,
+)
+from .hillas import HillasParameterizationError
+
+__all__ = ['ImageParameterizer']
+
+
+class _CameraConstants:
+    """
+    Unit-free pixel coordinates and border masks of one camera geometry
+    """
+
+    def __init__(self, geom):
+        self.geom = geom
+        self.pix_x_quantity = geom.pix_x
+        self.pix_y_quantity = geom.pix_y
+        self.unit = geom.pix_x.unit
+        self.pix_x = np.asanyarray(geom.pix_x.to_value(self.unit), np.float64)
+        self.pix_y = np.asanyarray(geom.pix_y.to_value(self.unit), np.float64)
+        self.border1 = geom.get_border_pixel_mask(1)
+        self.border2 = geom.get_border_pixel_mask(2)
+        self.n_pixels = geom.n_pixels
+
+    def is_valid_for(self, geom):
+        # rotating a geometry replaces its pixel coordinates
+        return (
+            self.geom is geom
+            and self.pix_x_quantity is geom.pix_x
+            and self.pix_y_quantity is geom.pix_y
+        )
+
+
+class ImageParameterizer(Component):
+    """
+    Compute the hillas, leakage, concentration and timing parameters of a
+    cleaned image in one pass.
+
+    The results are the same as calling `~ctapipe.image.hillas_parameters`,
+    `~ctapipe.image.leakage`, `~ctapipe.image.concentration` and
+    `~ctapipe.image.timing_parameters.timing_parameters` on the cleaned image,
+    but the center of gravity, the orientation and the shower coordinates
+    are only computed once and only for the pixels surviving the cleaning.
+    Unit-free pixel coordinates and border masks are cached per camera
+    geometry.
+
+    Parameters
+    ----------
+    config : traitlets.loader.Config
+        Configuration specified by config file or cmdline arguments.
+        Used to set traitlet values.
+        Set to None if no configuration to pass.
+    tool : ctapipe.core.Tool
+        Tool executable that is calling this component.
+        Passes the correct logger to the component.
+        Set to None if no Tool to pass.
+    kwargs
+    """
+
+    def __init__(self, config=None, tool=None, **kwargs):
+        super().__init__(config=config, tool=tool, **kwargs)
+        self._camera_constants = {}
+
+    def _get_camera_constants(self, geom):
+        constants = self._camera_constants.get(id(geom))
+        if constants is None or not constants.is_valid_for(geom):
+            constants = _CameraConstants(geom)
+            self._camera_constants[id(geom)] = constants
+        return constants
+
+    def __call__(self, geom, image, cleaning_mask, peakpos=None):
+        """
+        Parameterize one image
+
+        Parameters
+        ----------
+        geom: ctapipe.instrument.CameraGeometry
+            Camera geometry
+        image: array_like
+            Charge in each pixel, pixels outside of ``cleaning_mask`` are
+            ignored
+        cleaning_mask: array, dtype=bool
+            The pixels that survived cleaning, e.g. tailcuts_clean
+        peakpos: array_like or None
+            Pixel peak positions, if None, the timing parameters are not
+            computed
+
+        Returns
+        -------
+        ImageParametersContainer
+        """
+        cam = self._get_camera_constants(geom)
+        unit = cam.unit
+
+        pixels = np.flatnonzero(cleaning_mask)
+        weights = np.asanyarray(image, dtype=np.float64)[pixels]
+        size = np.sum(weights)
+
+        if size == 0.0:
+            raise HillasParameterizationError(
+                'size=0, cannot calculate HillasParameters'
+            )
+
+        pix_x = cam.pix_x[pixels]
+        pix_y = cam.pix_y[pixels]
+
+        # hillas
+        cog_x = np.dot(weights, pix_x) / size
+        cog_y = np.dot(weights, pix_y) / size
+        delta_x = pix_x - cog_x
+        delta_y = pix_y - cog_y
+
+        cov_xx = np.dot(weights, delta_x * delta_x) / size
+        cov_xy = np.dot(weights, delta_x * delta_y) / size
+        cov_yy = np.dot(weights, delta_y * delta_y) / size
+        eig_vals, eig_vecs = np.linalg.eigh([[cov_xx, cov_xy], [cov_xy, cov_yy]])
+        width, length = np.sqrt(eig_vals)
+        psi = np.arctan(eig_vecs[1, 1] / eig_vecs[0, 1])
+
+        cos_psi = np.cos(psi)
+        sin_psi = np.sin(psi)
+        longi = delta_x * cos_psi + delta_y * sin_psi
+        trans = delta_y * cos_psi - delta_x * sin_psi
+
+        longi_squared = longi**2
+        m3_long = np.dot(weights, longi_squared * longi) / size
+        m4_long = np.dot(weights, longi_squared * longi_squared) / size
+
+        hillas = HillasParametersContainer(
+            x=u.Quantity(cog_x, unit),
+            y=u.Quantity(cog_y, unit),
+            r=u.Quantity(np.hypot(cog_x, cog_y), unit),
+            phi=Angle(np.arctan2(cog_y, cog_x), unit=u.rad),
+            intensity=size,
+            length=u.Quantity(length, unit),
+            width=u.Quantity(width, unit),
+            psi=Angle(psi, unit=u.rad),
+            skewness=m3_long / length**3,
+            kurtosis=m4_long / length**4,
+        )
+
+        # leakage
+        on_border1 = cam.border1[pixels]
+        on_border2 = cam.border2[pixels]
+        leakage = LeakageContainer(
+            leakage1_pixel=np.count_nonzero(on_border1) / cam.n_pixels,
+            leakage2_pixel=np.count_nonzero(on_border2) / cam.n_pixels,
+            leakage1_intensity=np.sum(weights[on_border1]) / size,
+            leakage2_intensity=np.sum(weights[on_border2]) / size,
+        )
+
+        # concentration, the three pixels closest to the cog are searched
+        # in the full camera, pixels not surviving the cleaning count as 0
+        distance_squared = (cam.pix_x - cog_x)**2 + (cam.pix_y - cog_y)**2
+        n_cog = min(3, cam.n_pixels)
+        cog_pixels = np.argpartition(distance_squared, n_cog - 1)[:n_cog]
+        cog_pixels = cog_pixels[np.asanyarray(cleaning_mask)[cog_pixels]]
+        in_core = (longi_squared / length**2 + trans**2 / width**2) <= 1.0
+        concentration = ConcentrationContainer(
+            concentration_cog=np.sum(np.asanyarray(image)[cog_pixels]) / size,
+            concentration_core=np.sum(weights[in_core]) / size,
+            concentration_pixel=max(weights.max(), 0.0) / size,
+        )
+
+        # timing, weighted linear regression of the peak position along
+        # the main shower axis, only using pixels with positive signal
+        timing = TimingParametersContainer()
+        if peakpos is not None:
+            positive = weights > 0
+            timing_weights = weights[positive]
+            timing_longi = longi[positive]
+            times = np.asanyarray(peakpos, dtype=np.float64)[pixels][positive]
+
+            timing_size = np.sum(timing_weights)
+            mean_longi = np.dot(timing_weights, timing_longi) / timing_size
+            mean_time = np.dot(timing_weights, times) / timing_size
+            delta_longi = timing_longi - mean_longi
+            slope = (
+                np.dot(timing_weights, delta_longi * (times - mean_time))
+                / np.dot(timing_weights, delta_longi**2)
+            )
+            timing = TimingParametersContainer(
+                slope=slope / unit,
+                intercept=mean_time - slope * mean_longi,
+            )
+
+        return ImageParametersContainer(
+            hillas=hillas,
+            leakage=leakage,
+            concentration=concentration,
+            timing=timing,
+        )
@@ -2,11 +2,12 @@ import numpy as np
 from scipy.optimize import minimize
 import scipy.constants as const
 from scipy.stats import norm
-from astropy.units import Quantity
+from astropy.units import Quantity, dimensionless_unscaled
 
 __all__ = [
     'kundu_chaudhuri_circle_fit',
     'psf_likelihood_fit',
+    'psf_likelihood_fit_batch',
     'impact_parameter_chisq_fit',
     'mirror_integration_distance',
     'expected_pixel_light_content',
@@ -25,6 +26,10 @@ def kundu_chaudhuri_circle_fit(x, y, weights):
     Fast, analytic calculation of circle center and radius for 
     weighted data using method given in [chaudhuri93]_
 
+    Many circles can be fitted to the same points at once by passing
+    weights of shape ``(n_circles, n_points)``, the results then have
+    shape ``(n_circles, )``.
+
     Parameters
     ----------
     x: array-like or astropy quantity
@@ -35,25 +40,38 @@ def kundu_chaudhuri_circle_fit(x, y, weights):
         weights of the points
 
     """
+    x = np.ravel(x)
+    y = np.ravel(y)
+    weights = np.asanyarray(weights)
+    if weights.size == x.size:
+        weights = np.ravel(weights)
+
+    weights_sum = np.sum(weights, axis=-1)
+    mean_x = np.sum(x * weights, axis=-1) / weights_sum
+    mean_y = np.sum(y * weights, axis=-1) / weights_sum
 
-    weights_sum = np.sum(weights)
-    mean_x = np.sum(x * weights) / weights_sum
-    mean_y = np.sum(y * weights) / weights_sum
+    delta_x = x - mean_x[..., np.newaxis]
+    delta_y = y - mean_y[..., np.newaxis]
+    factor = x**2 + y**2
 
-    a1 = np.sum(weights * (x - mean_x) * x)
-    a2 = np.sum(weights * (y - mean_y) * x)
+    a1 = np.sum(weights * delta_x * x, axis=-1)
+    a2 = np.sum(weights * delta_y * x, axis=-1)
 
-    b1 = np.sum(weights * (x - mean_x) * y)
-    b2 = np.sum(weights * (y - mean_y) * y)
+    b1 = np.sum(weights * delta_x * y, axis=-1)
+    b2 = np.sum(weights * delta_y * y, axis=-1)
 
-    c1 = 0.5 * np.sum(weights * (x - mean_x) * (x**2 + y**2))
-    c2 = 0.5 * np.sum(weights * (y - mean_y) * (x**2 + y**2))
+    c1 = 0.5 * np.sum(weights * delta_x * factor, axis=-1)
+    c2 = 0.5 * np.sum(weights * delta_y * factor, axis=-1)
 
     center_x = (b2 * c1 - b1 * c2) / (a1 * b2 - a2 * b1)
     center_y = (a2 * c1 - a1 * c2) / (a2 * b1 - a1 * b2)
 
     radius = np.sqrt(np.sum(
-        weights * ((center_x - x)**2 + (center_y - y)**2),
+        weights * (
+            (center_x[..., np.newaxis] - x)**2
+            + (center_y[..., np.newaxis] - y)**2
+        ),
+        axis=-1,
     ) / weights_sum)
 
     return radius, center_x, center_y
@@ -84,6 +102,53 @@ def _psf_neg_log_likelihood(params, x, y, weights):
     )
 
 
+def _psf_neg_log_likelihood_and_gradient(params, x, y, weights):
+    """
+    `_psf_neg_log_likelihood` and its analytic gradient with respect to
+    (radius, center_x, center_y, std)
+    """
+    radius, center_x, center_y, sigma = params
+    delta_x = center_x - x
+    delta_y = center_y - y
+    pixel_distance = np.sqrt(delta_x**2 + delta_y**2)
+    residual = pixel_distance - radius
+
+    weighted_residual = weights * residual / sigma**2
+    # the direction is undefined for points exactly in the center
+    with np.errstate(invalid='ignore', divide='ignore'):
+        inverse_distance = np.where(
+            pixel_distance > 0, 1 / pixel_distance, 0.0
+        )
+
+    value = np.sum(
+        (np.log(sigma) + 0.5 * (residual / sigma)**2) * weights
+    )
+    gradient = np.array([
+        -np.sum(weighted_residual),
+        np.sum(weighted_residual * delta_x * inverse_distance),
+        np.sum(weighted_residual * delta_y * inverse_distance),
+        np.sum(weights * (1 - (residual / sigma)**2)) / sigma,
+    ])
+    return value, gradient
+
+
+def _strip_common_unit(x, y):
+    """
+    Convert x and y to plain arrays in the same, decomposed unit
+    """
+    if isinstance(x, Quantity) or isinstance(y, Quantity):
+        x = Quantity(x).decompose()
+        y = Quantity(y).decompose()
+        assert x.unit == y.unit
+        return x.value, y.value, x.unit
+
+    return (
+        np.asanyarray(x, dtype=np.float64),
+        np.asanyarray(y, dtype=np.float64),
+        dimensionless_unscaled,
+    )
+
+
 def psf_likelihood_fit(x, y, weights):
     """
     Do a likelihood fit using a ring with gaussian profile.
@@ -114,20 +179,23 @@ def psf_likelihood_fit(x, y, weights):
         standard deviation of the gaussian profile (indictor for the ring width)
     """
 
-    x = Quantity(x).decompose()
-    y = Quantity(y).decompose()
-    assert x.unit == y.unit
-    unit = x.unit
-    x = x.value
-    y = y.value
+    x, y, unit = _strip_common_unit(x, y)
 
     start_r, start_x, start_y = kundu_chaudhuri_circle_fit(x, y, weights)
+    # the most likely std for the start ring is the weighted rms
+    # of the distances to the ring
+    start_std = np.sqrt(
+        np.average((np.hypot(x - start_x, y - start_y) - start_r)**2, weights=weights)
+    )
+    if not start_std > 0:
+        start_std = 5e-3
 
     result = minimize(
-        _psf_neg_log_likelihood,
-        x0=(start_r, start_x, start_y, 5e-3),
+        _psf_neg_log_likelihood_and_gradient,
+        x0=(start_r, start_x, start_y, start_std),
         args=(x, y, weights),
         method='L-BFGS-B',
+        jac=True,
         bounds=[
             (0, None),      # radius should be positive
             (None, None),
@@ -142,6 +210,117 @@ def psf_likelihood_fit(x, y, weights):
     return result.x * unit
 
 
+def psf_likelihood_fit_batch(x, y, weights, max_iterations=50, tolerance=1e-10):
+    """
+    Likelihood fit of a ring with gaussian profile to many images at once.
+
+    For a given ring, the maximum likelihood estimate of the std of the
+    profile is the weighted rms of the distances of the points to the ring,
+    so the likelihood fit reduces to a weighted least squares fit of the
+    ring to the points. This is solved with Gauss-Newton iterations for all
+    images in parallel, starting from the `kundu_chaudhuri_circle_fit`.
+
+    Parameters
+    ----------
+    x: array-like or astropy quantity
+        x coordinates of the points, shape (n_points, )
+    y: array-like or astropy quantity
+        y coordinates of the points, shape (n_points, )
+    weights: array-like
+        weights of the points, shape (n_images, n_points)
+    max_iterations: int
+        maximum number of Gauss-Newton iterations
+    tolerance: float
+        the iterations stop when the largest parameter update,
+        relative to the radius, is below this value
+
+    Returns
+    -------
+    radius: astropy-quantity
+        radius of the rings
+    center_x: astropy-quantity
+        x coordinate of the ring centers
+    center_y: astropy-quantity
+        y coordinate of the ring centers
+    std: astropy-quantity
+        standard deviation of the gaussian profiles
+        (indictor for the ring width)
+    """
+    x, y, unit = _strip_common_unit(x, y)
+    x = np.ravel(x)
+    y = np.ravel(y)
+    weights = np.atleast_2d(np.asanyarray(weights, dtype=np.float64))
+
+    # points without weight in any image do not contribute
+    used = np.any(weights != 0, axis=0)
+    x = x[used]
+    y = y[used]
+    weights = weights[:, used]
+
+    radius, center_x, center_y = kundu_chaudhuri_circle_fit(x, y, weights)
+    params = np.column_stack([radius, center_x, center_y])
+
+    for _ in range(max_iterations):
+        delta_x = params[:, 1, np.newaxis] - x
+        delta_y = params[:, 2, np.newaxis] - y
+        pixel_distance = np.sqrt(delta_x**2 + delta_y**2)
+        residual = pixel_distance - params[:, 0, np.newaxis]
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            inverse_distance = np.where(
+                pixel_distance > 0, 1 / pixel_distance, 0.0
+            )
+
+        # normal equations of the weighted least squares problem,
+        # the jacobian of the residuals is (-1, direction_x, direction_y)
+        direction_x = delta_x * inverse_distance
+        direction_y = delta_y * inverse_distance
+        weighted_x = weights * direction_x
+        weighted_y = weights * direction_y
+
+        sum_w = np.sum(weights, axis=1)
+        sum_x = np.sum(weighted_x, axis=1)
+        sum_y = np.sum(weighted_y, axis=1)
+        sum_xx = np.sum(weighted_x * direction_x, axis=1)
+        sum_xy = np.sum(weighted_x * direction_y, axis=1)
+        sum_yy = np.sum(weighted_y * direction_y, axis=1)
+
+        normal_matrix = np.stack([
+            np.stack([sum_w, -sum_x, -sum_y], axis=-1),
+            np.stack([-sum_x, sum_xx, sum_xy], axis=-1),
+            np.stack([-sum_y, sum_xy, sum_yy], axis=-1),
+        ], axis=1)
+        gradient = np.stack([
+            -np.sum(weights * residual, axis=1),
+            np.sum(weighted_x * residual, axis=1),
+            np.sum(weighted_y * residual, axis=1),
+        ], axis=-1)
+
+        # images for which the fit failed stay nan
+        valid = np.all(np.isfinite(normal_matrix), axis=(1, 2))
+        valid &= np.abs(np.linalg.det(np.where(
+            valid[:, np.newaxis, np.newaxis], normal_matrix, np.eye(3)
+        ))) > 0
+        step = np.full_like(params, np.nan)
+        step[valid] = -np.linalg.solve(
+            normal_matrix[valid], gradient[valid][..., np.newaxis]
+        )[..., 0]
+        params += step
+
+        converged = np.abs(step).max(axis=1) <= tolerance * np.abs(params[:, 0])
+        if np.all(converged | ~np.isfinite(step).all(axis=1)):
+            break
+
+    radius, center_x, center_y = params.T
+    residual = (
+        np.sqrt((center_x[:, np.newaxis] - x)**2 + (center_y[:, np.newaxis] - y)**2)
+        - radius[:, np.newaxis]
+    )
+    std = np.sqrt(np.sum(weights * residual**2, axis=1) / np.sum(weights, axis=1))
+
+    return radius * unit, center_x * unit, center_y * unit, std * unit
+
+
 def impact_parameter_chisq_fit(
         pixel_x,
         pixel_y,
@@ -56,10 +56,19 @@ class MuonLineIntegrate:
     photemit: float
         1/lambda^2 integrated over the above defined wavelength range
         multiplied by the fine structure constant (1/137)
+    max_impact_parameter: float
+        largest impact distance in meters of the pre-calculated light
+        profile tables used by the likelihood, larger values are clipped
+    impact_parameter_bins: int
+        number of impact distances of the pre-calculated light profile tables
     """
 
+    #: number of light profile tables (one per ring radius) to keep
+    max_cached_profiles = 20
+
     def __init__(self, mirror_radius, hole_radius, pixel_width=0.2,
-                 oversample_bins=3, sct_flag=False, secondary_radius=1.):
+                 oversample_bins=3, sct_flag=False, secondary_radius=1.,
+                 max_impact_parameter=25., impact_parameter_bins=1001):
 
         self.mirror_radius = mirror_radius
         self.hole_radius = hole_radius
@@ -76,6 +85,11 @@ class MuonLineIntegrate:
         self.photemit = alpha * (self.minlambda**-1 -
                                  self.maxlambda**-1)  # 12165.45
         self.unit = u.deg
+        self.max_impact_parameter = max_impact_parameter
+        self.impact_parameter_bins = impact_parameter_bins
+        self._profiles = {}
+        self._pixel_x_value = None
+        self._pixel_y_value = None
 
     @staticmethod
     def chord_length(radius, rho, phi):
@@ -177,6 +191,156 @@ class MuonLineIntegrate:
 
         return ang, l
 
+    @staticmethod
+    def _chord_lengths(radius, rho, phi):
+        """
+        `chord_length` for an array of fractional distances ``rho`` with
+        shape (n, 1) and angles ``phi`` with shape (m, ), unit-free
+        """
+        with np.errstate(invalid='ignore'):
+            chord = np.sqrt(1 - (rho * np.sin(phi))**2)
+            chord = np.where(
+                rho <= 1.0,
+                radius * (chord + rho * np.cos(phi)),
+                2. * radius * chord,
+            )
+        chord[np.isnan(chord)] = 0
+        chord[chord < 0] = 0
+        return chord
+
+    def light_profile_table(self, radius):
+        """
+        Pre-calculated, smoothed chord length profiles as calculated by
+        `plot_pos` for a grid of impact distances.
+
+        As the profile only depends on the ring radius through the
+        smoothing, the table is calculated once per radius and cached.
+
+        Parameters
+        ----------
+        radius: float
+            Radius of muon ring in degrees
+
+        Returns
+        -------
+        impact_parameters: ndarray
+            impact distances of the rows of the table in meters
+        angles: ndarray
+            angles of the columns of the table, from -pi to pi
+        profiles: ndarray
+            chord length in meters for each impact distance and angle
+        """
+        table = self._profiles.get(radius)
+        if table is not None:
+            return table
+
+        bins = int((2 * np.pi * radius) / self.pixel_width.value) * self.oversample_bins
+        angles = np.linspace(-np.pi, np.pi, bins)
+        impact_parameters = np.linspace(
+            0, self.max_impact_parameter, self.impact_parameter_bins
+        )
+
+        mirror_radius = u.Quantity(self.mirror_radius, u.m).value
+        hole_radius = u.Quantity(self.hole_radius, u.m).value
+        rho = impact_parameters[:, np.newaxis]
+
+        profiles = self._chord_lengths(mirror_radius, rho / mirror_radius, angles)
+        if hole_radius > 0:
+            profiles -= self._chord_lengths(hole_radius, rho / hole_radius, angles)
+
+        profiles = correlate1d(
+            profiles, np.ones(self.oversample_bins), mode='wrap', axis=1
+        )
+        profiles /= self.oversample_bins
+
+        if len(self._profiles) >= self.max_cached_profiles:
+            self._profiles.clear()
+        table = (impact_parameters, angles, profiles)
+        self._profiles[radius] = table
+        return table
+
+    def interpolate_light_profile(self, impact_parameter, radius, angle):
+        """
+        Light profile at the given angles, interpolated in the table of
+        `light_profile_table`
+
+        Parameters
+        ----------
+        impact_parameter: float
+            Impact distance from mirror centre in meters
+        radius: float
+            Radius of muon ring in degrees
+        angle: ndarray
+            Angles of the pixels w.r.t. the ring centre, including the
+            rotation of the muon image, in radians
+
+        Returns
+        -------
+        ndarray
+            Chord length in meters for each angle
+        """
+        impact_parameters, angles, profiles = self.light_profile_table(radius)
+
+        # linear interpolation between the two closest impact distances
+        position = np.clip(
+            impact_parameter / impact_parameters[-1] * (len(impact_parameters) - 1),
+            0, len(impact_parameters) - 1
+        )
+        lower = min(int(position), len(impact_parameters) - 2)
+        fraction = position - lower
+        profile = (1 - fraction) * profiles[lower] + fraction * profiles[lower + 1]
+
+        # the profile is periodic in the angle
+        angle = np.mod(angle + np.pi, 2 * np.pi) - np.pi
+        return np.interp(angle, angles, profile)
+
+    def fast_image_prediction(self, impact_parameter, phi, centre_x,
+                              centre_y, radius, ring_width, pixel_x, pixel_y):
+        """
+        Unit-free version of `image_prediction` using the pre-calculated
+        light profiles of `light_profile_table`.
+
+        Parameters
+        ----------
+        impact_parameter: float
+            Impact distance of muon in meters
+        phi: float
+            Rotation angle of muon image
+        centre_x: float
+            Muon ring centre in field of view in degrees
+        centre_y: float
+            Muon ring centre in field of view in degrees
+        radius: float
+            Radius of muon ring in degrees
+        ring_width: float
+            Gaussian width of muon ring in degrees
+        pixel_x: ndarray
+            Pixel x coordinate in degrees
+        pixel_y: ndarray
+            Pixel y coordinate in degrees
+
+        Returns
+        -------
+        ndarray:
+            Predicted signal
+        """
+        del_x = pixel_x - centre_x
+        del_y = pixel_y - centre_y
+        ang = np.arctan2(del_x, del_y) + phi
+
+        profile = self.interpolate_light_profile(impact_parameter, radius, ang)
+
+        radial_dist = np.sqrt(del_x**2 + del_y**2)
+        gauss = np.exp(-0.5 * ((radial_dist - radius) / ring_width)**2)
+        gauss /= np.sqrt(2 * np.pi) * ring_width
+
+        pixel_width = self.pixel_width.value
+        scale = (
+            0.5 * self.photemit.to_value(1 / u.m)
+            * (pixel_width / radius) * np.sin(2 * radius) * pixel_width
+        )
+        return profile * scale * gauss
+
     def pos_to_angle(self, centre_x, centre_y, pixel_x, pixel_y):
         """
         Convert pixel positions from x,y coordinates to rotation angle
@@ -290,27 +454,32 @@ class MuonLineIntegrate:
         # impact_parameter *= u.m
         # phi *= u.rad
 
+        if self._pixel_x_value is None:
+            self._pixel_x_value = self.pixel_x.to_value(u.deg)
+            self._pixel_y_value = self.pixel_y.to_value(u.deg)
+
         # Generate model prediction
-        self.prediction = self.image_prediction(
+        self.prediction = self.fast_image_prediction(
             impact_parameter,
             phi,
             centre_x,
             centre_y,
             radius,
             ring_width,
-            self.pixel_x.value,
-            self.pixel_y.value,
+            self._pixel_x_value,
+            self._pixel_y_value,
         )
         # TEST: extra scaling factor, HESS style (ang pix size /2piR)
 
-        scalenpix = self.pixel_width / (2.*np.pi * radius)
-        self.prediction *= scalenpix.value
+        scalenpix = self.pixel_width.value / (2.*np.pi * radius)
 
         # scale prediction by optical efficiency of array
-        self.prediction *= optical_efficiency_muon
+        self.prediction *= scalenpix * optical_efficiency_muon
 
         # Multiply sum of likelihoods by -2 to make them behave like chi-squared
-        like_value = np.sum(self.calc_likelihood(self.image, self.prediction, 0.5, 1.1))
+        like_value = np.sum(
+            self.fast_calc_likelihood(self.image, self.prediction, 0.5, 1.1)
+        )
 
         return like_value
 
@@ -351,6 +520,33 @@ class MuonLineIntegrate:
 
         return likelihood_value
 
+    @staticmethod
+    def fast_calc_likelihood(image, pred, spe_width, ped):
+        """
+        Unit-free version of `calc_likelihood`, working with the logarithm
+        of the gaussian instead of the gaussian itself
+
+        Parameters
+        ----------
+        image: ndarray
+            Pixel amplitudes from image
+        pred: ndarray
+            Predicted pixel amplitudes from model
+        spe_width: ndarray
+            width of single p.e. distributio
+        ped: ndarray
+            width of pedestal
+
+        Returns
+        -------
+        ndarray: likelihood for each pixel
+        """
+        variance = ped**2 + pred * (1 + spe_width**2)
+        log_expo = np.maximum(
+            -(image - pred)**2 / (2 * variance), np.log(1e-300)
+        )
+        return np.log(2 * np.pi * variance) - 2 * log_expo
+
     def fit_muon(self, centre_x, centre_y, radius, pixel_x, pixel_y, image):
         """
 
@@ -375,9 +571,11 @@ class MuonLineIntegrate:
         """
 
         # First store these parameters in the class so we can use them in minimisation
-        self.image = image
+        self.image = np.asanyarray(image, dtype=np.float64)
         self.pixel_x = pixel_x.to(u.deg)
         self.pixel_y = pixel_y.to(u.deg)
+        self._pixel_x_value = self.pixel_x.value
+        self._pixel_y_value = self.pixel_y.value
         self.unit = pixel_x.unit
 
         radius.to(u.deg)
@@ -1,5 +1,6 @@
 import logging
 import warnings
+from collections import defaultdict
 
 import numpy as np
 from astropy import log
@@ -8,90 +9,231 @@ from astropy.coordinates import Angle, SkyCoord, AltAz
 from astropy.utils.decorators import deprecated
 
 from ctapipe.coordinates import CameraFrame, NominalFrame
-from ctapipe.image.cleaning import tailcuts_clean
+from ctapipe.core import Component
+from ctapipe.core.traits import Bool
+from ctapipe.image.cleaning import tailcuts_clean_batch
 from ctapipe.image.muon.features import ring_containment
 from ctapipe.image.muon.features import ring_completeness
 from ctapipe.image.muon.features import npix_above_threshold
 from ctapipe.image.muon.features import npix_composing_ring
 from ctapipe.image.muon.muon_integrator import MuonLineIntegrate
-from ctapipe.image.muon.muon_ring_finder import ChaudhuriKunduRingFitter
+from ctapipe.image.muon.fitting import kundu_chaudhuri_circle_fit
+from ctapipe.io.containers import MuonRingParameter
 
 logger = logging.getLogger(__name__)
 
 
-def analyze_muon_event(event):
+# muon selection cuts and telescope properties per camera type
+# tail cuts: 10, 12 for FlashCam?
+# min_pix: 8% (or 6%) of the pixels as limit
+# pixel_width: Need to either convert from the pixel area in m^2 or check the
+# camera specs
+# hole_radius: Found from TDRs (or the pixel area), assuming approximately
+# spherical hole
+# camera_radius: found from the field of view calculation
+_MUON_CUTS = {
+    name: dict(
+        tail_cuts=tail_cuts,
+        impact=u.Quantity(impact, u.m),
+        ring_width=u.Quantity(ring_width, u.deg),
+        total_pix=total_pix,
+        min_pix=min_pix,
+        pixel_width=u.Quantity(pixel_width, u.deg),
+        hole_radius=u.Quantity(hole_radius, u.m),
+        camera_radius=u.Quantity(camera_radius, u.deg),
+        secondary_radius=u.Quantity(secondary_radius, u.m),
+        sct=sct,
+    )
+    for (
+        name, tail_cuts, impact, ring_width, total_pix, min_pix, pixel_width,
+        hole_radius, camera_radius, secondary_radius, sct
+    ) in [
+        ('LST:LSTCam', (5, 7), (0.2, 0.9), (0.04, 0.08), 1855., 148., 0.1,
+         0.308, 2.26, 0., False),
+        ('MST:NectarCam', (5, 7), (0.1, 0.95), (0.02, 0.1), 1855., 148., 0.2,
+         0.244, 3.96, 0., False),
+        ('MST:FlashCam', (10, 12), (0.2, 0.9), (0.01, 0.1), 1764., 141., 0.18,
+         0.244, 3.87, 0., False),
+        ('MST-SCT:SCTCam', (5, 7), (0.2, 0.9), (0.02, 0.1), 11328., 680., 0.067,
+         4.3866, 4., 2.7, True),
+        ('SST-1M:DigiCam', (5, 7), (0.1, 0.95), (0.01, 0.5), 1296., 104., 0.24,
+         0.160, 4.45, 0., False),
+        ('SST-GCT:CHEC', (5, 7), (0.1, 0.95), (0.02, 0.2), 2048., 164., 0.2,
+         0.130, 2.86, 1., True),
+        ('SST-ASTRI:ASTRICam', (5, 7), (0.1, 0.95), (0.02, 0.2), 2368., 142.,
+         0.17, 0.171, 5.25, 1.8, True),
+        ('SST-ASTRI:CHEC', (5, 7), (0.1, 0.95), (0.02, 0.2), 2048, 164., 0.2,
+         0.171, 2.86, 1.8, True),
+    ]
+}
+
+
+def fit_muon_rings(x, y, images, n_iterations=3, ring_fraction=0.4,
+                   initial_weights=None):
     """
-    Generic muon event analyzer.
+    Iterative Kundu-Chaudhuri ring fit of many images of the same camera.
+
+    After the first fit, each further fit only uses the pixels closer than
+    ``ring_fraction * radius`` to the previously fitted ring.
 
     Parameters
     ----------
-    event : ctapipe dl1 event container
-
+    x: ndarray
+        unit-free x position of the pixels, shape (n_pixels, )
+    y: ndarray
+        unit-free y position of the pixels, shape (n_pixels, )
+    images: ndarray
+        cleaned images, shape (n_images, n_pixels)
+    n_iterations: int
+        number of fits
+    ring_fraction: float
+        maximum distance of pixels to the ring in later fits,
+        relative to the ring radius
+    initial_weights: ndarray or None
+        pixel weights of the first fit, shape (n_images, n_pixels),
+        if None, ``images`` is used
 
     Returns
     -------
-    muonringparam, muonintensityparam : MuonRingParameter
-    and MuonIntensityParameter container event
+    centre_x, centre_y, radius: ndarray
+        ring parameters in the units of ``x`` and ``y``, one per image
+    """
+    images = np.atleast_2d(images)
+    if initial_weights is None:
+        initial_weights = images
+    radius, centre_x, centre_y = kundu_chaudhuri_circle_fit(
+        x, y, initial_weights
+    )
+
+    for _ in range(n_iterations - 1):
+        dist = np.hypot(
+            x - centre_x[:, np.newaxis], y - centre_y[:, np.newaxis]
+        )
+        ring_dist = np.abs(dist - radius[:, np.newaxis])
+        weights = images * (ring_dist < radius[:, np.newaxis] * ring_fraction)
+        radius, centre_x, centre_y = kundu_chaudhuri_circle_fit(x, y, weights)
+
+    return centre_x, centre_y, radius
+
 
+class MuonAnalyzer(Component):
     """
+    Muon ring and intensity analysis of the telescope images of an event.
 
-    names = ['LST:LSTCam', 'MST:NectarCam', 'MST:FlashCam', 'MST-SCT:SCTCam',
-             'SST-1M:DigiCam', 'SST-GCT:CHEC', 'SST-ASTRI:ASTRICam', 'SST-ASTRI:CHEC']
-    tail_cuts = [(5, 7), (5, 7), (10, 12), (5, 7),
-                (5, 7), (5, 7), (5, 7), (5, 7)]  # 10, 12?
-    impact = [(0.2, 0.9), (0.1, 0.95), (0.2, 0.9), (0.2, 0.9),
-              (0.1, 0.95), (0.1, 0.95), (0.1, 0.95), (0.1, 0.95)] * u.m
-    ringwidth = [(0.04, 0.08), (0.02, 0.1), (0.01, 0.1), (0.02, 0.1),
-                 (0.01, 0.5), (0.02, 0.2), (0.02, 0.2), (0.02, 0.2)] * u.deg
-    total_pix = [1855., 1855., 1764., 11328., 1296., 2048., 2368., 2048]
-    # 8% (or 6%) as limit
-    min_pix = [148., 148., 141., 680., 104., 164., 142., 164]
-    # Need to either convert from the pixel area in m^2 or check the camera specs
-    ang_pixel_width = [0.1, 0.2, 0.18, 0.067, 0.24, 0.2, 0.17, 0.2, 0.163] * u.deg
-    # Found from TDRs (or the pixel area)
-    hole_rad = [0.308 * u.m, 0.244 * u.m, 0.244 * u.m,
-                4.3866 * u.m, 0.160 * u.m, 0.130 * u.m,
-                0.171 * u.m, 0.171 * u.m]  # Assuming approximately spherical hole
-    cam_rad = [2.26, 3.96, 3.87, 4., 4.45, 2.86, 5.25, 2.86] * u.deg
-    # Above found from the field of view calculation
-    sec_rad = [0. * u.m, 0. * u.m, 0. * u.m, 2.7 * u.m,
-               0. * u.m, 1. * u.m, 1.8 * u.m, 1.8 * u.m]
-    sct = [False, False, False, True, False, True, True, True]
-    # Added cleaning here. All these options should go to an input card
-    cleaning = True
-
-    muon_cuts = {'Name': names, 'tail_cuts': tail_cuts, 'Impact': impact,
-                 'RingWidth': ringwidth, 'total_pix': total_pix,
-                 'min_pix': min_pix, 'CamRad': cam_rad, 'SecRad': sec_rad,
-                 'SCT': sct, 'AngPixW': ang_pixel_width, 'HoleRad': hole_rad}
-    logger.debug(muon_cuts)
-
-    muonringlist = []  # [None] * len(event.dl0.tels_with_data)
-    muonintensitylist = []  # [None] * len(event.dl0.tels_with_data)
-    tellist = []
-    muon_event_param = {'TelIds': tellist,
-                        'MuonRingParams': muonringlist,
-                        'MuonIntensityParams': muonintensitylist}
-
-    for telid in event.dl0.tels_with_data:
-
-        logger.debug("Analysing muon event for tel %d", telid)
-        image = event.dl1.tel[telid].image[0]
-
-        # Get geometry
-        teldes = event.inst.subarray.tel[telid]
-        geom = teldes.camera
-        x, y = geom.pix_x, geom.pix_y
-
-        dict_index = muon_cuts['Name'].index(str(teldes))
-        logger.debug('found an index of %d for camera %d',
-                     dict_index, geom.cam_id)
-
-        tailcuts = muon_cuts['tail_cuts'][dict_index]
-        logger.debug("Tailcuts are %s", tailcuts)
-
-        clean_mask = tailcuts_clean(geom, image, picture_thresh=tailcuts[0],
-                                    boundary_thresh=tailcuts[1])
+    The images of all telescopes of the same camera type are cleaned and
+    ring-fitted together. The pixel coordinates in the nominal frame are
+    cached per camera type and pointing and the intensity fitters are
+    cached per camera type, so only the first event of a run pays for the
+    coordinate transformations.
+
+    Parameters
+    ----------
+    config : traitlets.loader.Config
+        Configuration specified by config file or cmdline arguments.
+        Used to set traitlet values.
+        Set to None if no configuration to pass.
+    tool : ctapipe.core.Tool
+        Tool executable that is calling this component.
+        Passes the correct logger to the component.
+        Set to None if no Tool to pass.
+    kwargs
+    """
+    cleaning = Bool(
+        True, help='Fit the rings to the tail-cuts cleaned images'
+    ).tag(config=True)
+
+    #: maximum number of pointings for which nominal coordinates are cached
+    max_cached_pointings = 100
+
+    def __init__(self, config=None, tool=None, **kwargs):
+        super().__init__(config=config, tool=tool, **kwargs)
+        self._nominal_coordinates = {}
+        self._intensity_fitters = {}
+
+    def nominal_pixel_coordinates(self, telescope, pointing):
+        """
+        Pixel positions of a telescope in the nominal frame
+
+        Parameters
+        ----------
+        telescope: ctapipe.instrument.TelescopeDescription
+            telescope description
+        pointing: astropy.coordinates.SkyCoord
+            telescope pointing in the AltAz frame
+
+        Returns
+        -------
+        x, y: astropy.units.Quantity
+            delta_az and delta_alt of the pixels in degrees
+        """
+        geom = telescope.camera
+        focal_length = telescope.optics.equivalent_focal_length
+        key = (
+            str(telescope),
+            geom.cam_id,
+            focal_length.to_value(u.m),
+            geom.pix_rotation.deg,
+            pointing.alt.deg,
+            pointing.az.deg,
+        )
+        coordinates = self._nominal_coordinates.get(key)
+        if coordinates is not None:
+            return coordinates
+
+        camera_coord = SkyCoord(
+            x=geom.pix_x, y=geom.pix_y,
+            frame=CameraFrame(
+                focal_length=focal_length,
+                rotation=geom.pix_rotation,
+                telescope_pointing=pointing,
+            )
+        )
+        nom_coord = camera_coord.transform_to(NominalFrame(origin=pointing))
+        coordinates = (
+            nom_coord.delta_az.to(u.deg),
+            nom_coord.delta_alt.to(u.deg),
+        )
+
+        if len(self._nominal_coordinates) >= self.max_cached_pointings:
+            self._nominal_coordinates.clear()
+        self._nominal_coordinates[key] = coordinates
+        return coordinates
+
+    def _get_intensity_fitter(self, name, mirror_radius):
+        key = (name, mirror_radius.to_value(u.m))
+        fitter = self._intensity_fitters.get(key)
+        if fitter is None:
+            cuts = _MUON_CUTS[name]
+            fitter = MuonLineIntegrate(
+                mirror_radius, hole_radius=cuts['hole_radius'],
+                pixel_width=cuts['pixel_width'],
+                sct_flag=cuts['sct'],
+                secondary_radius=cuts['secondary_radius'],
+            )
+            self._intensity_fitters[key] = fitter
+        return fitter
+
+    def __call__(self, event):
+        """
+        Analyze the muon rings of all telescopes of an event
+
+        Parameters
+        ----------
+        event : ctapipe dl1 event container
+
+        Returns
+        -------
+        dict:
+            ``TelIds``, ``MuonRingParams`` and ``MuonIntensityParams``,
+            lists with one entry per telescope passing the ring cuts,
+            the intensity parameters are None if the intensity cuts failed
+        """
+        muonringlist = []
+        muonintensitylist = []
+        tellist = []
+        muon_event_param = {'TelIds': tellist,
+                            'MuonRingParams': muonringlist,
+                            'MuonIntensityParams': muonintensitylist}
 
         # TODO: correct this hack for values over 90
         altval = event.mcheader.run_array_direction[1]
@@ -104,160 +246,185 @@ def analyze_muon_event(event):
             az=event.mcheader.run_array_direction[0],
             frame=AltAz()
         )
-        camera_coord = SkyCoord(
-            x=x, y=y,
-            frame=CameraFrame(
-                focal_length=teldes.optics.equivalent_focal_length,
-                rotation=geom.pix_rotation,
-                telescope_pointing=telescope_pointing,
+
+        # group the telescopes by type, to fit all images of a type at once
+        tels_by_type = defaultdict(list)
+        for telid in event.dl0.tels_with_data:
+            tels_by_type[str(event.inst.subarray.tel[telid])].append(telid)
+
+        rings = {}
+        for name, telids in tels_by_type.items():
+            teldes = event.inst.subarray.tel[telids[0]]
+            geom = teldes.camera
+            tailcuts = _MUON_CUTS[name]['tail_cuts']
+            logger.debug("Tailcuts for %s are %s", name, tailcuts)
+
+            images = np.array([event.dl1.tel[telid].image[0] for telid in telids])
+            clean_masks = tailcuts_clean_batch(
+                geom, images,
+                picture_thresh=tailcuts[0],
+                boundary_thresh=tailcuts[1],
+            )
+            imgs = images * clean_masks if self.cleaning else images
+
+            # Nothing left after tail cuts
+            has_signal = np.sum(imgs, axis=1) != 0
+            if not np.any(has_signal):
+                continue
+
+            x, y = self.nominal_pixel_coordinates(teldes, telescope_pointing)
+            # the first fit always uses the cleaned images
+            centre_x, centre_y, radius = fit_muon_rings(
+                x.value, y.value, imgs[has_signal],
+                initial_weights=(images * clean_masks)[has_signal],
             )
-        )
 
-        nom_coord = camera_coord.transform_to(
-            NominalFrame(origin=telescope_pointing)
-        )
-        x = nom_coord.delta_az.to(u.deg)
-        y = nom_coord.delta_alt.to(u.deg)
+            for i, telid in enumerate(np.array(telids)[has_signal]):
+                rings[telid] = (
+                    images[has_signal][i], x, y,
+                    centre_x[i], centre_y[i], radius[i],
+                )
+
+        for telid in event.dl0.tels_with_data:
+            if telid not in rings:
+                continue
+            logger.debug("Analysing muon event for tel %d", telid)
+
+            image, x, y, centre_x, centre_y, radius = rings[telid]
+            teldes = event.inst.subarray.tel[telid]
+            name = str(teldes)
+            cuts = _MUON_CUTS[name]
+
+            muonringparam = MuonRingParameter(
+                tel_id=telid,
+                obs_id=event.dl0.obs_id,
+                event_id=event.dl0.event_id,
+                ring_center_x=centre_x * u.deg,
+                ring_center_y=centre_y * u.deg,
+                ring_radius=radius * u.deg,
+                ring_phi=np.arctan(centre_y / centre_x) * u.rad,
+                ring_inclination=np.hypot(centre_x, centre_y) * u.deg,
+                ring_fit_method="ChaudhuriKundu",
+            )
 
-        if(cleaning):
-            img = image * clean_mask
-        else:
-            img = image
+            dist = np.hypot(x.value - centre_x, y.value - centre_y) * u.deg
+            dist_mask = (
+                np.abs(dist - muonringparam.ring_radius)
+                < muonringparam.ring_radius * 0.4
+            )
+            pix_im = image * dist_mask
+            nom_dist = np.sqrt(np.power(muonringparam.ring_center_x, 2)
+                               + np.power(muonringparam.ring_center_y, 2))
 
-        muonring = ChaudhuriKunduRingFitter(None)
+            minpix = cuts['min_pix']  # 0.06*numpix #or 8%
 
-        logger.debug("img: %s mask: %s, x=%s y= %s", np.sum(image),
-                     np.sum(clean_mask), x, y)
+            mir_rad = np.sqrt(teldes.optics.mirror_area.to("m2") / np.pi)
 
-        if not sum(img):  # Nothing left after tail cuts
-            continue
+            # Camera containment radius -  better than nothing - guess pixel
+            # diameter of 0.11, all cameras are perfectly circular   cam_rad =
+            # np.sqrt(numpix*0.11/(2.*np.pi))
 
-        muonringparam = muonring.fit(x, y, image * clean_mask)
+            if not (npix_above_threshold(pix_im, cuts['tail_cuts'][0]) > 0.1 * minpix
+                    and npix_composing_ring(pix_im) > minpix
+                    and nom_dist < cuts['camera_radius']
+                    and muonringparam.ring_radius < 1.5 * u.deg
+                    and muonringparam.ring_radius > 1. * u.deg):
+                continue
 
-        dist = np.sqrt(np.power(x - muonringparam. ring_center_x, 2)
-                       + np.power(y - muonringparam.ring_center_y, 2))
-        ring_dist = np.abs(dist - muonringparam.ring_radius)
+            muonringparam.ring_containment = ring_containment(
+                muonringparam.ring_radius,
+                cuts['camera_radius'],
+                muonringparam.ring_center_x,
+                muonringparam.ring_center_y)
 
-        muonringparam = muonring.fit(
-            x, y, img * (ring_dist < muonringparam.ring_radius * 0.4)
-        )
+            # Store muon ring parameters (passing cuts stage 1)
+            tellist.append(telid)
+            muonringlist.append(muonringparam)
+            muonintensitylist.append(None)
 
-        dist = np.sqrt(np.power(x - muonringparam.ring_center_x, 2) +
-                       np.power(y - muonringparam.ring_center_y, 2))
-        ring_dist = np.abs(dist - muonringparam.ring_radius)
+            if image.shape[0] != cuts['total_pix']:
+                continue
 
-        muonringparam = muonring.fit(
-            x, y, img * (ring_dist < muonringparam.ring_radius * 0.4)
-        )
+            ctel = self._get_intensity_fitter(name, mir_rad)
+            muonintensityoutput = ctel.fit_muon(muonringparam.ring_center_x,
+                                                muonringparam.ring_center_y,
+                                                muonringparam.ring_radius,
+                                                x[dist_mask], y[dist_mask],
+                                                image[dist_mask])
 
-        muonringparam.tel_id = telid
-        muonringparam.obs_id = event.dl0.obs_id
-        muonringparam.event_id = event.dl0.event_id
-        dist_mask = np.abs(dist - muonringparam.
-                           ring_radius) < muonringparam.ring_radius * 0.4
-        pix_im = image * dist_mask
-        nom_dist = np.sqrt(np.power(muonringparam.ring_center_x,
-                                    2) + np.power(muonringparam.ring_center_y, 2))
+            muonintensityoutput.tel_id = telid
+            muonintensityoutput.obs_id = event.dl0.obs_id
+            muonintensityoutput.event_id = event.dl0.event_id
+            muonintensityoutput.mask = dist_mask
 
-        minpix = muon_cuts['min_pix'][dict_index]  # 0.06*numpix #or 8%
+            idx_ring = np.nonzero(pix_im)
+            muonintensityoutput.ring_completeness = ring_completeness(
+                x[idx_ring], y[idx_ring], pix_im[idx_ring],
+                muonringparam.ring_radius,
+                muonringparam.ring_center_x,
+                muonringparam.ring_center_y,
+                threshold=30,
+                bins=30)
+            muonintensityoutput.ring_size = np.sum(pix_im)
 
-        mir_rad = np.sqrt(teldes.optics.mirror_area.to("m2") / np.pi)
+            dist_ringwidth_mask = np.abs(dist - muonringparam.ring_radius
+                                         ) < (muonintensityoutput.ring_width)
+            pix_ringwidth_im = image * dist_ringwidth_mask
+            idx_ringwidth = np.nonzero(pix_ringwidth_im)
 
-        # Camera containment radius -  better than nothing - guess pixel
-        # diameter of 0.11, all cameras are perfectly circular   cam_rad =
-        # np.sqrt(numpix*0.11/(2.*np.pi))
+            muonintensityoutput.ring_pix_completeness = npix_above_threshold(
+                pix_ringwidth_im[idx_ringwidth], cuts['tail_cuts'][0]) / len(
+                pix_im[idx_ringwidth])
 
-        if(npix_above_threshold(pix_im, tailcuts[0]) > 0.1 * minpix
-           and npix_composing_ring(pix_im) > minpix
-           and nom_dist < muon_cuts['CamRad'][dict_index]
-           and muonringparam.ring_radius < 1.5 * u.deg
-           and muonringparam.ring_radius > 1. * u.deg):
-            muonringparam.ring_containment = ring_containment(
-                muonringparam.ring_radius,
-                muon_cuts['CamRad'][dict_index],
-                muonringparam.ring_center_x,
-                muonringparam.ring_center_y)
+            logger.debug("Tel %d Impact parameter = %s mir_rad=%s "
+                         "ring_width=%s", telid,
+                         muonintensityoutput.impact_parameter, mir_rad,
+                         muonintensityoutput.ring_width)
+            conditions = [
+                muonintensityoutput.impact_parameter * u.m <
+                cuts['impact'][1] * mir_rad,
 
-            # Guess HESS is 0.16
-            # sec_rad = 0.*u.m
-            # sct = False
-            # if numpix == 2048 and mir_rad > 2.*u.m and mir_rad < 2.1*u.m:
-            #     sec_rad = 1.*u.m
-            #     sct = True
-            #
-            # Store muon ring parameters (passing cuts stage 1)
-            # muonringlist[idx] = muonringparam
+                muonintensityoutput.impact_parameter
+                > cuts['impact'][0],
 
-            tellist.append(telid)
-            muonringlist.append(muonringparam)
-            muonintensitylist.append(None)
+                muonintensityoutput.ring_width
+                < cuts['ring_width'][1],
 
-            ctel = MuonLineIntegrate(
-                mir_rad, hole_radius=muon_cuts['HoleRad'][dict_index],
-                pixel_width=muon_cuts['AngPixW'][dict_index],
-                sct_flag=muon_cuts['SCT'][dict_index],
-                secondary_radius=muon_cuts['SecRad'][dict_index]
-            )
+                muonintensityoutput.ring_width
+                > cuts['ring_width'][0]
+            ]
+
+            if all(conditions):
+                idx = tellist.index(telid)
+                muonintensitylist[idx] = muonintensityoutput
+                logger.debug("Muon found in tel %d,  tels in event=%d",
+                             telid, len(event.dl0.tels_with_data))
 
-            if image.shape[0] == muon_cuts['total_pix'][dict_index]:
-                muonintensityoutput = ctel.fit_muon(muonringparam.ring_center_x,
-                                                    muonringparam.ring_center_y,
-                                                    muonringparam.ring_radius,
-                                                    x[dist_mask], y[dist_mask],
-                                                    image[dist_mask])
-
-                muonintensityoutput.tel_id = telid
-                muonintensityoutput.obs_id = event.dl0.obs_id
-                muonintensityoutput.event_id = event.dl0.event_id
-                muonintensityoutput.mask = dist_mask
-
-                idx_ring = np.nonzero(pix_im)
-                muonintensityoutput.ring_completeness = ring_completeness(
-                    x[idx_ring], y[idx_ring], pix_im[idx_ring],
-                    muonringparam.ring_radius,
-                    muonringparam.ring_center_x,
-                    muonringparam.ring_center_y,
-                    threshold=30,
-                    bins=30)
-                muonintensityoutput.ring_size = np.sum(pix_im)
-
-                dist_ringwidth_mask = np.abs(dist - muonringparam.ring_radius
-                                             ) < (muonintensityoutput.ring_width)
-                pix_ringwidth_im = image * dist_ringwidth_mask
-                idx_ringwidth = np.nonzero(pix_ringwidth_im)
-
-                muonintensityoutput.ring_pix_completeness = npix_above_threshold(
-                    pix_ringwidth_im[idx_ringwidth], tailcuts[0]) / len(
-                    pix_im[idx_ringwidth])
-
-                logger.debug("Tel %d Impact parameter = %s mir_rad=%s "
-                             "ring_width=%s", telid,
-                             muonintensityoutput.impact_parameter, mir_rad,
-                             muonintensityoutput.ring_width)
-                conditions = [
-                    muonintensityoutput.impact_parameter * u.m <
-                    muon_cuts['Impact'][dict_index][1] * mir_rad,
-
-                    muonintensityoutput.impact_parameter
-                    > muon_cuts['Impact'][dict_index][0],
-
-                    muonintensityoutput.ring_width
-                    < muon_cuts['RingWidth'][dict_index][1],
-
-                    muonintensityoutput.ring_width
-                    > muon_cuts['RingWidth'][dict_index][0]
-                ]
-
-                if all(conditions):
-                    muonintensityparam = muonintensityoutput
-                    idx = tellist.index(telid)
-                    muonintensitylist[idx] = muonintensityparam
-                    logger.debug("Muon found in tel %d,  tels in event=%d",
-                                 telid, len(event.dl0.tels_with_data))
-                else:
-                    continue
-
-    return muon_event_param
+        return muon_event_param
+
+
+_default_analyzer = None
+
+
+def analyze_muon_event(event):
+    """
+    Generic muon event analyzer, using a shared `MuonAnalyzer`.
+
+    Parameters
+    ----------
+    event : ctapipe dl1 event container
+
+
+    Returns
+    -------
+    muonringparam, muonintensityparam : MuonRingParameter
+    and MuonIntensityParameter container event
+
+    """
+    global _default_analyzer
+    if _default_analyzer is None:
+        _default_analyzer = MuonAnalyzer()
+    return _default_analyzer(event)
 
 
 @deprecated('0.6')
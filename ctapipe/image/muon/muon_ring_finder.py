@@ -1,5 +1,6 @@
 import numpy as np
 import astropy.units as u
+from ctapipe.image.muon.fitting import kundu_chaudhuri_circle_fit
 from ctapipe.image.muon.ring_fitter import RingFitter
 from ctapipe.io.containers import MuonRingParameter
 
@@ -28,36 +29,13 @@ class ChaudhuriKunduRingFitter(RingFitter):
         -------
         X position, Y position, radius, orientation and inclination of circle
         """
-        # First calculate the weighted average positions of the pixels
-        sum_weight = np.sum(weight)
-        av_weighted_pos_x = np.sum(x * weight) / sum_weight
-        av_weighted_pos_y = np.sum(y * weight) / sum_weight
-
-        # The following notation is a bit ugly but directly references the paper notation
-        factor = x**2 + y**2
-
-        a = np.sum(weight * (x - av_weighted_pos_x) * x)
-        a_prime = np.sum(weight * (y - av_weighted_pos_y) * x)
-
-        b = np.sum(weight * (x - av_weighted_pos_x) * y)
-        b_prime = np.sum(weight * (y - av_weighted_pos_y) * y)
-
-        c = np.sum(weight * (x - av_weighted_pos_x) * factor) * 0.5
-        c_prime = np.sum(weight * (y - av_weighted_pos_y) * factor) * 0.5
-
-        nom_0 = ((a * b_prime) - (a_prime * b))
-        nom_1 = ((a_prime * b) - (a * b_prime))
-
-        # Calculate circle centre and radius
-        centre_x = ((b_prime * c) - (b * c_prime)) / nom_0
-        centre_y = ((a_prime * c) - (a * c_prime)) / nom_1
-
-        radius = np.sqrt(
-            # np.sum(weight * ((x - centre_x*u.deg)**2 +
-            # (y - centre_y*u.deg)**2)) / # centre * u.deg ???
-            np.sum(weight * ((x - centre_x)**2 + (y - centre_y)**2)) /
-            sum_weight
+        unit = x.unit
+        radius, centre_x, centre_y = kundu_chaudhuri_circle_fit(
+            x.to_value(unit), y.to_value(unit), weight
         )
+        centre_x = u.Quantity(centre_x, unit)
+        centre_y = u.Quantity(centre_y, unit)
+        radius = u.Quantity(radius, unit)
 
         output = MuonRingParameter()
         output.ring_center_x = centre_x  # *u.deg
@@ -1,7 +1,17 @@
 import numpy as np
 import astropy.units as u
 
-from ctapipe.image.muon import kundu_chaudhuri_circle_fit
+from scipy.optimize import check_grad
+
+from ctapipe.image.muon import (
+    kundu_chaudhuri_circle_fit,
+    psf_likelihood_fit,
+    psf_likelihood_fit_batch,
+)
+from ctapipe.image.muon.fitting import (
+    _psf_neg_log_likelihood,
+    _psf_neg_log_likelihood_and_gradient,
+)
 
 np.random.seed(0)
 
@@ -46,3 +56,93 @@ def test_kundu_chaudhuri_with_units():
     assert fit_y.unit == center_y.unit
     assert fit_radius.unit == radius.unit
 
+
+def test_kundu_chaudhuri_batch():
+    points = np.linspace(-5, 5, 101)
+    x, y = [a.ravel() for a in np.meshgrid(points, points)]
+
+    centers = np.array([(1.0, 0.5), (-2.0, 1.0), (0.0, -1.5)])
+    radii = np.array([1.5, 2.0, 2.5])
+    weights = np.array([
+        (np.abs(np.hypot(x - cx, y - cy) - r) < 0.2).astype(float)
+        for (cx, cy), r in zip(centers, radii)
+    ])
+
+    fit_radius, fit_x, fit_y = kundu_chaudhuri_circle_fit(x, y, weights)
+    assert fit_radius.shape == (3, )
+    assert np.allclose(fit_x, centers[:, 0], atol=0.05)
+    assert np.allclose(fit_y, centers[:, 1], atol=0.05)
+    assert np.allclose(fit_radius, radii, atol=0.05)
+
+    # same result as fitting each image on its own
+    for i in range(3):
+        radius, center_x, center_y = kundu_chaudhuri_circle_fit(
+            x, y, weights[i]
+        )
+        assert np.isclose(radius, fit_radius[i])
+        assert np.isclose(center_x, fit_x[i])
+        assert np.isclose(center_y, fit_y[i])
+
+
+def _ring_images(x, y, centers, radii, std):
+    return np.array([
+        np.exp(-0.5 * ((np.hypot(x - cx, y - cy) - r) / std)**2)
+        for (cx, cy), r in zip(centers, radii)
+    ])
+
+
+def test_psf_likelihood_gradient():
+    phi = np.random.uniform(0, 2 * np.pi, 200)
+    x = 0.3 + np.cos(phi) + np.random.normal(0, 0.05, 200)
+    y = -0.2 + np.sin(phi) + np.random.normal(0, 0.05, 200)
+    weights = np.random.uniform(0.5, 2, 200)
+
+    for params in ([1.0, 0.3, -0.2, 0.05], [0.8, 0.1, 0.0, 0.1]):
+        value, _ = _psf_neg_log_likelihood_and_gradient(params, x, y, weights)
+        assert np.isclose(value, _psf_neg_log_likelihood(params, x, y, weights))
+
+        gradient = _psf_neg_log_likelihood_and_gradient(params, x, y, weights)[1]
+        error = check_grad(
+            lambda p: _psf_neg_log_likelihood(p, x, y, weights),
+            lambda p: _psf_neg_log_likelihood_and_gradient(p, x, y, weights)[1],
+            params,
+        )
+        assert error < 1e-5 * np.linalg.norm(gradient)
+
+
+def test_psf_likelihood_fit_batch():
+    points = np.linspace(-5, 5, 101)
+    x, y = [a.ravel() for a in np.meshgrid(points, points)]
+
+    centers = np.array([(1.0, 0.5), (-2.0, 1.0), (0.0, -1.5)])
+    radii = np.array([1.5, 2.0, 2.5])
+    images = _ring_images(x, y, centers, radii, std=0.1)
+
+    radius, center_x, center_y, std = psf_likelihood_fit_batch(x, y, images)
+    assert radius.shape == (3, )
+    assert np.allclose(center_x, centers[:, 0], atol=0.01)
+    assert np.allclose(center_y, centers[:, 1], atol=0.01)
+    assert np.allclose(radius, radii, atol=0.01)
+    assert np.allclose(std, 0.1, atol=0.01)
+
+    # same result as the minimizer fit of each image
+    for i in range(3):
+        result = psf_likelihood_fit(x, y, images[i])
+        assert np.allclose(
+            result.value,
+            [radius[i].value, center_x[i].value, center_y[i].value, std[i].value],
+            rtol=1e-3,
+        )
+
+
+def test_psf_likelihood_fit_batch_units():
+    phi = np.linspace(0, 2 * np.pi, 100, endpoint=False)
+    x = (0.1 + np.cos(phi)) * u.deg
+    y = (0.2 + np.sin(phi)) * u.deg
+    weights = np.ones((2, 100))
+
+    radius, center_x, center_y, std = psf_likelihood_fit_batch(x, y, weights)
+    assert radius.unit == u.rad
+    assert np.allclose(radius.to_value(u.deg), 1.0)
+    assert np.allclose(center_x.to_value(u.deg), 0.1)
+    assert np.allclose(center_y.to_value(u.deg), 0.2)
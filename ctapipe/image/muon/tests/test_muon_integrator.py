@@ -11,5 +11,44 @@ def test_chord_length():
     chord_length = muon_integrator.MuonLineIntegrate.chord_length(radius, rho, phi)
     assert(chord_length is not np.nan)
 
+
+def test_fast_likelihood():
+    integrator = muon_integrator.MuonLineIntegrate(
+        mirror_radius=11.5 * u.m,
+        hole_radius=0.308 * u.m,
+        pixel_width=0.1 * u.deg,
+    )
+
+    points = np.linspace(-2, 2, 80)
+    pixel_x, pixel_y = [a.ravel() for a in np.meshgrid(points, points)]
+    radius, centre_x, centre_y, ring_width = 1.2, 0.1, -0.2, 0.05
+    rng = np.random.RandomState(0)
+
+    for impact_parameter, phi in [(0.0, 0.0), (4.3, 0.5), (9.2, -2.0)]:
+        prediction_quantity = integrator.image_prediction(
+            impact_parameter, phi, centre_x, centre_y, radius, ring_width,
+            pixel_x, pixel_y,
+        )
+        prediction = prediction_quantity.to_value(1 / u.deg)
+        fast_prediction = integrator.fast_image_prediction(
+            impact_parameter, phi, centre_x, centre_y, radius, ring_width,
+            pixel_x, pixel_y,
+        )
+        scale = prediction.max()
+        assert np.allclose(fast_prediction, prediction, atol=0.02 * scale)
+
+        image = rng.poisson(prediction)
+        likelihood = integrator.calc_likelihood(
+            image, prediction_quantity, 0.5, 1.1
+        )
+        fast_likelihood = integrator.fast_calc_likelihood(
+            image, prediction, 0.5, 1.1
+        )
+        assert np.allclose(fast_likelihood, likelihood.value)
+
+    # one table per ring radius
+    assert len(integrator._profiles) == 1
+
+
 if __name__ == '__main__':
     test_chord_length()
@@ -1,3 +1,5 @@
+import numpy as np
+from numpy.testing import assert_allclose
 from ctapipe.calib import CameraCalibrator
 from ctapipe.image.muon import muon_reco_functions as muon
 
@@ -19,3 +21,24 @@ def test_basic_muon_reco(example_event):
 
     muon_params = muon.analyze_muon_event(example_event)
     assert muon_params is not None
+
+
+def test_fit_muon_rings():
+    rng = np.random.RandomState(0)
+    points = np.linspace(-3, 3, 61)
+    x, y = [a.ravel() for a in np.meshgrid(points, points)]
+
+    centre_x = np.array([0.3, -0.5])
+    centre_y = np.array([-0.2, 0.4])
+    radius = np.array([1.1, 1.3])
+    images = 100 * np.exp(-0.5 * (
+        (np.hypot(x - centre_x[:, None], y - centre_y[:, None])
+         - radius[:, None]) / 0.05
+    )**2)
+    # some noise pixels far from the ring
+    images[:, rng.choice(len(x), 20)] += 50
+
+    fit_x, fit_y, fit_radius = muon.fit_muon_rings(x, y, images)
+    assert_allclose(fit_x, centre_x, atol=0.02)
+    assert_allclose(fit_y, centre_y, atol=0.02)
+    assert_allclose(fit_radius, radius, atol=0.02)
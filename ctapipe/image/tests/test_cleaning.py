@@ -196,3 +196,73 @@ def test_fact_image_cleaning():
     expected_mask = np.zeros(len(geom)).astype(bool)
     expected_mask[expected_pixels] = 1
     assert_allclose(mask, expected_mask)
+
+
+def test_batch_cleaning():
+    geom = CameraGeometry.make_rectangular(20, 20)
+    rng = np.random.RandomState(0)
+    images = rng.exponential(3, size=(50, geom.n_pixels))
+    times = rng.normal(10, 3, size=(50, geom.n_pixels))
+
+    for keep_isolated_pixels in (False, True):
+        masks = cleaning.tailcuts_clean_batch(
+            geom, images,
+            picture_thresh=8,
+            boundary_thresh=4,
+            keep_isolated_pixels=keep_isolated_pixels,
+            min_number_picture_neighbors=1,
+        )
+        assert masks.shape == images.shape
+        for image, mask in zip(images, masks):
+            expected = cleaning.tailcuts_clean(
+                geom, image,
+                picture_thresh=8,
+                boundary_thresh=4,
+                keep_isolated_pixels=keep_isolated_pixels,
+                min_number_picture_neighbors=1,
+            )
+            assert (mask == expected).all()
+
+    dilated = cleaning.dilate_batch(geom, masks)
+    for mask, mask_dilated in zip(masks, dilated):
+        assert (mask_dilated == cleaning.dilate(geom, mask)).all()
+
+    masks = cleaning.fact_image_cleaning_batch(geom, images, times)
+    for image, time, mask in zip(images, times, masks):
+        expected = cleaning.fact_image_cleaning(geom, image, time)
+        assert (mask == expected).all()
+    assert masks.any()
+
+
+def test_apply_time_delta_cleaning():
+    geom = CameraGeometry.make_rectangular(3, 3)
+    mask = np.ones(geom.n_pixels, dtype=bool)
+    times = np.zeros(geom.n_pixels)
+    # the center pixel is late, so its neighbors only have 2 in time
+    times[4] = 10
+
+    result = cleaning.apply_time_delta_cleaning(
+        geom, mask, times, min_number_neighbors=2, time_limit=5
+    )
+    expected = np.ones(geom.n_pixels, dtype=bool)
+    expected[4] = False
+    assert (result == expected).all()
+
+
+def test_number_of_islands_connected_components():
+    from scipy.sparse.csgraph import connected_components
+
+    geom = CameraGeometry.make_rectangular(20, 20)
+    rng = np.random.RandomState(0)
+
+    for fraction in (0.0, 0.2, 0.5, 0.8, 1.0):
+        mask = rng.uniform(size=geom.n_pixels) < fraction
+        n_islands, labels = cleaning.number_of_islands(geom, mask)
+
+        expected_n, expected_labels = connected_components(
+            geom.neighbor_matrix_sparse[mask][:, mask], directed=False
+        )
+        assert n_islands == expected_n
+        assert np.issubdtype(labels.dtype, np.integer)
+        assert (labels[~mask] == 0).all()
+        assert (labels[mask] == expected_labels + 1).all()
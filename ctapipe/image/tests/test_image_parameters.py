@@ -0,0 +1,66 @@
+import astropy.units as u
+import numpy as np
+import pytest
+from numpy.random import seed
+from numpy.testing import assert_allclose
+
+from ctapipe.image import (
+    ImageParameterizer,
+    hillas_parameters,
+    leakage,
+    concentration,
+    tailcuts_clean,
+    toymodel,
+    HillasParameterizationError,
+)
+from ctapipe.image.timing_parameters import timing_parameters
+from ctapipe.instrument import CameraGeometry
+
+
+def compare_containers(container1, container2):
+    for key, value in container1.as_dict().items():
+        value1 = u.Quantity(value)
+        value2 = u.Quantity(container2.as_dict()[key])
+        assert value1.unit == value2.unit, key
+        assert_allclose(value1.value, value2.value, rtol=1e-8, err_msg=key)
+
+
+def test_image_parameterizer():
+    seed(0)
+    geom = CameraGeometry.make_rectangular(40, 40)
+    model = toymodel.generate_2d_shower_model(
+        centroid=(0.3, 0.2), width=0.04, length=0.12, psi='35d',
+    )
+    image, _, _ = toymodel.make_toymodel_shower_image(
+        geom, model.pdf, intensity=2000, nsb_level_pe=3,
+    )
+    peakpos = 5 + 20 * geom.pix_x.value + np.random.normal(0, 0.5, len(geom))
+    mask = tailcuts_clean(geom, image, 10, 5)
+
+    parameterizer = ImageParameterizer()
+    params = parameterizer(geom, image, mask, peakpos=peakpos)
+
+    image_clean = image.copy()
+    image_clean[~mask] = 0
+    hillas = hillas_parameters(geom, image_clean)
+
+    compare_containers(params.hillas, hillas)
+    compare_containers(params.leakage, leakage(geom, image, mask))
+    compare_containers(
+        params.concentration, concentration(geom, image_clean, hillas)
+    )
+    compare_containers(
+        params.timing, timing_parameters(geom, image_clean, peakpos, hillas)
+    )
+
+    # without peak positions, no timing parameters are computed
+    params = parameterizer(geom, image, mask)
+    assert np.isnan(params.timing.slope)
+
+    # the cached pixel coordinates follow a rotation of the geometry
+    geom.rotate(10 * u.deg)
+    params = parameterizer(geom, image, mask)
+    compare_containers(params.hillas, hillas_parameters(geom, image_clean))
+
+    with pytest.raises(HillasParameterizationError):
+        parameterizer(geom, image, np.zeros(len(geom), dtype=bool))
@@ -39,3 +39,59 @@ def test_intensity():
 
     # test if total intensity is inside in 99 percent confidence interval
     assert poisson(intensity).ppf(0.05) <= signal.sum() <= poisson(intensity).ppf(0.95)
+
+
+def test_batched_model_counts():
+    from .. import toymodel
+
+    geom = CameraGeometry.make_rectangular(40, 40, (-1, 1), (-1, 1))
+    centroid = [[0.2, 0.3], [-0.4, 0.1], [0.0, 0.0]]
+    width = [0.05, 0.1, 0.08]
+    length = [0.15, 0.2, 0.1]
+    psi = ['30d', '-70d', '120d']
+
+    counts = toymodel._shower_model_counts(
+        geom, centroid, width, length, psi, intensity=100,
+    )
+    assert counts.shape == (3, geom.n_pixels)
+
+    pos = np.column_stack([geom.pix_x.value, geom.pix_y.value])
+    for i in range(3):
+        model = toymodel.generate_2d_shower_model(
+            centroid[i], width[i], length[i], psi[i],
+        )
+        expected = model.pdf(pos) * 100 * geom.pix_area.value
+        assert np.allclose(counts[i], expected)
+
+
+def test_make_toymodel_shower_images():
+    from .. import toymodel
+
+    geom = CameraGeometry.make_rectangular(40, 40, (-1, 1), (-1, 1))
+    n_images = 100
+    rng = np.random.RandomState(0)
+
+    images, signal, noise = toymodel.make_toymodel_shower_images(
+        geom,
+        centroid=(0.2, 0.3),
+        width=0.05,
+        length=0.15,
+        psi='30d',
+        intensity=np.full(n_images, 1000),
+        nsb_level_pe=5,
+        random_state=rng,
+    )
+    assert images.shape == (n_images, geom.n_pixels)
+    assert signal.shape == noise.shape == images.shape
+
+    assert np.mean(signal.sum(axis=1)) == approx(1000, rel=0.05)
+    mean_x = np.average(geom.pix_x.value, weights=signal.sum(axis=0))
+    assert mean_x == approx(0.2, rel=0.05)
+    assert np.allclose(images.mean(axis=1), signal.mean(axis=1))
+
+    # same random state gives the same images
+    images2, _, _ = toymodel.make_toymodel_shower_images(
+        geom, (0.2, 0.3), 0.05, 0.15, '30d', intensity=np.full(n_images, 1000),
+        nsb_level_pe=5, random_state=np.random.RandomState(0),
+    )
+    assert np.all(images == images2)
@@ -15,15 +15,27 @@ Examples:
     >>> print(image.shape)
     (400,)
 
+Many images can be generated at once with `make_toymodel_shower_images`:
+
+.. code-block:: python
+
+    >>> images, signals, noise = make_toymodel_shower_images(
+    ...     geom, centroid=[[0.25, 0.0], [-0.1, 0.2]], width=[0.02, 0.03],
+    ...     length=[0.1, 0.08], psi=['40d', '-20d'],
+    ... )
+    >>> print(images.shape)
+    (2, 400)
 
 """
 import numpy as np
+from astropy.coordinates import Angle
 from scipy.stats import multivariate_normal
 from ctapipe.utils import linalg
 
 __all__ = [
     'generate_2d_shower_model',
     'make_toymodel_shower_image',
+    'make_toymodel_shower_images',
 ]
 
 
@@ -92,6 +104,90 @@ def make_toymodel_shower_image(geom, showerpdf, intensity=50, nsb_level_pe=50):
     return image, signal, noise
 
 
+def _shower_model_counts(geom, centroid, width, length, psi, intensity):
+    """
+    expected photo electrons of the 2D gaussian shower models in each
+    pixel, shape (n_images, n_pixels)
+    """
+    centroid = np.asanyarray(centroid, dtype=np.float64).reshape(-1, 2)
+    width = np.asanyarray(width, dtype=np.float64).reshape(-1, 1)
+    length = np.asanyarray(length, dtype=np.float64).reshape(-1, 1)
+    psi = np.atleast_1d(Angle(psi).rad).reshape(-1, 1)
+    intensity = np.asanyarray(intensity, dtype=np.float64).reshape(-1, 1)
+
+    dx = geom.pix_x.value - centroid[:, 0:1]
+    dy = geom.pix_y.value - centroid[:, 1:2]
+    cos_psi = np.cos(psi)
+    sin_psi = np.sin(psi)
+
+    # coordinates along the major and minor axis of the shower
+    longitudinal = dx * cos_psi + dy * sin_psi
+    transverse = dy * cos_psi - dx * sin_psi
+
+    exponent = (longitudinal / length)**2 + (transverse / width)**2
+    norm = intensity / (2 * np.pi * length * width)
+    return norm * np.exp(-0.5 * exponent) * geom.pix_area.value
+
+
+def make_toymodel_shower_images(
+    geom,
+    centroid,
+    width,
+    length,
+    psi,
+    intensity=50,
+    nsb_level_pe=50,
+    random_state=None,
+):
+    """Generates many pedestal-subtracted shower images of 2D gaussian
+    shower models at once, equivalent to calling
+    `generate_2d_shower_model` and `make_toymodel_shower_image` for
+    each of them, but evaluating all models in one vectorized pass.
+
+    All shower parameters can be arrays with one entry per image or
+    scalars used for all images. As the result is held in memory
+    completely, generate very large numbers of images in batches of a
+    few thousand.
+
+    Parameters
+    ----------
+    geom : `ctapipe.instrument.CameraGeometry`
+        camera geometry object
+    centroid : array-like, shape (n_images, 2)
+        positions of the centroids of the showers in camera coordinates
+    width : float or array-like
+        widths of the showers (minor axis)
+    length : float or array-like
+        lengths of the showers (major axis)
+    psi : convertable to `astropy.coordinates.Angle`
+        rotation angles about the centroids (0=x-axis)
+    intensity : float or array-like
+        expected number of photo-electrons of each shower
+    nsb_level_pe : float
+        level of NSB/pedestal in photo-electrons
+    random_state : `numpy.random.RandomState` or None
+        source of the random numbers, the global numpy state if None
+
+    Returns
+    -------
+    images, signals, noise : arrays of shape (n_images, n_pixels)
+        the images, and their signal and noise contributions, like for
+        `make_toymodel_shower_image`
+    """
+    if random_state is None:
+        random_state = np.random
+
+    model_counts = _shower_model_counts(
+        geom, centroid, width, length, psi, intensity,
+    )
+
+    signal = random_state.poisson(model_counts)
+    noise = random_state.poisson(nsb_level_pe, size=signal.shape)
+    images = (signal + noise) - np.mean(noise, axis=1, keepdims=True)
+
+    return images, signal, noise
+
+
 def gaussian(x, mean, sigma):
     return np.exp(-(x - mean)**2. / (2. * sigma * sigma))
 
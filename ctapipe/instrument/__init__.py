@@ -1,5 +1,5 @@
 from .camera import CameraGeometry
-from .atmosphere import get_atmosphere_profile_functions
+from .atmosphere import get_atmosphere_profile_functions, get_atmosphere_profile
 from .telescope import TelescopeDescription
 from .optics import OpticsDescription
 from .subarray import SubarrayDescription
@@ -8,6 +8,7 @@ from .subarray import SubarrayDescription
 __all__ = [
     'CameraGeometry',
     'get_atmosphere_profile_functions',
+    'get_atmosphere_profile',
     'TelescopeDescription',
     'OpticsDescription',
     'SubarrayDescription',
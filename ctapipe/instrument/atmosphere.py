@@ -1,13 +1,112 @@
 """
 Functions to retrieve and interpolate atmosphere profiles.
 """
+from functools import lru_cache
+
 import numpy as np
 from astropy.units import Quantity
-from scipy.interpolate import interp1d
 
 from ctapipe.utils import get_table_dataset
 
-__all__ = ['get_atmosphere_profile_table', 'get_atmosphere_profile_functions']
+__all__ = [
+    'AtmosphereProfile',
+    'get_atmosphere_profile',
+    'get_atmosphere_profile_table',
+    'get_atmosphere_profile_functions',
+]
+
+
+class _UniformGridTable:
+    """
+    Piecewise linear function y(x) resampled on a uniform grid in x, so that
+    a lookup is a direct index computation rather than a search. Values
+    outside the tabulated range are clipped to the range.
+    """
+
+    def __init__(self, x, y, n_points):
+        self.x_min, self.x_max = x[0], x[-1]
+        grid = np.linspace(self.x_min, self.x_max, n_points)
+        self.values = np.interp(grid, x, y)
+        self.slopes = np.diff(self.values)
+        self.inv_step = (n_points - 1) / (self.x_max - self.x_min)
+
+    def __call__(self, x):
+        position = (np.clip(x, self.x_min, self.x_max) - self.x_min) * self.inv_step
+        index = np.minimum(position.astype(np.intp), len(self.slopes) - 1)
+        return self.values[index] + (position - index) * self.slopes[index]
+
+
+class AtmosphereProfile:
+    """
+    Atmosphere profile with the altitude to thickness conversion, and its
+    inverse, precomputed on uniform grids. Lookups are vectorized and take
+    constant time per value, so they can be used inside likelihood fits.
+
+    Units are fixed, altitudes are in m and thicknesses in g cm-2. Values
+    outside the range of the profile are clipped to the range.
+
+    Parameters
+    ----------
+    altitude: array-like
+        tabulated altitudes in m
+    thickness: array-like
+        tabulated atmospheric thickness in g cm-2 at these altitudes
+    n_points: int
+        number of points of the uniform lookup grids
+    """
+
+    def __init__(self, altitude, thickness, n_points=100000):
+        altitude = np.asanyarray(altitude, dtype=np.float64)
+        thickness = np.asanyarray(thickness, dtype=np.float64)
+
+        order = np.argsort(altitude)
+        self._thickness = _UniformGridTable(altitude[order], thickness[order],
+                                            n_points)
+        order = np.argsort(thickness)
+        self._altitude = _UniformGridTable(thickness[order], altitude[order],
+                                           n_points)
+
+    @classmethod
+    def from_table(cls, table, **kwargs):
+        """
+        Construct from a table with 'altitude' and 'thickness' columns, as
+        returned by `get_atmosphere_profile_table`
+        """
+        return cls(altitude=table['altitude'].to('m').value,
+                   thickness=table['thickness'].to('g cm-2').value,
+                   **kwargs)
+
+    def thickness(self, altitude):
+        """
+        Atmospheric thickness in g cm-2 at the given altitude(s) in m
+        """
+        return self._thickness(altitude)
+
+    def altitude(self, thickness):
+        """
+        Altitude in m at the given atmospheric thickness(es) in g cm-2
+        """
+        return self._altitude(thickness)
+
+
+@lru_cache(maxsize=None)
+def get_atmosphere_profile(atmosphere_name='paranal'):
+    """
+    Get the `AtmosphereProfile` for an atmosphere. The profile table is only
+    read and tabulated once per process, later calls return the same object.
+
+    Parameters
+    ----------
+    atmosphere_name: str
+        identifier of atmosphere profile
+
+    Returns
+    -------
+    AtmosphereProfile
+    """
+    return AtmosphereProfile.from_table(
+        get_atmosphere_profile_table(atmosphere_name)
+    )
 
 
 def get_atmosphere_profile_table(atmosphere_name='paranal'):
@@ -50,19 +149,16 @@ def get_atmosphere_profile_functions(atmosphere_name="paranal",
     -------
     functions: thickness(alt), alt(thickness)
     """
-    tab = get_atmosphere_profile_table(atmosphere_name)
-    alt = tab['altitude'].to('m')
-    thick = (tab['thickness']).to("g cm-2")
-
-    alt_to_thickness = interp1d(x=np.array(alt), y=np.array(thick))
-    thickness_to_alt = interp1d(x=np.array(thick), y=np.array(alt))
+    profile = get_atmosphere_profile(atmosphere_name)
+    alt_to_thickness = profile.thickness
+    thickness_to_alt = profile.altitude
 
     if with_units:
         def thickness(a):
-            return Quantity(alt_to_thickness(a.to('m')), 'g cm-2')
+            return Quantity(alt_to_thickness(a.to_value('m')), 'g cm-2')
 
         def altitude(a):
-            return Quantity(thickness_to_alt(a.to('g cm-2')), 'm')
+            return Quantity(thickness_to_alt(a.to_value('g cm-2')), 'm')
 
         return thickness, altitude
 
@@ -88,6 +88,16 @@ class CameraGeometry:
 
     _geometry_cache = {}  # dictionary CameraGeometry instances for speed
 
+    # lazy properties that depend on the pixel positions and have to be
+    # recomputed when the camera is rotated
+    _position_dependent_properties = (
+        '_pixel_centers',
+        '_kdtree',
+        '_nearest_inner_pixel',
+        'pixel_lookup_grid',
+        'pixel_moment_matrix',
+    )
+
     def __init__(self, cam_id, pix_id, pix_x, pix_y, pix_area, pix_type,
                  pix_rotation="0d", cam_rotation="0d",
                  neighbors=None, apply_derotation=True):
@@ -104,6 +114,9 @@ class CameraGeometry:
         self.cam_rotation = Angle(cam_rotation)
         self._precalculated_neighbors = neighbors
 
+        # cache border pixel mask per instance
+        self.border_cache = {}
+
         if self.pix_area is None:
             self.pix_area = CameraGeometry._calc_pixel_area(pix_x, pix_y,
                                                             pix_type)
@@ -114,9 +127,6 @@ class CameraGeometry:
             if len(pix_x.shape) == 1:
                 self.rotate(cam_rotation)
 
-        # cache border pixel mask per instance
-        self.border_cache = {}
-
     def __eq__(self, other):
         return ((self.cam_id == other.cam_id)
                 and (self.pix_x == other.pix_x).all()
@@ -218,6 +228,14 @@ class CameraGeometry:
 
         return circum_rad
 
+    @lazyproperty
+    def _pixel_centers(self):
+        """
+        Pre-calculated unit-free pixel centers in meters, shape (n_pixels, 2)
+        """
+        return np.column_stack([self.pix_x.to_value(u.m),
+                                self.pix_y.to_value(u.m)])
+
     @lazyproperty
     def _kdtree(self):
         """
@@ -228,10 +246,36 @@ class CameraGeometry:
         kdtree
 
         """
+        return KDTree(self._pixel_centers)
 
-        pixel_centers = np.column_stack([self.pix_x.to_value(u.m),
-                                         self.pix_y.to_value(u.m)])
-        return KDTree(pixel_centers)
+    @lazyproperty
+    def _nearest_inner_pixel(self):
+        """
+        Pre-calculated index of the closest pixel not at the camera border
+        for each pixel, pixels not at the border are their own closest
+        inner pixel.
+
+        Returns
+        -------
+        array(int)
+        """
+        border = self.get_border_pixel_mask(1)
+        nearest = np.arange(self.n_pixels)
+        inner = np.flatnonzero(~border)
+        if len(inner) > 0 and border.any():
+            _, index = KDTree(self._pixel_centers[inner]).query(
+                self._pixel_centers[border]
+            )
+            nearest[border] = inner[index]
+        return nearest
+
+    def _clear_position_cache(self):
+        """
+        Remove all cached values derived from the pixel positions
+        """
+        for name in self._position_dependent_properties:
+            self.__dict__.pop(name, None)
+        self.border_cache.clear()
 
     @lazyproperty
     def _all_pixel_areas_equal(self):
@@ -381,6 +425,26 @@ class CameraGeometry:
     def neighbor_matrix_sparse(self):
         return csr_matrix(self.neighbor_matrix)
 
+    @lazyproperty
+    def neighbor_adjacency(self):
+        """
+        Adjacency list of the pixel graph in compressed sparse row layout:
+        the neighbors of pixel ``i`` are
+        ``indices[indptr[i]:indptr[i + 1]]``.
+
+        Returns
+        -------
+        indptr: ndarray
+            offsets into ``indices`` for each pixel, length ``n_pixels + 1``
+        indices: ndarray
+            concatenated neighbor indices of all pixels
+        """
+        sparse = self.neighbor_matrix_sparse
+        return (
+            np.ascontiguousarray(sparse.indptr, dtype=np.int32),
+            np.ascontiguousarray(sparse.indices, dtype=np.int32),
+        )
+
     @lazyproperty
     def neighbor_matrix_where(self):
         """
@@ -455,6 +519,7 @@ class CameraGeometry:
         self.pix_y = rotated[1] * self.pix_x.unit
         self.pix_rotation -= Angle(angle)
         self.cam_rotation -= Angle(angle)
+        self._clear_position_cache()
 
     def info(self, printer=print):
         """ print detailed info about this camera """
@@ -499,8 +564,8 @@ class CameraGeometry:
 
         return cls(cam_id=-1,
                    pix_id=ids,
-                   pix_x=xx * u.m,
-                   pix_y=yy * u.m,
+                   pix_x=xx,
+                   pix_y=yy,
                    pix_area=(2 * rr) ** 2,
                    neighbors=None,
                    pix_type='rectangular')
@@ -518,6 +583,10 @@ class CameraGeometry:
         -------
         mask: array
             A boolean mask, True if pixel is in the border of the specified width
+
+        Notes
+        -----
+        The masks are cached per width and the cache is cleared by `rotate`.
         '''
         if width in self.border_cache:
             return self.border_cache[width]
@@ -527,23 +596,29 @@ class CameraGeometry:
             max_neighbors = n_neighbors.max()
             mask = n_neighbors < max_neighbors
         else:
-            n = self.neighbor_matrix
-            mask = (n & self.get_border_pixel_mask(width - 1)).any(axis=1)
+            # pixels with any neighbor in the border of width - 1
+            inner_border = self.get_border_pixel_mask(width - 1)
+            mask = self.neighbor_matrix_sparse.dot(inner_border.view(np.byte)) > 0
 
         self.border_cache[width] = mask
         return mask
 
-    def position_to_pix_index(self, x, y):
+    def position_to_pix_index(self, x, y, use_grid=False):
         '''
         Return the index of a camera pixel which contains a given position (x,y)
         in the camera frame. The (x,y) coordinates can be arrays (of equal length),
-        for which the methods returns an array of pixel ids. A warning is raised if the
-        position falls outside the camera.
+        for which the methods returns an array of pixel ids. A warning is raised if
+        positions fall outside the camera.
 
         Parameters
         ----------
         x: astropy.units.Quantity (distance) of horizontal position(s) in the camera frame
         y: astropy.units.Quantity (distance) of vertical position(s) in the camera frame
+        use_grid: bool
+            If True, look up the pixels in a pre-calculated raster of the
+            camera (see `CameraGeometry.pixel_lookup_grid`) and query the
+            kdtree only for the positions close to pixel edges. The result
+            is the same, but faster for large numbers of positions.
 
         Returns
         -------
@@ -554,54 +629,148 @@ class CameraGeometry:
         if not self._all_pixel_areas_equal:
             logger.warning(" Method not implemented for cameras with varying pixel sizes")
 
-        points_searched = np.dstack([x.to_value(u.m), y.to_value(u.m)])
+        points = np.column_stack([
+            np.ravel(x.to_value(u.m)),
+            np.ravel(y.to_value(u.m)),
+        ])
+
+        if use_grid:
+            pix_indices = self._grid_pixel_index(points)
+        else:
+            pix_indices = self._pixel_index(points)
+
+        n_outside = np.count_nonzero(pix_indices == -1)
+        if n_outside > 0:
+            logger.warning(
+                " {} of {} coordinates lie outside camera".format(
+                    n_outside, len(pix_indices)
+                )
+            )
+
+        return pix_indices if len(pix_indices) > 1 else pix_indices[0]
+
+    def _pixel_index(self, points):
+        """
+        Pixel index for unit-free positions in meters with shape (n, 2),
+        -1 for positions outside of the camera.
+        """
         circum_rad = self._pixel_circumferences[0].to_value(u.m)
         kdtree = self._kdtree
-        dist, pix_indices = kdtree.query(points_searched, distance_upper_bound=circum_rad)
-        del dist
-        pix_indices = pix_indices.flatten()
+        _, pix_indices = kdtree.query(points, distance_upper_bound=circum_rad)
 
         # 1. Mark all points outside pixel circumeference as lying outside camera
         pix_indices[pix_indices == self.n_pixels] = -1
 
         # 2. Accurate check for the remaing cases (within circumference, but still outside
-        # camera). It is first checked if any border pixel numbers are returned.
-        # If not, everything is fine. If yes, the distance of the given position to the
-        # the given position to the closest pixel center is translated to the distance to
-        # the center of a non-border pixel', pos -> pos', and it is checked whether pos'
-        # still lies within pixel'. If not, pos lies outside the camera. This approach
-        # does not need to know the particular pixel shape, but as the kdtree itself,
-        # presumes all camera pixels being of equal size.
+        # camera). Positions in a border pixel are translated by the distance
+        # between the border pixel and the closest non-border pixel', pos -> pos',
+        # and it is checked whether pos' still lies within pixel'. If not, pos lies
+        # outside the camera. This approach does not need to know the particular
+        # pixel shape, but as the kdtree itself, presumes all camera pixels being of
+        # equal size. All positions in border pixels are checked with a single query.
         border_mask = self.get_border_pixel_mask()
-        # get all pixels at camera border:
-        borderpix_indices = np.where(border_mask)[0]
-        borderpix_indices_in_list = np.intersect1d(borderpix_indices, pix_indices)
-        if borderpix_indices_in_list.any():
-            # Get some pixel not at the border:
-            insidepix_index = np.where(~border_mask)[0][0]
-            # Check in detail whether location is in border pixel or outside camera:
-            for borderpix_index in borderpix_indices_in_list:
-                index = np.where(pix_indices == borderpix_index)[0][0]
-                # compare with inside pixel:
-                xprime = (points_searched[0][index, 0]
-                          - self.pix_x[borderpix_index].to_value(u.m)
-                          + self.pix_x[insidepix_index].to_value(u.m))
-                yprime = (points_searched[0][index, 1]
-                          - self.pix_y[borderpix_index].to_value(u.m)
-                          + self.pix_y[insidepix_index].to_value(u.m))
-                dist_check, index_check = kdtree.query([xprime, yprime],
-                                                       distance_upper_bound=circum_rad)
-                del dist_check
-                if index_check != insidepix_index:
-                    pix_indices[index] = -1
-
-        # print warning:
-        for index in np.where(pix_indices == -1)[0]:
-            logger.warning(" Coordinate ({} m, {} m) lies outside camera"
-                           .format(points_searched[0][index, 0],
-                                   points_searched[0][index, 1]))
+        in_border = np.flatnonzero(border_mask[pix_indices] & (pix_indices >= 0))
+        if len(in_border) > 0:
+            border_pixels = pix_indices[in_border]
+            inner_pixels = self._nearest_inner_pixel[border_pixels]
+            centers = self._pixel_centers
+            translated = (
+                points[in_border] - centers[border_pixels] + centers[inner_pixels]
+            )
+            _, index_check = kdtree.query(
+                translated, distance_upper_bound=circum_rad
+            )
+            pix_indices[in_border[index_check != inner_pixels]] = -1
+
+        return pix_indices
+
+    #: number of grid cells per pixel diameter of `pixel_lookup_grid`
+    lookup_grid_oversampling = 20
 
-        return pix_indices if len(pix_indices) > 1 else pix_indices[0]
+    @lazyproperty
+    def pixel_lookup_grid(self):
+        """
+        Pre-calculated raster of the camera for constant time look up of
+        the pixel containing a position, used by
+        ``position_to_pix_index(x, y, use_grid=True)``.
+
+        The pixel of a grid cell is the pixel containing all its corners,
+        as the pixels are convex, it then contains the whole cell. Cells
+        crossing a pixel edge, and cells outside of the camera close to
+        it, into which the corner of a pixel can reach, are marked with
+        -2 and positions in them are looked up with the kdtree, so the
+        result is the same as without the grid. The finer the grid (see
+        `lookup_grid_oversampling`), the fewer positions need the kdtree.
+
+        Note this is recalculated if the camera is rotated.
+
+        Returns
+        -------
+        grid: array(int)
+            pixel index of each grid cell, -1 outside the camera and -2 for
+            cells that have to be checked with the kdtree, indexed as
+            ``grid[row, column]`` with rows along y
+        origin: array
+            x and y position of the lower left corner of the grid in meters
+        cell_size: float
+            edge length of the square grid cells in meters
+        """
+        circum_rad = self._pixel_circumferences[0].to_value(u.m)
+        cell_size = 2 * circum_rad / self.lookup_grid_oversampling
+
+        centers = self._pixel_centers
+        origin = centers.min(axis=0) - circum_rad
+        shape = np.ceil(
+            (centers.max(axis=0) + circum_rad - origin) / cell_size
+        ).astype(int)
+
+        corner_x = origin[0] + np.arange(shape[0] + 1) * cell_size
+        corner_y = origin[1] + np.arange(shape[1] + 1) * cell_size
+        grid_x, grid_y = np.meshgrid(corner_x, corner_y)
+        corners = self._pixel_index(
+            np.column_stack([grid_x.ravel(), grid_y.ravel()])
+        ).reshape(grid_x.shape)
+
+        grid = corners[:-1, :-1].copy()
+        same_pixel = (
+            (grid == corners[1:, :-1])
+            & (grid == corners[:-1, 1:])
+            & (grid == corners[1:, 1:])
+        )
+        grid[~same_pixel] = -2
+
+        # the corner of a pixel reaching into a cell without covering any of
+        # its corners covers a grid corner at most two cells away from it
+        n_rows, n_columns = grid.shape
+        in_pixel = np.pad(corners >= 0, 2, mode='constant')
+        near_pixel = np.zeros(grid.shape, dtype=bool)
+        for row in range(6):
+            for column in range(6):
+                near_pixel |= in_pixel[row:row + n_rows, column:column + n_columns]
+        grid[(grid == -1) & near_pixel] = -2
+
+        return grid, origin, cell_size
+
+    def _grid_pixel_index(self, points):
+        """
+        Pixel index for unit-free positions in meters with shape (n, 2)
+        looked up in `pixel_lookup_grid`
+        """
+        grid, origin, cell_size = self.pixel_lookup_grid
+        cells = np.floor((points - origin) / cell_size).astype(int)
+        column, row = cells[:, 0], cells[:, 1]
+
+        inside = (
+            (column >= 0) & (column < grid.shape[1])
+            & (row >= 0) & (row < grid.shape[0])
+        )
+        pix_indices = np.full(len(points), -1, dtype=grid.dtype)
+        pix_indices[inside] = grid[row[inside], column[inside]]
+
+        ambiguous = np.flatnonzero(pix_indices == -2)
+        if len(ambiguous) > 0:
+            pix_indices[ambiguous] = self._pixel_index(points[ambiguous])
+        return pix_indices
 
 
 # ======================================================================
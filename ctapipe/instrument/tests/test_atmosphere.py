@@ -0,0 +1,32 @@
+import numpy as np
+from numpy.testing import assert_allclose
+
+from ctapipe.instrument.atmosphere import (
+    AtmosphereProfile,
+    get_atmosphere_profile,
+)
+
+
+def test_atmosphere_profile_lookup():
+    altitude = np.linspace(0, 100e3, 101)
+    thickness = 1030 * np.exp(-altitude / 8000)
+    profile = AtmosphereProfile(altitude, thickness)
+
+    test_altitude = np.array([0, 1234.5, 10e3, 55555, 100e3])
+    assert_allclose(profile.thickness(test_altitude),
+                    np.interp(test_altitude, altitude, thickness),
+                    rtol=1e-4)
+
+    test_thickness = profile.thickness(test_altitude)
+    assert_allclose(profile.altitude(test_thickness), test_altitude,
+                    rtol=1e-3, atol=1)
+
+    # scalars work and values outside the profile are clipped
+    assert_allclose(profile.thickness(-100.), thickness[0])
+    assert_allclose(profile.thickness(200e3), thickness[-1])
+
+
+def test_get_atmosphere_profile():
+    profile = get_atmosphere_profile('paranal')
+    assert get_atmosphere_profile('paranal') is profile
+    assert profile.thickness(0) > profile.thickness(10000)
@@ -1,4 +1,5 @@
 import numpy as np
+from numpy.testing import assert_allclose
 from astropy import units as u
 from ctapipe.instrument import CameraGeometry
 from ctapipe.instrument.camera import (
@@ -61,6 +62,90 @@ def test_position_to_pix_index():
     assert pix_id == 1790
 
 
+def test_position_to_pix_index_rotated():
+    geom = CameraGeometry.make_rectangular(10, 10)
+    x, y = geom.pix_x[23], geom.pix_y[23]
+    assert geom.position_to_pix_index(x, y) == 23
+
+    # border pixel and a position outside of the camera
+    assert geom.position_to_pix_index(geom.pix_x[0], geom.pix_y[0]) == 0
+    assert geom.position_to_pix_index(-0.6 * u.m, -0.6 * u.m) == -1
+
+    geom.rotate(30 * u.deg)
+    x, y = geom.pix_x[23], geom.pix_y[23]
+    assert geom.position_to_pix_index(x, y) == 23
+
+
+def test_position_to_pix_index_many():
+    geom = CameraGeometry.make_rectangular(10, 10)
+    spacing = 1 / 9
+    rng = np.random.RandomState(0)
+    x, y = rng.uniform(-0.7, 0.7, size=(2, 10000))
+
+    # for the rectangular camera, the pixel can be calculated directly
+    column = np.round((x + 0.5) / spacing).astype(int)
+    row = np.round((y + 0.5) / spacing).astype(int)
+    inside = (column >= 0) & (column < 10) & (row >= 0) & (row < 10)
+    expected = np.where(inside, row * 10 + column, -1)
+
+    pix_indices = geom.position_to_pix_index(x * u.m, y * u.m)
+    assert (pix_indices == expected).all()
+
+    # the grid gives the same result, also close to the pixel edges
+    grid_indices = geom.position_to_pix_index(x * u.m, y * u.m, use_grid=True)
+    assert (grid_indices == expected).all()
+
+    edge_x = (np.arange(-5, 6) - 0.5) * spacing + 1e-6
+    edge_y = rng.uniform(-0.7, 0.7, size=len(edge_x))
+    assert (
+        geom.position_to_pix_index(edge_x * u.m, edge_y * u.m, use_grid=True)
+        == geom.position_to_pix_index(edge_x * u.m, edge_y * u.m)
+    ).all()
+
+
+def test_pixel_lookup_grid_hexagonal():
+    """ the grid look up equals the kdtree also for hexagonal pixels """
+    spacing = 0.05
+    i, j = np.meshgrid(np.arange(-10, 11), np.arange(-10, 11))
+    pix_x = spacing * (i + 0.5 * j).ravel()
+    pix_y = spacing * np.sqrt(3) / 2 * j.ravel()
+    in_camera = np.hypot(pix_x, pix_y) < 0.4
+    pix_x, pix_y = pix_x[in_camera], pix_y[in_camera]
+    geom = CameraGeometry(
+        cam_id='hex', pix_id=np.arange(len(pix_x)),
+        pix_x=pix_x * u.m, pix_y=pix_y * u.m,
+        pix_area=np.full(len(pix_x), np.sqrt(3) / 2 * spacing**2) * u.m**2,
+        pix_type='hexagonal',
+    )
+
+    rng = np.random.RandomState(0)
+    x, y = rng.uniform(-0.5, 0.5, size=(2, 100000))
+    assert (
+        geom.position_to_pix_index(x * u.m, y * u.m, use_grid=True)
+        == geom.position_to_pix_index(x * u.m, y * u.m)
+    ).all()
+
+
+def test_derived_cache_rotate():
+    geom = CameraGeometry.make_rectangular(10, 10)
+
+    border = geom.get_border_pixel_mask(2)
+    assert geom.get_border_pixel_mask(2) is border
+    assert np.count_nonzero(geom.get_border_pixel_mask(1)) == 36
+    assert np.count_nonzero(border) == 36 + 28
+
+    # border pixels map to the closest inner pixel, inner pixels to themselves
+    assert geom._nearest_inner_pixel[0] == 11
+    assert geom._nearest_inner_pixel[11] == 11
+
+    kdtree = geom._kdtree
+    geom.rotate(90 * u.deg)
+    assert geom._kdtree is not kdtree
+    assert_allclose(geom._kdtree.data[:, 0], geom.pix_x.to_value(u.m))
+    assert geom.get_border_pixel_mask(2) is not border
+    assert (geom.get_border_pixel_mask(2) == border).all()
+
+
 def test_get_min_pixel_seperation():
     x, y = np.meshgrid(np.linspace(-5, 5, 5), np.linspace(-5, 5, 5))
     pixsep = _get_min_pixel_seperation(x.ravel(), y.ravel())
@@ -143,6 +228,10 @@ def test_precal_neighbors():
     nmat = geom.neighbor_matrix
     assert nmat.shape == (len(geom.pix_x), len(geom.pix_x))
 
+    indptr, indices = geom.neighbor_adjacency
+    assert list(indptr) == [0, 1, 3, 4]
+    assert list(indices) == [1, 0, 2, 1]
+
 
 def test_slicing():
     geom = CameraGeometry.from_name("NectarCam")
@@ -1,17 +1,9 @@
-from .array import get_array_layout
-from .eventseeker import EventSeeker
-from .eventsource import EventSource, event_source
-from .simteleventsource import SimTelEventSource
-from .hdf5tableio import HDF5TableReader, HDF5TableWriter
-from .tableio import TableWriter, TableReader
-
-from ctapipe.core.plugins import detect_and_import_io_plugins
-
-detect_and_import_io_plugins()
+from ..utils.lazy import lazy_import_attributes
 
 __all__ = [
     'get_array_layout',
     'SimTelEventSource',
+    'ToyEventSource',
     'HDF5TableWriter',
     'HDF5TableReader',
     'TableWriter',
@@ -20,3 +12,18 @@ __all__ = [
     'EventSource',
     'event_source',
 ]
+
+# the submodules are only imported on first access, io plugins are
+# detected when an EventSource is looked up, see `EventSource.from_url`
+lazy_import_attributes(__name__, {
+    'get_array_layout': '.array',
+    'EventSeeker': '.eventseeker',
+    'EventSource': '.eventsource',
+    'event_source': '.eventsource',
+    'SimTelEventSource': '.simteleventsource',
+    'ToyEventSource': '.toyeventsource',
+    'HDF5TableReader': '.hdf5tableio',
+    'HDF5TableWriter': '.hdf5tableio',
+    'TableWriter': '.tableio',
+    'TableReader': '.tableio',
+})
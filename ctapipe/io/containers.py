@@ -44,6 +44,7 @@ __all__ = [
     'LeakageContainer',
     'ConcentrationContainer',
     'TimingParametersContainer',
+    'ImageParametersContainer',
 ]
 
 
@@ -803,3 +804,13 @@ class TimingParametersContainer(Container):
     """
     slope = Field(nan, 'Slope of arrival times along main shower axis')
     intercept = Field(nan, 'intercept of arrival times along main shower axis')
+
+
+class ImageParametersContainer(Container):
+    """
+    Collection of the standard DL1 image parameters of one image
+    """
+    hillas = Field(HillasParametersContainer(), 'Hillas parameters')
+    leakage = Field(LeakageContainer(), 'Leakage parameters')
+    concentration = Field(ConcentrationContainer(), 'Concentration parameters')
+    timing = Field(TimingParametersContainer(), 'Timing parameters')
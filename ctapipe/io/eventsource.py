@@ -1,18 +1,92 @@
 """
 Handles reading of different event/waveform containing files
 """
+import gzip
+import os
 from abc import abstractmethod
+from collections import namedtuple
+from functools import lru_cache
+from importlib import import_module
 from os.path import exists
+from time import perf_counter, process_time
 from traitlets import Unicode, Int, Set, TraitError
 from ctapipe.core import Component, non_abstract_children
 from ctapipe.core import Provenance
+from ctapipe.core.instrumentation import Instrumentation, file_size
+from ctapipe.core.plugins import detect_and_import_io_plugins
 from traitlets.config.loader import LazyConfigValue
 
 __all__ = [
     'EventSource',
     'event_source',
+    'FileHeader',
+    'read_file_header',
 ]
 
+#: number of bytes read by `read_file_header`
+HEADER_SIZE = 4096
+
+#: The first bytes of a file, decompressed if it is gzipped
+FileHeader = namedtuple('FileHeader', ['path', 'data', 'compressed'])
+
+# maps (path, modification time, size, candidate classes) to the
+# compatible EventSource found by `EventSource.from_url`
+_compatible_source_cache = {}
+
+# maps a class to its non-abstract subclasses considered by its
+# `from_url`, cleared whenever a new EventSource is defined
+_candidate_classes_cache = {}
+
+# modules defining the EventSources that are considered by
+# `EventSource.from_url` without being imported explicitly
+_DEFAULT_EVENT_SOURCE_MODULES = [
+    'ctapipe.io.simteleventsource',
+]
+
+
+@lru_cache(maxsize=256)
+def _read_file_header(path, mtime, size, n_bytes):
+    with open(path, 'rb') as f:
+        data = f.read(n_bytes)
+
+    compressed = data[:2] == b'\x1f\x8b'
+    if compressed:
+        with gzip.open(path, 'rb') as f:
+            data = f.read(n_bytes)
+
+    return FileHeader(path=path, data=data, compressed=compressed)
+
+
+def read_file_header(file_path, n_bytes=HEADER_SIZE):
+    """
+    Read the first bytes of a file, for gzipped files the first bytes
+    of the uncompressed content.
+
+    The result is cached, as long as the file does not change, it is
+    only read once.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the file
+    n_bytes : int
+        number of bytes to read
+
+    Returns
+    -------
+    FileHeader
+    """
+    path = os.path.abspath(file_path)
+    stat = os.stat(path)
+    return _read_file_header(path, stat.st_mtime_ns, stat.st_size, n_bytes)
+
+
+def _import_event_sources():
+    """import the default EventSources and the io plugins"""
+    for module in _DEFAULT_EVENT_SOURCE_MODULES:
+        import_module(module)
+    detect_and_import_io_plugins()
+
 
 def event_source(input_url, **kwargs):
     """
@@ -123,6 +197,11 @@ class EventSource(Component):
               'will be included')
     ).tag(config=True)
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # the new class is a candidate of from_url
+        _candidate_classes_cache.clear()
+
     def __init__(self, config=None, tool=None, **kwargs):
         """
         Class to handle generic input files. Enables obtaining the "source"
@@ -175,6 +254,28 @@ class EventSource(Component):
             True if file is compatible, False if it is incompatible
         """
 
+    @classmethod
+    def is_compatible_header(cls, header):
+        """
+        Quick check of the compatibility using only the first bytes of the
+        file, used by `from_url` before calling `is_compatible`.
+
+        Child classes which can decide from e.g. magic bytes or the file
+        extension should override this, the default is undecided.
+
+        Parameters
+        ----------
+        header : FileHeader
+            The first `HEADER_SIZE` bytes of the file, see `read_file_header`
+
+        Returns
+        -------
+        compatible : bool or None
+            True if the file is compatible, False if it is incompatible,
+            None if `is_compatible` has to be called
+        """
+        return None
+
     @property
     def is_stream(self):
         """
@@ -211,11 +312,48 @@ class EventSource(Component):
         -------
         generator
         """
+        instrumentation = Instrumentation()
+        if instrumentation.enabled:
+            yield from self._instrumented_iter(instrumentation)
+            return
+
         for event in self._generator():
             yield event
             if self.max_events and event.count >= self.max_events - 1:
                 break
 
+    def _instrumented_iter(self, instrumentation):
+        """
+        `__iter__` recording the time needed to read each event and the
+        size of the input file as stage ``<ClassName>.read``.
+
+        The number of bytes consumed is not known to the generic event
+        sources, so the file size is only booked if the file was read
+        to the end, not if the iteration stopped early, e.g. at
+        `max_events`.
+        """
+        stage = f'{self.__class__.__name__}.read'
+        generator = self._generator()
+        try:
+            while True:
+                wall_start = perf_counter()
+                cpu_start = process_time()
+                try:
+                    event = next(generator)
+                except StopIteration:
+                    instrumentation.add_bytes(stage, file_size(self.input_url))
+                    break
+                instrumentation.record(
+                    stage,
+                    perf_counter() - wall_start,
+                    process_time() - cpu_start,
+                )
+                yield event
+                if self.max_events and event.count >= self.max_events - 1:
+                    break
+        finally:
+            generator.close()
+
     def __enter__(self):
         return self
 
@@ -239,12 +377,17 @@ class EventSource(Component):
         -------
         instance
             Instance of a compatible EventSource subclass
+
+        The file header is read only once and given to the
+        `is_compatible_header` method of all candidates, `is_compatible`
+        is only called for candidates that cannot decide from the header.
+        The compatible class is cached per file.
         """
-        available_classes = non_abstract_children(cls)
+        available_classes = cls._candidate_classes()
 
-        for subcls in available_classes:
-            if subcls.is_compatible(input_url):
-                return subcls(input_url=input_url, **kwargs)
+        subcls = cls._find_compatible_class(input_url, available_classes)
+        if subcls is not None:
+            return subcls(input_url=input_url, **kwargs)
 
         raise ValueError(
             'Cannot find compatible EventSource for \n'
@@ -253,6 +396,48 @@ class EventSource(Component):
             '\t{}'.format(input_url, [c.__name__ for c in available_classes])
         )
 
+    @classmethod
+    def _candidate_classes(cls):
+        """non-abstract subclasses of cls, including those of the default
+        modules and io plugins, cached until a new EventSource is defined"""
+        candidates = _candidate_classes_cache.get(cls)
+        if candidates is None:
+            _import_event_sources()
+            candidates = tuple(non_abstract_children(cls))
+            _candidate_classes_cache[cls] = candidates
+        return candidates
+
+    @staticmethod
+    def _find_compatible_class(input_url, available_classes):
+        """first class in available_classes compatible with input_url"""
+        if not os.path.isfile(input_url):
+            # not a file (e.g. missing or a stream), ask every class
+            for subcls in available_classes:
+                if subcls.is_compatible(input_url):
+                    return subcls
+            return None
+
+        path = os.path.abspath(input_url)
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size, available_classes)
+        if key in _compatible_source_cache:
+            return _compatible_source_cache[key]
+
+        header = read_file_header(path)
+        compatible_class = None
+        for subcls in available_classes:
+            compatible = subcls.is_compatible_header(header)
+            if compatible is None:
+                compatible = subcls.is_compatible(input_url)
+            if compatible:
+                compatible_class = subcls
+                break
+
+        if len(_compatible_source_cache) >= 1024:
+            _compatible_source_cache.clear()
+        _compatible_source_cache[key] = compatible_class
+        return compatible_class
+
     @classmethod
     def from_config(cls, config, **kwargs):
         """
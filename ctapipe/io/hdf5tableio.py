@@ -8,6 +8,7 @@ from astropy.units import Quantity
 import ctapipe
 from .tableio import TableWriter, TableReader
 from ..core import Container
+from ..core.instrumentation import Instrumentation, file_size, instrumented
 
 __all__ = [
     'HDF5TableWriter',
@@ -114,6 +115,9 @@ class HDF5TableWriter(TableWriter):
     def close(self):
 
         self._h5file.close()
+        Instrumentation().add_bytes(
+            'HDF5TableWriter.write', file_size(self._h5file.filename)
+        )
 
     def _create_hdf5_table_schema(self, table_name, containers):
         """
@@ -236,6 +240,7 @@ class HDF5TableWriter(TableWriter):
                 row[colname] = value
         row.append()
 
+    @instrumented()
     def write(self, table_name, containers):
         """
         Write the contents of the given container or containers to a table.
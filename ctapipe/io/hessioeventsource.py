@@ -42,6 +42,10 @@ class HESSIOEventSource(EventSource):
         '''This class should never be chosen in event_source()'''
         return False
 
+    @classmethod
+    def is_compatible_header(cls, header):
+        return False
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         HESSIOEventSource._count -= 1
         self.pyhessio.close_file()
@@ -154,6 +154,12 @@ class LSTEventSource(EventSource):
         is_lst_file = 'lstcam_counters' in ttypes
         return is_protobuf_zfits_file & is_lst_file
 
+    @classmethod
+    def is_compatible_header(cls, header):
+        from .sst1meventsource import is_fits_header
+        # only FITS files need the full check
+        return None if is_fits_header(header) else False
+
     def fill_lst_service_container_from_zfile(self):
 
         self.data.lst.tels_with_data = [self.camera_config.telescope_id, ]
@@ -150,6 +150,12 @@ class NectarCAMEventSource(EventSource):
         is_nectarcam_file = 'nectarcam_counters' in ttypes
         return is_protobuf_zfits_file & is_nectarcam_file
 
+    @classmethod
+    def is_compatible_header(cls, header):
+        from .sst1meventsource import is_fits_header
+        # only FITS files need the full check
+        return None if is_fits_header(header) else False
+
     def fill_nectarcam_service_container_from_zfile(self):
 
         self.data.nectarcam.tels_with_data = [self.camera_config.telescope_id, ]
@@ -1,13 +1,12 @@
 import warnings
 import numpy as np
-from ctapipe.io.eventsource import EventSource
+from ctapipe.io.eventsource import EventSource, read_file_header
 from ctapipe.io.containers import DataContainer
 from astropy import units as u
 from astropy.coordinates import Angle
 from astropy.time import Time
 from ctapipe.instrument import TelescopeDescription, SubarrayDescription
 import struct
-import gzip
 
 from eventio.simtel.simtelfile import SimTelFile
 
@@ -74,17 +73,14 @@ class SimTelEventSource(EventSource):
 
     @staticmethod
     def is_compatible(file_path):
-        # read the first 4 bytes
-        with open(file_path, 'rb') as f:
-            marker_bytes = f.read(4)
-
-        # if file is gzip, read the first 4 bytes with gzip again
-        if marker_bytes[0] == 0x1f and marker_bytes[1] == 0x8b:
-            with gzip.open(file_path, 'rb') as f:
-                marker_bytes = f.read(4)
-
-        # check for the simtel magic marker
-        int_marker, = struct.unpack('I', marker_bytes)
+        return SimTelEventSource.is_compatible_header(read_file_header(file_path))
+
+    @classmethod
+    def is_compatible_header(cls, header):
+        # check for the simtel magic marker in the first 4 bytes
+        if len(header.data) < 4:
+            return False
+        int_marker, = struct.unpack('I', header.data[:4])
         return int_marker == 3558836791 or int_marker == 931798996
 
     def _generator(self):
@@ -4,9 +4,8 @@ EventSource for SST1M/digicam protobuf-fits.fz-files.
 
 Needs protozfits v1.0.2 from github.com/cta-sst-1m/protozfitsreader
 """
-import gzip
 import numpy as np
-from .eventsource import EventSource
+from .eventsource import EventSource, read_file_header
 from .containers import SST1MDataContainer
 from ..instrument import TelescopeDescription
 
@@ -19,16 +18,16 @@ def is_fits_in_header(file_path):
     by looking into the first 1024 bytes and searching for the string "FITS"
     typically used in is_compatible
     '''
-    # read the first 1kB
-    with open(file_path, 'rb') as f:
-        marker_bytes = f.read(1024)
+    return is_fits_header(read_file_header(file_path))
 
-    # if file is gzip, read the first 4 bytes with gzip again
-    if marker_bytes[0] == 0x1f and marker_bytes[1] == 0x8b:
-        with gzip.open(file_path, 'rb') as f:
-            marker_bytes = f.read(1024)
 
-    return b'FITS' in marker_bytes
+def is_fits_header(header):
+    '''quick check if a `ctapipe.io.eventsource.FileHeader` is from a FITS file
+
+    typically used in is_compatible_header, FITS files still have to be
+    checked with is_compatible
+    '''
+    return b'FITS' in header.data[:1024]
 
 
 class SST1MEventSource(EventSource):
@@ -121,3 +120,8 @@ class SST1MEventSource(EventSource):
         is_sst1m_file = 'trigger_input_traces' in ttypes
 
         return is_protobuf_zfits_file & is_sst1m_file
+
+    @classmethod
+    def is_compatible_header(cls, header):
+        # only FITS files need the full check
+        return None if is_fits_header(header) else False
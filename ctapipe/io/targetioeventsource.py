@@ -118,6 +118,10 @@ class TargetIOEventSource(EventSource):
     def is_compatible(file_path):
         return file_path.endswith('.tio')
 
+    @classmethod
+    def is_compatible_header(cls, header):
+        return cls.is_compatible(header.path)
+
     def _init_container(self):
         """
         Prepare the ctapipe event container, and fill it with the information
@@ -1,6 +1,18 @@
+import gc
+import gzip
+import struct
+
 import pytest
+from ctapipe.core import non_abstract_children
 from ctapipe.utils import get_dataset_path
-from ctapipe.io.eventsource import EventSource
+from ctapipe.io.eventsource import (
+    EventSource,
+    HEADER_SIZE,
+    _candidate_classes_cache,
+    _compatible_source_cache,
+    event_source,
+    read_file_header,
+)
 
 
 def test_construct():
@@ -32,3 +44,87 @@ def test_is_iterable():
     test_reader = DummyReader(input_url=dataset)
     for _ in test_reader:
         pass
+
+
+def test_read_file_header(tmp_path):
+    path = tmp_path / 'test.dat'
+    path.write_bytes(b'HEADERSOURCE' + bytes(10000))
+    header = read_file_header(str(path))
+    assert header.data.startswith(b'HEADERSOURCE')
+    assert len(header.data) == HEADER_SIZE
+    assert not header.compressed
+
+    gz_path = tmp_path / 'test.dat.gz'
+    with gzip.open(gz_path, 'wb') as f:
+        f.write(b'HEADERSOURCE')
+    header = read_file_header(str(gz_path))
+    assert header.data == b'HEADERSOURCE'
+    assert header.compressed
+
+
+def test_from_url_header_sniff(tmp_path):
+    fallback_calls = []
+
+    class HeaderSource(DummyReader):
+        """
+        EventSource deciding on the magic bytes only
+        """
+
+        @classmethod
+        def is_compatible_header(cls, header):
+            return header.data.startswith(b'HEADERSOURCE')
+
+        @staticmethod
+        def is_compatible(file_path):
+            raise AssertionError('is_compatible should not be called')
+
+    try:
+        path = tmp_path / 'test.dat'
+        path.write_bytes(b'HEADERSOURCE' + bytes(100))
+        assert isinstance(event_source(str(path)), HeaderSource)
+
+        path = tmp_path / 'test.fallback'
+        path.write_bytes(bytes(100))
+        with pytest.raises(ValueError):
+            event_source(str(path))
+
+        # defining a new EventSource makes it a candidate of from_url
+        class FallbackSource(DummyReader):
+            """
+            EventSource that can only decide with is_compatible
+            """
+
+            @staticmethod
+            def is_compatible(file_path):
+                fallback_calls.append(file_path)
+                return file_path.endswith('.fallback')
+
+        assert isinstance(event_source(str(path)), FallbackSource)
+        assert len(fallback_calls) == 1
+
+        # the compatible class is cached per file
+        assert isinstance(event_source(str(path)), FallbackSource)
+        assert len(fallback_calls) == 1
+    finally:
+        # unregister the test sources, so they are not asked by other tests
+        HeaderSource = FallbackSource = None
+        _candidate_classes_cache.clear()
+        _compatible_source_cache.clear()
+        gc.collect()
+
+    names = [cls.__name__ for cls in non_abstract_children(EventSource)]
+    assert 'HeaderSource' not in names
+    assert 'FallbackSource' not in names
+
+
+def test_simtel_is_compatible(tmp_path):
+    from ctapipe.io.simteleventsource import SimTelEventSource
+
+    path = tmp_path / 'test.simtel.gz'
+    with gzip.open(path, 'wb') as f:
+        f.write(struct.pack('I', 3558836791) + bytes(100))
+    assert SimTelEventSource.is_compatible(str(path))
+
+    path = tmp_path / 'empty.simtel'
+    path.write_bytes(b'')
+    assert not SimTelEventSource.is_compatible(str(path))
@@ -0,0 +1,61 @@
+import numpy as np
+
+from ctapipe.calib import CameraCalibrator
+from ctapipe.io import ToyEventSource
+
+
+def test_waveforms():
+    source = ToyEventSource(max_events=20, n_telescopes=6, n_samples=30)
+
+    n_events = 0
+    for event in source:
+        n_events += 1
+        assert 1 <= len(event.r0.tels_with_data) <= 6
+        assert set(event.r0.tel) == event.r0.tels_with_data
+        for tel_id in event.r0.tels_with_data:
+            waveform = event.r0.tel[tel_id].waveform
+            assert waveform.shape == (1, 1600, 30)
+            assert waveform.dtype == np.uint16
+            # pedestal of 400 adc counts per sample
+            assert 350 < np.median(waveform) < 450
+
+    assert n_events == 20
+
+
+def test_deterministic():
+    source = ToyEventSource(max_events=5, seed=42)
+    first = [
+        {tel_id: tel.waveform.copy() for tel_id, tel in event.r0.tel.items()}
+        for event in source
+    ]
+    second = [
+        {tel_id: tel.waveform.copy() for tel_id, tel in event.r0.tel.items()}
+        for event in ToyEventSource(max_events=5, seed=42)
+    ]
+
+    for a, b in zip(first, second):
+        assert a.keys() == b.keys()
+        for tel_id in a:
+            assert np.all(a[tel_id] == b[tel_id])
+
+
+def test_multiplicity():
+    source = ToyEventSource(
+        max_events=200, n_telescopes=20, mean_multiplicity=5
+    )
+    multiplicities = [len(event.r0.tels_with_data) for event in source]
+    assert 4 < np.mean(multiplicities) < 6
+
+
+def test_calibration():
+    source = ToyEventSource(max_events=5, nsb_level=0, electronic_noise=0)
+    calibrator = CameraCalibrator(r1_product='HESSIOR1Calibrator')
+
+    for event in source:
+        calibrator.calibrate(event)
+        for tel_id in event.r0.tels_with_data:
+            image = event.dl1.tel[tel_id].image[0]
+            true_image = event.mc.tel[tel_id].photo_electron_image
+            total = true_image.sum()
+            if total > 100:
+                assert np.isclose(image.sum(), total, rtol=0.2)
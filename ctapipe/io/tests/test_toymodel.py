@@ -0,0 +1,20 @@
+import numpy as np
+
+from ctapipe.instrument import CameraGeometry
+from ctapipe.io.toymodel import toymodel_event_source
+
+
+def test_toymodel_event_source():
+    np.random.seed(0)
+    geoms = [CameraGeometry.make_rectangular(20, 20)] * 3
+
+    n_events = 0
+    for event in toymodel_event_source(geoms, max_events=10, n_channels=2,
+                                       n_samples=30, p_trigger=1.0):
+        n_events += 1
+        for tel_id in event.r0.tels_with_data:
+            r0 = event.r0.tel[tel_id]
+            assert r0.waveform.shape == (2, 400, 30)
+            assert r0.image.shape == (2, 400)
+
+    assert n_events == 10
@@ -0,0 +1,369 @@
+"""
+Synthetic event source producing R0 waveforms at a high rate, for load
+testing the calibration and reconstruction without data files.
+"""
+import astropy.units as u
+import numpy as np
+from astropy.coordinates import Angle
+from traitlets import Float, Int
+
+from ..core import Component
+from ..instrument import (
+    CameraGeometry,
+    OpticsDescription,
+    SubarrayDescription,
+    TelescopeDescription,
+)
+from .containers import DataContainer
+from .eventsource import EventSource
+
+__all__ = ['ToyEventSource']
+
+# sub-sample resolution of the pulse arrival times
+PULSE_OVERSAMPLING = 10
+
+
+def _make_default_subarray(n_telescopes, spacing=100 * u.m):
+    """ ``n_telescopes`` MSTs with rectangular cameras on a square grid """
+    optics = OpticsDescription(
+        mirror_type='DC', tel_type='MST', tel_subtype='',
+        equivalent_focal_length=16 * u.m,
+    )
+    camera = CameraGeometry.make_rectangular(40, 40, (-1, 1), (-1, 1))
+    n_rows = int(np.ceil(np.sqrt(n_telescopes)))
+
+    tel_ids = range(1, n_telescopes + 1)
+    return SubarrayDescription(
+        'ToyArray',
+        tel_positions={
+            tel_id: u.Quantity([
+                (tel_id - 1) // n_rows * spacing,
+                (tel_id - 1) % n_rows * spacing,
+                0 * u.m,
+            ])
+            for tel_id in tel_ids
+        },
+        tel_descriptions={
+            tel_id: TelescopeDescription(optics, camera) for tel_id in tel_ids
+        },
+    )
+
+
+class _CameraGroup:
+    """
+    Precomputed quantities and preallocated buffers of all telescopes of
+    the subarray with the same camera type
+    """
+
+    def __init__(self, tel_ids, geom, n_samples, pedestal, noise_std, rng):
+        self.tel_ids = np.array(sorted(tel_ids))
+        self.pix_x = geom.pix_x.to_value(u.m)
+        self.pix_y = geom.pix_y.to_value(u.m)
+        self.pix_area = geom.pix_area.to_value(u.m**2)
+        self.pixel_width = np.sqrt(np.median(self.pix_area))
+        self.radius = np.max(np.hypot(self.pix_x, self.pix_y))
+        self.n_pixels = len(self.pix_x)
+
+        # one waveform buffer for all telescopes, reused for every event,
+        # the waveform of each telescope is a view of its row
+        self.buffer = np.empty(
+            (len(self.tel_ids), self.n_pixels, n_samples), dtype=np.uint16
+        )
+        self.waveforms = {
+            tel_id: self.buffer[i:i + 1] for i, tel_id in enumerate(self.tel_ids)
+        }
+
+        # the noise of each telescope event is a random slice of this
+        # bank, with the pedestal already added, drawn once
+        self.n_values = self.n_pixels * n_samples
+        bank = rng.normal(pedestal, noise_std, 4 * self.n_values)
+        self.noise_bank = np.clip(np.round(bank), 0, 2**16 - 1).astype(np.uint16)
+
+
+class ToyEventSource(EventSource):
+    """
+    Event source generating simulated R0 events of a subarray without any
+    input file.
+
+    For each event, a random number of telescopes around
+    ``mean_multiplicity`` is triggered. Each of them sees a 2D gaussian
+    shower image, whose photo electrons are turned into gaussian pulses
+    at arrival times increasing along the shower axis, on top of a
+    pedestal, night sky background and electronic noise. The true
+    photo electron images and the MC shower parameters are filled into
+    ``event.mc``, the pedestal and gain into ``event.mc.tel``, so the
+    events can be calibrated with the `~ctapipe.calib.CameraCalibrator`
+    like sim_telarray events.
+
+    The generation is vectorized over all triggered telescopes of the
+    same camera type. The waveform arrays of each telescope are
+    allocated only once and overwritten for each event, like the event
+    container itself, so copy them if they have to outlive the event.
+    For speed, the noise of each waveform is a random slice of a noise
+    bank drawn at the start, the noise of different events is therefore
+    not independent.
+
+    The events are the same for each iteration with the same ``seed``.
+
+    Parameters
+    ----------
+    config : traitlets.loader.Config
+        Configuration specified by config file or cmdline arguments.
+        Used to set traitlet values.
+        Set to None if no configuration to pass.
+    tool : ctapipe.core.Tool
+        Tool executable that is calling this component.
+        Passes the correct logger to the component.
+        Set to None if no Tool to pass.
+    subarray : ctapipe.instrument.SubarrayDescription or None
+        The telescopes to simulate, if None, ``n_telescopes`` MSTs with
+        a rectangular camera of 1600 pixels are used.
+    kwargs
+    """
+    max_events = Int(
+        1000,
+        allow_none=True,
+        help='Number of events to generate, None for an infinite stream'
+    ).tag(config=True)
+    seed = Int(0, help='Seed of the random number generator').tag(config=True)
+    n_telescopes = Int(
+        4, help='Number of telescopes if no subarray is given'
+    ).tag(config=True)
+    mean_multiplicity = Float(
+        4.0, help='Mean number of triggered telescopes per event'
+    ).tag(config=True)
+    n_samples = Int(25, help='Number of samples per waveform').tag(config=True)
+    nsb_level = Float(
+        0.1, help='Night sky background in photo electrons per sample'
+    ).tag(config=True)
+    pedestal = Float(
+        400.0, help='Pedestal in ADC counts per sample'
+    ).tag(config=True)
+    gain = Float(
+        10.0, help='ADC counts per photo electron'
+    ).tag(config=True)
+    electronic_noise = Float(
+        2.0, help='Standard deviation of the electronic noise in ADC counts'
+    ).tag(config=True)
+    pulse_width = Float(
+        1.5, help='Standard deviation of the pulse shape in samples'
+    ).tag(config=True)
+    min_energy = Float(0.03, help='Minimum shower energy in TeV').tag(config=True)
+    max_energy = Float(100.0, help='Maximum shower energy in TeV').tag(config=True)
+    spectral_index = Float(
+        -2.0, help='Power law index of the energy spectrum'
+    ).tag(config=True)
+
+    def __init__(self, config=None, tool=None, subarray=None, **kwargs):
+        # there is no input file to check or add to the provenance,
+        # so the initialization of EventSource is skipped
+        Component.__init__(self, config=config, tool=tool, **kwargs)
+        self.metadata = dict(is_simulation=True)
+
+        if subarray is None:
+            subarray = _make_default_subarray(self.n_telescopes)
+        self.subarray = subarray
+
+        # gaussian pulses of unit integral for all arrival times
+        # on the sub-sample grid
+        samples = np.arange(self.n_samples)
+        peak_times = np.arange(self.n_samples * PULSE_OVERSAMPLING) / PULSE_OVERSAMPLING
+        pulses = np.exp(
+            -0.5 * ((samples - peak_times[:, np.newaxis]) / self.pulse_width)**2
+        )
+        self._pulses = pulses / (np.sqrt(2 * np.pi) * self.pulse_width)
+
+    @staticmethod
+    def is_compatible(file_path):
+        return False
+
+    @classmethod
+    def is_compatible_header(cls, header):
+        return False
+
+    def _setup_camera_groups(self, rng):
+        tels_by_camera = {}
+        for tel_id, description in self.subarray.tel.items():
+            geom = description.camera
+            key = (geom.cam_id, geom.n_pixels)
+            tels_by_camera.setdefault(key, (geom, []))[1].append(tel_id)
+
+        # poisson NSB with the same variance as approximation
+        noise_std = np.sqrt(
+            self.nsb_level * self.gain**2 + self.electronic_noise**2
+        )
+        pedestal = self.pedestal + self.nsb_level * self.gain
+        return [
+            _CameraGroup(tel_ids, geom, self.n_samples, pedestal, noise_std, rng)
+            for geom, tel_ids in tels_by_camera.values()
+        ]
+
+    def _generator(self):
+        rng = np.random.RandomState(self.seed)
+        groups = self._setup_camera_groups(rng)
+        tel_ids = np.array(sorted(self.subarray.tel))
+        n_tels = len(tel_ids)
+
+        # lookup tables by telescope id, replacing membership tests per event
+        tel_group = np.full(tel_ids.max() + 1, -1)
+        for group_index, group in enumerate(groups):
+            tel_group[group.tel_ids] = group_index
+        allowed = np.ones(tel_ids.max() + 1, dtype=bool)
+        if len(self.allowed_tels) > 0:
+            allowed[:] = False
+            allowed[[t for t in self.allowed_tels if t <= tel_ids.max()]] = True
+
+        pedestal_sum = (self.pedestal + self.nsb_level * self.gain) * self.n_samples
+        mc_calibration = {}
+        for group in groups:
+            for tel_id in group.tel_ids:
+                mc_calibration[tel_id] = (
+                    np.full((1, group.n_pixels), pedestal_sum),
+                    np.full((1, group.n_pixels), 1 / self.gain),
+                )
+
+        data = DataContainer()
+        data.meta['origin'] = 'hessio'
+        data.meta['input_url'] = self.input_url
+        data.meta['max_events'] = self.max_events
+        data.inst.subarray = self.subarray
+
+        # creating astropy quantities is expensive compared to the rest of
+        # the event generation, so the constant ones are created only once
+        # and the random ones without unit conversions
+        pointing_alt = Angle(70, u.deg)
+        pointing_az = Angle(0, u.deg)
+        pointing_alt_deg = pointing_alt.to_value(u.deg)
+        pointing_az_deg = pointing_az.to_value(u.deg)
+        pointing_alt_rad = pointing_alt.to_value(u.rad)
+        pointing_az_rad = pointing_az.to_value(u.rad)
+        data.mcheader.run_array_direction = Angle(
+            [pointing_az.rad, pointing_alt.rad], u.rad
+        )
+        data.mcheader.energy_range_min = self.min_energy * u.TeV
+        data.mcheader.energy_range_max = self.max_energy * u.TeV
+        data.mcheader.spectral_index = self.spectral_index
+
+        counter = 0
+        while self.max_events is None or counter < self.max_events:
+            n_triggered = np.clip(rng.poisson(self.mean_multiplicity), 1, n_tels)
+            triggered = np.sort(rng.choice(tel_ids, n_triggered, replace=False))
+            triggered = triggered[allowed[triggered]]
+            tels_with_data = set(triggered.tolist())
+
+            energy = self._draw_energy(rng)
+
+            data.count = counter
+            for level in (data.r0, data.r1, data.dl0):
+                level.obs_id = 1
+                level.event_id = counter
+                level.tels_with_data = tels_with_data
+            data.trig.tels_with_trigger = triggered
+
+            data.mc.energy = u.Quantity(energy, u.TeV, copy=False)
+            data.mc.alt = u.Quantity(
+                pointing_alt_deg + rng.normal(0, 0.5), u.deg, copy=False
+            )
+            data.mc.az = u.Quantity(
+                pointing_az_deg + rng.normal(0, 0.5), u.deg, copy=False
+            )
+            data.mc.core_x = u.Quantity(rng.uniform(-500, 500), u.m, copy=False)
+            data.mc.core_y = u.Quantity(rng.uniform(-500, 500), u.m, copy=False)
+
+            # remove the telescopes of the previous event
+            for container in (data.r0.tel, data.mc.tel, data.pointing):
+                for tel_id in set(container) - tels_with_data:
+                    del container[tel_id]
+            data.r1.tel.clear()
+            data.dl0.tel.clear()
+            data.dl1.tel.clear()
+
+            triggered_groups = tel_group[triggered]
+            for group_index, group in enumerate(groups):
+                group_tels = triggered[triggered_groups == group_index]
+                if len(group_tels) > 0:
+                    self._fill_telescopes(data, group, group_tels, energy, rng)
+
+            for tel_id in triggered:
+                pedestal, dc_to_pe = mc_calibration[tel_id]
+                mc = data.mc.tel[tel_id]
+                mc.pedestal = pedestal
+                mc.dc_to_pe = dc_to_pe
+                mc.altitude_raw = pointing_alt_rad
+                mc.azimuth_raw = pointing_az_rad
+                data.pointing[tel_id].altitude = pointing_alt
+                data.pointing[tel_id].azimuth = pointing_az
+
+            yield data
+            counter += 1
+
+    def _draw_energy(self, rng):
+        """ energy in TeV from the power law spectrum """
+        index = self.spectral_index + 1
+        if index == 0:
+            return self.min_energy * (self.max_energy / self.min_energy)**rng.uniform()
+
+        low, high = self.min_energy**index, self.max_energy**index
+        return (low + rng.uniform() * (high - low))**(1 / index)
+
+    def _fill_telescopes(self, data, group, tel_ids, energy, rng):
+        """ simulate the images and waveforms of ``tel_ids`` of one group """
+        n = len(tel_ids)
+
+        # shower images, 2d gaussians in units of the pixel width
+        cog_x = rng.uniform(-0.5, 0.5, (n, 1)) * group.radius
+        cog_y = rng.uniform(-0.5, 0.5, (n, 1)) * group.radius
+        length = rng.uniform(2, 5, (n, 1)) * group.pixel_width
+        width = rng.uniform(0.3, 0.6, (n, 1)) * length
+        psi = rng.uniform(0, np.pi, (n, 1))
+        intensity = 200 * energy * rng.lognormal(0, 0.5, (n, 1))
+
+        cos_psi = np.cos(psi)
+        sin_psi = np.sin(psi)
+        dx = group.pix_x - cog_x
+        dy = group.pix_y - cog_y
+        longi = dx * cos_psi + dy * sin_psi
+        trans = dy * cos_psi - dx * sin_psi
+        density = np.exp(-0.5 * ((longi / length)**2 + (trans / width)**2))
+        expected = density * (intensity * group.pix_area / (2 * np.pi * length * width))
+
+        # only draw photo electrons for pixels with a relevant expectation
+        expected = expected.ravel()
+        candidates = np.flatnonzero(expected > 1e-3)
+        counts = rng.poisson(expected[candidates])
+        photo_electrons = np.zeros((n, group.n_pixels), dtype=np.int32)
+        photo_electrons.ravel()[candidates] = counts
+
+        has_signal = counts > 0
+        charge = counts[has_signal]
+        tel_index, pixels = np.divmod(candidates[has_signal], group.n_pixels)
+
+        # arrival times increase along the shower axis, in pulse indices
+        time_gradient = rng.normal(0, 2, n) / group.radius
+        peak_time = (
+            0.4 * self.n_samples
+            + time_gradient[tel_index] * longi[tel_index, pixels]
+            + rng.normal(0, 0.3, len(pixels))
+        )
+        pulse_index = np.clip(
+            np.round(peak_time * PULSE_OVERSAMPLING).astype(int),
+            0, len(self._pulses) - 1,
+        )
+        signal = (charge * self.gain)[:, np.newaxis] * self._pulses[pulse_index]
+
+        rows = np.searchsorted(group.tel_ids, tel_ids)
+        offsets = rng.randint(0, len(group.noise_bank) - group.n_values, n)
+        for row, offset in zip(rows, offsets):
+            noise = group.noise_bank[offset:offset + group.n_values]
+            group.buffer[row].reshape(-1)[:] = noise
+
+        # add the signal of all telescopes at once
+        signal_rows = rows[tel_index]
+        signal_waveforms = group.buffer[signal_rows, pixels] + np.round(signal)
+        group.buffer[signal_rows, pixels] = np.clip(signal_waveforms, 0, 2**16 - 1)
+
+        for i, tel_id in enumerate(tel_ids):
+            r0 = data.r0.tel[tel_id]
+            r0.waveform = group.waveforms[tel_id]
+            r0.num_samples = self.n_samples
+            data.mc.tel[tel_id].photo_electron_image = photo_electrons[i]
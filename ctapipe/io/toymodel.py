@@ -38,7 +38,7 @@ def toymodel_event_source(geoms, max_events=100, single_tel=False, n_channels=1,
 
     for event_id in range(max_events):
 
-        n_triggered = np.random.poisson(n_telescopes * 0.3)
+        n_triggered = np.random.poisson(n_telescopes * p_trigger)
         if n_triggered > n_telescopes:
             n_triggered = n_telescopes
 
@@ -60,14 +60,9 @@ def toymodel_event_source(geoms, max_events=100, single_tel=False, n_channels=1,
         for tel_id in container.r0.tels_with_data:
             geom = geoms[tel_id]
 
-            # fill pixel position dictionary, if not already done:
-            if tel_id not in container.inst.pixel_pos:
-                container.inst.pixel_pos[tel_id] = (
-                    geom.pix_x.value,
-                    geom.pix_y.value,
-                )
-
-            centroid = np.random.uniform(geom.pix_x.min(), geom.pix_y.max(), 2)
+            centroid = np.random.uniform(
+                geom.pix_x.min().value, geom.pix_y.max().value, 2
+            )
             length = np.random.uniform(0.02, 0.2)
             width = np.random.uniform(0.01, length)
             psi = np.random.randint(0, 360)
@@ -84,15 +79,14 @@ def toymodel_event_source(geoms, max_events=100, single_tel=False, n_channels=1,
                 intensity,
             )
 
-            # container.r0.tel[tel_id] = R0CameraContainer()
-            container.inst.num_channels[tel_id] = n_channels
             n_pix = len(geom.pix_id)
             means = np.random.normal(15, 1, (n_pix, 1))
             stds = np.random.uniform(3, 6, (n_pix, 1))
             samples = image[:, np.newaxis] * norm.pdf(t, means, stds)
 
-            for chan in range(n_channels):
-                container.r0.tel[tel_id].waveform[chan] = samples
-                container.r0.tel[tel_id].image[chan] = image
+            r0 = container.r0.tel[tel_id]
+            r0.waveform = np.repeat(samples[np.newaxis], n_channels, axis=0)
+            r0.image = np.repeat(image[np.newaxis], n_channels, axis=0)
+            r0.num_samples = n_samples
 
         yield container
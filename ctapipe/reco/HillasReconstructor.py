@@ -7,6 +7,8 @@ Contact: Tino Michael <Tino.Michael@cea.fr>
 
 from ctapipe.reco.reco_algorithms import Reconstructor
 from ctapipe.io.containers import ReconstructedShowerContainer
+from ctapipe.core.traits import Bool
+from ctapipe.core.instrumentation import instrumented
 from itertools import combinations
 
 from ctapipe.coordinates import (
@@ -22,11 +24,19 @@ from astropy.coordinates import (
     cartesian_to_spherical,
     AltAz,
 )
+from astropy.coordinates.matrix_utilities import (
+    rotation_matrix,
+    matrix_product,
+    matrix_transpose,
+)
+from ctapipe.coordinates.ground_frames import get_shower_trans_matrix
+from ctapipe.utils.grouping import group_offsets, group_pairs, group_sum
 import warnings
 
 import numpy as np
 
 from astropy import units as u
+from astropy.table import Table
 
 
 __all__ = ['HillasReconstructor', 'TooFewTelescopesException', 'HillasPlane']
@@ -89,6 +99,40 @@ def line_line_intersection_3d(uvw_vectors, origins):
     return np.linalg.inv(S) @ C
 
 
+def _line_line_intersection_3d_groups(uvw_vectors, origins, offsets):
+    """
+    Same as `line_line_intersection_3d` for many groups of lines at once.
+    ``uvw_vectors`` and ``origins`` are (n, 3) arrays, the lines of each group
+    are given by ``offsets`` (see `ctapipe.utils.grouping`). Groups for which
+    the intersection is not defined get NaN.
+    """
+    norm_matrices = (
+        uvw_vectors[:, :, np.newaxis] * uvw_vectors[:, np.newaxis, :] - np.eye(3)
+    )
+    S = group_sum(norm_matrices, offsets)
+    C = group_sum(np.einsum('nij,nj->ni', norm_matrices, origins), offsets)
+
+    result = np.full(C.shape, np.nan)
+    valid = np.abs(np.linalg.det(S)) > 1e-12
+    result[valid] = np.linalg.solve(S[valid], C[valid][:, :, np.newaxis])[..., 0]
+    return result
+
+
+def _pointing_rotation_matrix(alt, az):
+    """
+    Rotation matrix from cartesian coordinates in the telescope frame of a
+    telescope pointing to (alt, az), given in radians, into the clockwise
+    cartesian horizontal system used by `HillasPlane`.
+    """
+    # same matrices as the astropy AltAz -> TelescopeFrame transformation
+    to_telescope = matrix_product(
+        rotation_matrix(-alt * u.rad, 'y'),
+        rotation_matrix(az * u.rad, 'z'),
+    )
+    # astropy rotates counter-clockwise, we assume clockwise
+    return np.diag([1, -1, 1]) @ matrix_transpose(to_telescope)
+
+
 class HillasReconstructor(Reconstructor):
     """
     class that reconstructs the direction of an atmospheric shower
@@ -99,12 +143,26 @@ class HillasReconstructor(Reconstructor):
     so far, it does neither provide an energy estimator nor an
     uncertainty on the reconstructed parameters
 
+    If all telescopes point to the same direction, the geometry is computed
+    with plain numpy for all telescopes at once, using one rotation matrix
+    for the pointing. The slower astropy coordinate frame implementation is
+    used for divergent pointing, or if ``use_astropy_frames`` is set, e.g.
+    to validate the fast implementation.
+
     """
+    use_astropy_frames = Bool(
+        False,
+        help='Always use the astropy coordinate frames instead of the numpy '
+             'implementation for parallel pointing'
+    ).tag(config=True)
 
     def __init__(self, config=None, tool=None, **kwargs):
         super().__init__(config=config, tool=tool, **kwargs)
         self.hillas_planes = {}
+        self._pointing = None
+        self._pointing_matrices = None
 
+    @instrumented()
     def predict(self, hillas_dict, inst, pointing_alt, pointing_az):
         '''
         The function you want to call for the reconstruction of the
@@ -131,44 +189,60 @@ class HillasReconstructor(Reconstructor):
             if len(hillas_dict) < 2
         '''
 
-        # filter warnings for missing obs time. this is needed because MC data has no obs time
-        warnings.filterwarnings(action='ignore', category=MissingFrameAttributeWarning)
-        
         # stereoscopy needs at least two telescopes
         if len(hillas_dict) < 2:
             raise TooFewTelescopesException(
                 "need at least two telescopes, have {}"
                 .format(len(hillas_dict)))
 
-        self.initialize_hillas_planes(
-            hillas_dict,
-            inst.subarray,
-            pointing_alt,
-            pointing_az
-        )
-
-        # algebraic direction estimate
-        direction, err_est_dir = self.estimate_direction()
-
         alt = u.Quantity(list(pointing_alt.values()))
         az = u.Quantity(list(pointing_az.values()))
-        if np.any(alt != alt[0]) or np.any(az != az[0]):
-            warnings.warn('Divergent pointing not supported')
+        parallel = np.all(alt == alt[0]) and np.all(az == az[0])
 
-        telescope_pointing = SkyCoord(alt=alt[0], az=az[0], frame=AltAz())
-        # core position estimate using a geometric approach
-        core_pos = self.estimate_core_position(hillas_dict, telescope_pointing)
+        if parallel and not self.use_astropy_frames:
+            direction, err_est_dir, core_pos, h_max = self._reconstruct_parallel(
+                hillas_dict, inst.subarray,
+                alt[0].to_value(u.rad), az[0].to_value(u.rad),
+            )
+            # astropy's coordinates system rotates counter-clockwise.
+            # Apparently we assume it to be clockwise.
+            lat = np.arctan2(direction[2], np.hypot(direction[0], direction[1]))
+            lon = np.arctan2(direction[1], direction[0]) % (2 * np.pi)
+            alt_reco, az_reco = lat * u.rad, -lon * u.rad
+        else:
+            if not parallel:
+                warnings.warn('Divergent pointing not supported')
+
+            # filter warnings for missing obs time.
+            # this is needed because MC data has no obs time
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', MissingFrameAttributeWarning)
+
+                self.initialize_hillas_planes(
+                    hillas_dict,
+                    inst.subarray,
+                    pointing_alt,
+                    pointing_az
+                )
+
+                # algebraic direction estimate
+                direction, err_est_dir = self.estimate_direction()
+
+                telescope_pointing = SkyCoord(alt=alt[0], az=az[0], frame=AltAz())
+                # core position estimate using a geometric approach
+                core_pos = self.estimate_core_position(hillas_dict,
+                                                       telescope_pointing)
+
+            _, lat, lon = cartesian_to_spherical(*direction)
+            alt_reco, az_reco = lat, -lon
+
+            # estimate max height of shower
+            h_max = self.estimate_h_max()
 
         # container class for reconstructed showers
         result = ReconstructedShowerContainer()
-        _, lat, lon = cartesian_to_spherical(*direction)
-
-        # estimate max height of shower
-        h_max = self.estimate_h_max()
 
-        # astropy's coordinates system rotates counter-clockwise.
-        # Apparently we assume it to be clockwise.
-        result.alt, result.az = lat, -lon
+        result.alt, result.az = alt_reco, az_reco
         result.core_x = core_pos[0]
         result.core_y = core_pos[1]
         result.core_uncert = np.nan
@@ -187,6 +261,222 @@ class HillasReconstructor(Reconstructor):
 
         return result
 
+    def _get_pointing_matrices(self, alt, az):
+        """
+        rotation matrix from the telescope frame to the horizontal system and
+        transformation matrix from the ground to the tilted ground system for
+        a pointing, only recomputed when the pointing changes
+        """
+        if self._pointing != (alt, az):
+            self._pointing_matrices = (
+                _pointing_rotation_matrix(alt, az),
+                get_shower_trans_matrix(az, alt),
+            )
+            self._pointing = (alt, az)
+        return self._pointing_matrices
+
+    def _reconstruct_parallel(self, hillas_dict, subarray, alt, az):
+        """
+        numpy implementation of the direction, core and h_max reconstruction
+        for telescopes all pointing to (alt, az), given in radians. This gives
+        the same results as `initialize_hillas_planes`, `estimate_direction`,
+        `estimate_core_position` and `estimate_h_max`.
+
+        Returns
+        -------
+        direction: numpy.ndarray(3)
+            direction of the shower as unit vector
+        err_est_dir: astropy.units.Quantity
+            error estimate on the direction
+        core_pos: tuple(astropy.units.Quantity)
+            core position on the ground
+        h_max: astropy.units.Quantity
+            height of the shower maximum
+        """
+        moments = list(hillas_dict.values())
+        direction, err_est_dir, core_x, core_y, h_max = self._reconstruct_groups(
+            np.array([0, len(moments)]),
+            np.array(list(hillas_dict.keys())),
+            np.array([m.x.to_value(u.m) for m in moments]),
+            np.array([m.y.to_value(u.m) for m in moments]),
+            np.array([m.psi.to_value(u.rad) for m in moments]),
+            np.array([
+                m.intensity * (m.length / m.width).to_value(u.one) for m in moments
+            ]),
+            subarray, alt, az,
+        )
+
+        return (
+            direction[0],
+            err_est_dir[0] * u.rad,
+            (core_x[0] * u.m, core_y[0] * u.m),
+            h_max[0] * u.m,
+        )
+
+    def _reconstruct_groups(self, offsets, tel_ids, cog_x, cog_y, psi, weight,
+                            subarray, alt, az):
+        """
+        reconstruct many events at once for telescopes all pointing to
+        (alt, az). All inputs are unit-free (m, rad) arrays with one entry per
+        image, the images of each event are given by ``offsets``.
+
+        Returns
+        -------
+        direction, err_est_dir, core_x, core_y, h_max: numpy.ndarray
+            one entry per event, direction as unit vectors
+        """
+        rotation, trans = self._get_pointing_matrices(alt, az)
+
+        unique_ids, tel_index = np.unique(tel_ids, return_inverse=True)
+        focal_length = np.array([
+            subarray.tel[tel_id].optics.equivalent_focal_length.to_value(u.m)
+            for tel_id in unique_ids
+        ])[tel_index]
+        positions = np.array([
+            u.Quantity(subarray.positions[tel_id]).to_value(u.m)
+            for tel_id in unique_ids
+        ])[tel_index]
+
+        def to_horizon(x, y):
+            # camera frame -> telescope frame -> clockwise horizontal system
+            delta_alt = x / focal_length
+            delta_az = y / focal_length
+            cos_alt = np.cos(delta_alt)
+            vectors = np.column_stack([
+                cos_alt * np.cos(delta_az),
+                cos_alt * np.sin(delta_az),
+                np.sin(delta_alt),
+            ])
+            return vectors @ rotation.T
+
+        # we just need any point on the main shower axis a bit away from the cog
+        a = to_horizon(cog_x, cog_y)
+        b = to_horizon(cog_x + 0.1 * np.cos(psi), cog_y + 0.1 * np.sin(psi))
+
+        # normal vectors of the hillas planes
+        c = np.cross(np.cross(a, b), a)
+        norm = np.cross(a, c)
+        norm /= np.linalg.norm(norm, axis=1)[:, np.newaxis]
+
+        # direction, see estimate_direction
+        first, second, pair_offsets = group_pairs(offsets)
+        crossings = np.cross(norm[first], norm[second])
+        crossings[crossings[:, 2] < 0] *= -1
+        crossings *= (weight[first] * weight[second])[:, np.newaxis]
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            direction = group_sum(crossings, pair_offsets)
+            direction /= np.linalg.norm(direction, axis=1)[:, np.newaxis]
+
+            pair_event = np.repeat(np.arange(len(offsets) - 1), np.diff(pair_offsets))
+            cos_angles = (
+                np.einsum('ij,ij->i', crossings, direction[pair_event])
+                / np.linalg.norm(crossings, axis=1)
+            )
+            err_est_dir = (
+                group_sum(np.arccos(np.clip(cos_angles, -1.0, 1.0)), pair_offsets)
+                / np.diff(pair_offsets)
+            )
+
+        # core position, see estimate_core_position
+        tilted_positions = np.column_stack([
+            positions @ trans[:2].T, np.zeros(len(psi))
+        ])
+        uvw_vectors = np.column_stack([np.cos(psi), np.sin(psi), np.zeros(len(psi))])
+        core_tilted = _line_line_intersection_3d_groups(
+            uvw_vectors, tilted_positions, offsets
+        )
+        core_ground = core_tilted[:, :2] @ trans[:2]
+        core_x = core_ground[:, 0] - trans[2][0] * core_ground[:, 2] / trans[2][2]
+        core_y = core_ground[:, 1] - trans[2][1] * core_ground[:, 2] / trans[2][2]
+
+        # h_max, see estimate_h_max
+        h_max = np.linalg.norm(
+            _line_line_intersection_3d_groups(a, positions, offsets), axis=1
+        )
+
+        return direction, err_est_dir, core_x, core_y, h_max
+
+    def predict_batch(self, event_index, tel_ids, x, y, psi, intensity, length,
+                      width, subarray, pointing_alt, pointing_az):
+        """
+        Reconstruct many events in one call from columnar hillas parameters,
+        e.g. read from a DL1 table, with one row per image. All telescopes of
+        all events have to point to the same direction.
+
+        Events with less than two images, or for which the reconstruction is
+        not defined, get NaN values and ``is_valid = False``.
+
+        Parameters
+        ----------
+        event_index: array-like
+            event identifier of each image, images of the same event have to
+            be in consecutive rows
+        tel_ids: array-like
+            telescope id of each image
+        x, y: astropy.units.Quantity
+            hillas centroid in the camera frame
+        psi: astropy.units.Quantity
+            hillas orientation angle
+        intensity: array-like
+            image intensity
+        length, width: astropy.units.Quantity
+            hillas length and width
+        subarray: ctapipe.instrument.SubarrayDescription
+            subarray information
+        pointing_alt, pointing_az: astropy.units.Quantity
+            pointing direction of all telescopes
+
+        Returns
+        -------
+        astropy.table.Table:
+            one row per event, with the columns ``event_index``, ``alt``,
+            ``az``, ``alt_uncert``, ``core_x``, ``core_y``, ``h_max``,
+            ``multiplicity`` and ``is_valid``
+        """
+        events, offsets = group_offsets(event_index)
+        weight = (
+            np.asanyarray(intensity, dtype=np.float64)
+            * u.Quantity(length / width).to_value(u.one)
+        )
+
+        direction, err_est_dir, core_x, core_y, h_max = self._reconstruct_groups(
+            offsets,
+            np.asanyarray(tel_ids),
+            u.Quantity(x).to_value(u.m),
+            u.Quantity(y).to_value(u.m),
+            u.Quantity(psi).to_value(u.rad),
+            weight,
+            subarray,
+            u.Quantity(pointing_alt).to_value(u.rad),
+            u.Quantity(pointing_az).to_value(u.rad),
+        )
+
+        # astropy's coordinates system rotates counter-clockwise.
+        # Apparently we assume it to be clockwise.
+        alt = np.arctan2(direction[:, 2], np.hypot(direction[:, 0], direction[:, 1]))
+        az = -(np.arctan2(direction[:, 1], direction[:, 0]) % (2 * np.pi))
+
+        multiplicity = np.diff(offsets)
+        is_valid = (
+            (multiplicity >= 2)
+            & np.isfinite(alt)
+            & np.isfinite(core_x)
+            & np.isfinite(h_max)
+        )
+
+        return Table({
+            'event_index': events,
+            'alt': alt * u.rad,
+            'az': az * u.rad,
+            'alt_uncert': err_est_dir * u.rad,
+            'core_x': core_x * u.m,
+            'core_y': core_y * u.m,
+            'h_max': h_max * u.m,
+            'multiplicity': multiplicity,
+            'is_valid': is_valid,
+        })
+
     def initialize_hillas_planes(
         self,
         hillas_dict,
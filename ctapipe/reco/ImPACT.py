@@ -2,10 +2,12 @@
 """
 
 """
+import copy
 import math
+import multiprocessing
+import os
 
 import numpy as np
-import numpy.ma as ma
 from astropy import units as u
 from astropy.coordinates import SkyCoord, AltAz
 from iminuit import Minuit
@@ -18,15 +20,17 @@ from ctapipe.coordinates import (
     GroundFrame,
     project_to_ground,
 )
+from ctapipe.core.instrumentation import instrumented
 from ctapipe.image import poisson_likelihood_gaussian, mean_poisson_likelihood_gaussian
-from ctapipe.instrument import get_atmosphere_profile_functions
+from ctapipe.instrument import get_atmosphere_profile
 from ctapipe.io.containers import (ReconstructedShowerContainer,
                                    ReconstructedEnergyContainer)
 from ctapipe.reco.reco_algorithms import Reconstructor
 from ctapipe.utils.template_network_interpolator import TemplateNetworkInterpolator, \
     TimeGradientInterpolator
 
-__all__ = ['ImPACTReconstructor', 'energy_prior', 'xmax_prior', 'guess_shower_depth']
+__all__ = ['ImPACTReconstructor', 'ImPACTReconstructorPool', 'energy_prior',
+           'xmax_prior', 'guess_shower_depth']
 
 
 def guess_shower_depth(energy):
@@ -111,8 +115,9 @@ class ImPACTReconstructor(Reconstructor):
 
         # We also need a conversion function from height above ground to
         # depth of maximum To do this we need the conversion table from CORSIKA
-        self.thickness_profile, self.altitude_profile = \
-            get_atmosphere_profile_functions('paranal', with_units=False)
+        atmosphere = get_atmosphere_profile('paranal')
+        self.thickness_profile = atmosphere.thickness
+        self.altitude_profile = atmosphere.altitude
 
         # Next we need the position, area and amplitude from each pixel in the event
         # making this a class member makes passing them around much easier
@@ -135,6 +140,18 @@ class ImPACTReconstructor(Reconstructor):
         self.array_direction = None
         self.array_return = False
 
+        # Boolean mask of the pixels used in the fit (padding and empty pixels
+        # are False), replaces the numpy masked arrays used previously
+        self.image_mask = None
+        self._type_masks = dict()
+        self._zenith = None
+
+        # Padded event buffers, keyed by (number of telescopes, largest image
+        # size), and unit-free nominal pixel positions, keyed by telescope id.
+        # These are reused between events to avoid reallocation
+        self._buffers = dict()
+        self._pixel_cache = dict()
+
         # For now these factors are required to fix problems in templates
         self.template_scale = template_scale
         self.xmax_offset = xmax_offset
@@ -295,7 +312,8 @@ class ImPACTReconstructor(Reconstructor):
                             (pixel_pos_y - y_trans) * cosine_angle
         return pixel_pos_trans_x, pixel_pos_trans_y
 
-    def image_prediction(self, tel_type, energy, impact, x_max, pix_x, pix_y):
+    def image_prediction(self, tel_type, energy, impact, x_max, pix_x, pix_y,
+                         mask=None):
         """Creates predicted image for the specified pixels, interpolated
         from the template library.
 
@@ -313,6 +331,8 @@ class ImPACTReconstructor(Reconstructor):
             X coordinate of pixels
         pix_y: ndarray
             Y coordinate of pixels
+        mask: ndarray
+            Boolean mask of pixels to evaluate, others are skipped (optional)
 
         Returns
         -------
@@ -320,7 +340,8 @@ class ImPACTReconstructor(Reconstructor):
 
         """
 
-        return self.prediction[tel_type](energy, impact, x_max, pix_x, pix_y)
+        return self.prediction[tel_type](energy, impact, x_max, pix_x, pix_y,
+                                         mask=mask)
 
     def predict_time(self, tel_type, energy, impact, x_max):
         """Creates predicted image for the specified pixels, interpolated
@@ -375,8 +396,9 @@ class ImPACTReconstructor(Reconstructor):
         # everything in the correct units when loading in the class
         # and ignore them from then on
 
-        zenith = (np.pi / 2) - self.array_direction.alt.to(u.rad).value
-        azimuth = self.array_direction.az
+        if self._zenith is None:
+            self._zenith = (np.pi / 2) - self.array_direction.alt.to_value(u.rad)
+        zenith = self._zenith
 
         # Geometrically calculate the depth of maximum given this test position
         x_max = self.get_shower_max(source_x, source_y,
@@ -401,7 +423,7 @@ class ImPACTReconstructor(Reconstructor):
                          + np.power(self.tel_pos_y - core_y, 2))
         # And the expected rotation angle
         phi = np.arctan2((self.tel_pos_x - core_x),
-                         (self.tel_pos_y - core_y)) * u.rad
+                         (self.tel_pos_y - core_y))
 
         # Rotate and translate all pixels such that they match the
         # template orientation
@@ -411,36 +433,34 @@ class ImPACTReconstructor(Reconstructor):
             source_x, source_y, phi
         )
 
-        # In the interpolator class we can gain speed advantages by using masked arrays
-        # so we need to make sure here everything is masked
-        prediction = ma.zeros(self.image.shape)
-        prediction.mask = ma.getmask(self.image)
-
-        time_gradients = np.zeros((self.image.shape[0],2))
+        # The prediction buffers are reused between calls, padding and empty
+        # pixels are excluded through the image mask
+        buffers = self._buffers[self.image.shape]
+        prediction = buffers["prediction"]
+        prediction.fill(0)
+        time_gradients = buffers["time_gradients"]
 
         # Loop over all telescope types and get prediction
-        for tel_type in np.unique(self.tel_types).tolist():
-            type_mask = self.tel_types == tel_type
+        for tel_type, type_mask in self._type_masks.items():
+            n_type = np.count_nonzero(type_mask)
+            type_energy = np.full(n_type, energy)
+            type_x_max = np.full(n_type, x_max_bin)
+
             prediction[type_mask] = \
-                self.image_prediction(tel_type, energy *
-                                      np.ones_like(impact[type_mask]),
-                                      impact[type_mask], x_max_bin *
-                                      np.ones_like(impact[type_mask]),
+                self.image_prediction(tel_type, type_energy,
+                                      impact[type_mask], type_x_max,
                                       pix_x_rot[type_mask] * (180 / math.pi) * -1,
-                                      pix_y_rot[type_mask] * (180 / math.pi))
+                                      pix_y_rot[type_mask] * (180 / math.pi),
+                                      mask=self.image_mask[type_mask])
 
             if self.use_time_gradient:
                 time_gradients[type_mask] = \
-                    self.predict_time(tel_type,
-                                      energy * np.ones_like(impact[type_mask]),
-                                      impact[type_mask],
-                                      x_max_bin * np.ones_like(impact[type_mask]))
+                    self.predict_time(tel_type, type_energy,
+                                      impact[type_mask], type_x_max)
 
         if self.use_time_gradient:
-            time_mask = np.logical_and(np.invert(ma.getmask(self.image)),
-                                       self.time > 0)
-            weight = np.sqrt(self.image) * time_mask
-            rv = norm()
+            time_mask = np.logical_and(self.image_mask, self.time > 0)
+            weight = np.sqrt(np.clip(self.image, 0, None)) * time_mask
 
             sx = pix_x_rot * weight
             sxx = pix_x_rot * pix_x_rot * weight
@@ -451,24 +471,28 @@ class ImPACTReconstructor(Reconstructor):
             time_fit = (weight.sum(axis=1) * sxy.sum(axis=1) - sx.sum(axis=1) * sy.sum(
                 axis=1)) / d
             time_fit /= -1 * (180 / math.pi)
-            chi2 = -2 * np.log(rv.pdf((time_fit - time_gradients.T[0])/
-                                        time_gradients.T[1]))
+            # -2 log of the standard normal pdf
+            chi2 = np.power((time_fit - time_gradients.T[0]) /
+                            time_gradients.T[1], 2) + np.log(2 * math.pi)
+
+        # Only the pixels in the image mask take part in the likelihood
+        prediction = prediction[self.image_mask]
 
         # Likelihood function will break if we find a NaN or a 0
         prediction[np.isnan(prediction)] = 1e-8
-        prediction[prediction < 1e-8] = 1e-8
+        np.maximum(prediction, 1e-8, out=prediction)
         prediction *= self.template_scale
 
         # Get likelihood that the prediction matched the camera image
-        like = poisson_likelihood_gaussian(self.image, prediction, self.spe, self.ped)
+        ped = self.ped[self.image_mask]
+        like = poisson_likelihood_gaussian(self.image[self.image_mask], prediction,
+                                           self.spe, ped)
         like[np.isnan(like)] = 1e9
-        like *= np.invert(ma.getmask(self.image))
-        like = ma.MaskedArray(like, mask=ma.getmask(self.image))
 
         array_like = like
         if goodness_of_fit:
             return np.sum(like - mean_poisson_likelihood_gaussian(prediction, self.spe,
-                                                                  self.ped))
+                                                                  ped))
 
         prior_pen = 0
         # Add prior penalities if we have them
@@ -478,15 +502,15 @@ class ImPACTReconstructor(Reconstructor):
         if "xmax" in self.priors:
             prior_pen += xmax_prior(energy, x_max)
 
-        array_like += prior_pen / float(len(array_like))
+        # Penalty is shared out between the telescopes in the event
+        array_like += prior_pen / float(self.image.shape[0])
 
         if self.array_return:
-            array_like = array_like.ravel()
-            return array_like[np.invert(ma.getmask(array_like))]
+            return array_like
 
         final_sum = array_like.sum()
         if self.use_time_gradient:
-            final_sum += chi2.sum() #* np.sum(ma.getmask(self.image))
+            final_sum += chi2.sum()
 
         return final_sum
 
@@ -534,6 +558,11 @@ class ImPACTReconstructor(Reconstructor):
         bunch of useful properties to class members, so that we can
         use them later without passing all this information around.
 
+        The padded arrays used to store the event are reused between events
+        with the same shape, and the pixel positions converted to radians are
+        cached per telescope, so the same pixel position arrays should be
+        passed for each event where possible.
+
         Parameters
         ----------
         image: dictionary
@@ -558,65 +587,115 @@ class ImPACTReconstructor(Reconstructor):
         """
         # First store these parameters in the class so we can use them
         # in minimisation For most values this is simply copying
-        self.image = image
-
-        self.tel_pos_x, self.tel_pos_y, self.ped = \
-            np.zeros(len(tel_x)), np.zeros(len(tel_x)), np.zeros(len(tel_x))
-        self.tel_types, self.tel_id = list(), list()
-
-        max_pix_x, max_pix_y = 0, 0
-        px, py, pa, pt = list(), list(), list(), list()
-        self.hillas_parameters = list()
-
-        # So here we must loop over the telescopes
-        for x, i in zip(tel_x, range(len(tel_x))):
-
-            px.append(pixel_x[x].to(u.rad).value)
-            if len(px[i]) > max_pix_x:
-                max_pix_x = len(px[i])
-            py.append(pixel_y[x].to(u.rad).value)
-            pa.append(image[x])
-            pt.append(time[x])
-
-            self.tel_pos_x[i] = tel_x[x].to(u.m).value
-            self.tel_pos_y[i] = tel_y[x].to(u.m).value
-
-            self.ped[i] = self.ped_table[type_tel[x]]
-            self.tel_types.append(type_tel[x])
-            self.tel_id.append(x)
-            self.hillas_parameters.append(hillas[x])
-
-        # Most interesting stuff is now copied to the class, but to remove our requirement
-        # for loops we must copy the pixel positions to an array with the length of the
-        # largest image
-
-        # First allocate everything
-        shape = (len(tel_x), max_pix_x)
-        self.pixel_x, self.pixel_y = ma.zeros(shape), ma.zeros(shape)
-        self.image, self.time, self.ped = ma.zeros(shape), ma.zeros(shape),\
-                                          ma.zeros(shape)
-        self.tel_types = np.array(self.tel_types)
-
-        # Copy everything into our masked arrays
-        for i in range(len(tel_x)):
+        tel_ids = list(tel_x.keys())
+        num_tels = len(tel_ids)
+
+        px, py = list(), list()
+        for tel_id in tel_ids:
+            pos_x, pos_y = self._nominal_pixel_positions(tel_id, pixel_x[tel_id],
+                                                         pixel_y[tel_id])
+            px.append(pos_x)
+            py.append(pos_y)
+        max_pix = max(len(pos_x) for pos_x in px)
+
+        # To remove our requirement for loops we copy everything into padded
+        # arrays with the length of the largest image. These are only allocated
+        # the first time we see an event of this shape
+        buffers = self._get_buffers((num_tels, max_pix))
+        self.pixel_x, self.pixel_y = buffers["pixel_x"], buffers["pixel_y"]
+        self.image, self.time = buffers["image"], buffers["time"]
+        self.ped = buffers["ped"]
+        self.tel_pos_x, self.tel_pos_y = buffers["tel_pos_x"], buffers["tel_pos_y"]
+
+        self.tel_types = np.array([type_tel[tel_id] for tel_id in tel_ids])
+        self.tel_id = tel_ids
+        self.hillas_parameters = [hillas[tel_id] for tel_id in tel_ids]
+
+        for i, tel_id in enumerate(tel_ids):
             array_len = len(px[i])
-            self.pixel_x[i][:array_len] = px[i]
-            self.pixel_y[i][:array_len] = py[i]
-            self.image[i][:array_len] = pa[i]
-            self.time[i][:array_len] = pt[i]
-            self.ped[i][:array_len] = self.ped_table[self.tel_types[i]]
-
-        # Set the image mask
-        mask = self.image == 0.0
-        self.pixel_x[mask], self.pixel_y[mask] = ma.masked, ma.masked
-        self.image[mask] = ma.masked
-        self.time[mask] = ma.masked
+            self.pixel_x[i, :array_len] = px[i]
+            self.pixel_y[i, :array_len] = py[i]
+            self.image[i, :array_len] = image[tel_id]
+            self.time[i, :array_len] = time[tel_id]
+            self.ped[i, :array_len] = self.ped_table[type_tel[tel_id]]
+
+            # Clear padding left over from previous events
+            self.pixel_x[i, array_len:] = 0
+            self.pixel_y[i, array_len:] = 0
+            self.image[i, array_len:] = 0
+            self.time[i, array_len:] = 0
+            self.ped[i, array_len:] = 0
+
+            self.tel_pos_x[i] = tel_x[tel_id].to_value(u.m)
+            self.tel_pos_y[i] = tel_y[tel_id].to_value(u.m)
+
+        # Set the image mask, padding and empty pixels are not used
+        self.image_mask = buffers["image_mask"]
+        np.not_equal(self.image, 0.0, out=self.image_mask)
+
+        self._type_masks = {tel_type: self.tel_types == tel_type
+                            for tel_type in np.unique(self.tel_types).tolist()}
 
         # Finally run some functions to get ready for the event
         self.get_hillas_mean()
         self.initialise_templates(type_tel)
         self.array_direction = array_direction
+        self._zenith = None
+
+    def _get_buffers(self, shape):
+        """Return the padded event arrays for a given (number of telescopes,
+        number of pixels) shape, allocating them on first use.
+
+        Parameters
+        ----------
+        shape: tuple
+            Number of telescopes and length of the largest image
 
+        Returns
+        -------
+        dict: padded arrays used to store the event
+        """
+        buffers = self._buffers.get(shape)
+        if buffers is None:
+            buffers = {name: np.zeros(shape) for name in
+                       ("pixel_x", "pixel_y", "image", "time", "ped", "prediction")}
+            buffers["image_mask"] = np.zeros(shape, dtype=bool)
+            buffers["tel_pos_x"] = np.zeros(shape[0])
+            buffers["tel_pos_y"] = np.zeros(shape[0])
+            buffers["time_gradients"] = np.zeros((shape[0], 2))
+            self._buffers[shape] = buffers
+
+        return buffers
+
+    def _nominal_pixel_positions(self, tel_id, pixel_x, pixel_y):
+        """Return the pixel positions of a telescope in radians. The converted
+        values are cached, so passing the same pixel position arrays for each
+        event avoids the unit conversion.
+
+        Parameters
+        ----------
+        tel_id: int
+            Telescope ID
+        pixel_x: astropy.units.Quantity
+            X position of pixels in nominal system
+        pixel_y: astropy.units.Quantity
+            Y position of pixels in nominal system
+
+        Returns
+        -------
+        ndarray, ndarray: X and Y pixel positions in radians
+        """
+        cached = self._pixel_cache.get(tel_id)
+        if cached is not None and cached[0] is pixel_x and cached[1] is pixel_y:
+            return cached[2], cached[3]
+
+        pos_x = pixel_x.to_value(u.rad)
+        pos_y = pixel_y.to_value(u.rad)
+        self._pixel_cache[tel_id] = (pixel_x, pixel_y, pos_x, pos_y)
+
+        return pos_x, pos_y
+
+    @instrumented()
     def predict(self, shower_seed, energy_seed):
         """
         Parameters
@@ -639,8 +718,9 @@ class ImPACTReconstructor(Reconstructor):
             NominalFrame(origin=self.array_direction)
         )
 
-        source_x = nominal_seed.delta_az.to_value(u.rad)
-        source_y = nominal_seed.delta_alt.to_value(u.rad)
+        # the seed may be a scalar or a single element array
+        source_x = np.ravel(nominal_seed.delta_az.to_value(u.rad))[0]
+        source_y = np.ravel(nominal_seed.delta_alt.to_value(u.rad))[0]
         ground = GroundFrame(x=shower_seed.core_x,
                              y=shower_seed.core_y, z=0 * u.m)
         tilted = ground.transform_to(
@@ -657,7 +737,7 @@ class ImPACTReconstructor(Reconstructor):
 
         seed_list = spread_line_seed(self.hillas_parameters,
                                      self.tel_pos_x, self.tel_pos_y,
-                                     source_x[0], source_y[0], tilt_x, tilt_y,
+                                     source_x, source_y, tilt_x, tilt_y,
                                      energy_seed.energy.value,
                                      shift_frac = shift)
 
@@ -674,8 +754,8 @@ class ImPACTReconstructor(Reconstructor):
         # Convert the best fits direction and core to Horizon and ground systems and
         # copy to the shower container
         nominal = SkyCoord(
-            x=fit_params[0] * u.rad,
-            y=fit_params[1] * u.rad,
+            delta_az=fit_params[0] * u.rad,
+            delta_alt=fit_params[1] * u.rad,
             frame=NominalFrame(origin=self.array_direction)
         )
         horizon = nominal.transform_to(AltAz())
@@ -719,6 +799,33 @@ class ImPACTReconstructor(Reconstructor):
 
         return shower_result, energy_result
 
+    def predict_event(self, image, time, pixel_x, pixel_y, type_tel, tel_x, tel_y,
+                      array_direction, hillas, shower_seed, energy_seed):
+        """Reconstruct a single event without modifying the event state of
+        this reconstructor. The event is set on a shallow copy which shares the
+        loaded templates, but has its own event buffers.
+
+        Parameters
+        ----------
+        image, time, pixel_x, pixel_y, type_tel, tel_x, tel_y, array_direction, hillas:
+            Event properties, see `set_event_properties`
+        shower_seed: ReconstructedShowerContainer
+            Seed shower geometry to be used in the fit
+        energy_seed: ReconstructedEnergyContainer
+            Seed energy to be used in fit
+
+        Returns
+        -------
+        ReconstructedShowerContainer, ReconstructedEnergyContainer:
+        Reconstructed ImPACT shower geometry and energy
+        """
+        event_reco = copy.copy(self)
+        event_reco._buffers = dict()
+
+        event_reco.set_event_properties(image, time, pixel_x, pixel_y, type_tel,
+                                        tel_x, tel_y, array_direction, hillas)
+        return event_reco.predict(shower_seed, energy_seed)
+
     def choose_seed(self, seed_list):
 
         like = list()
@@ -822,6 +929,102 @@ class ImPACTReconstructor(Reconstructor):
 
             return np.array(min.x), (0, 0, 0, 0, 0, 0), self.get_likelihood_min(min.x)
 
+
+# Reconstructor used by the worker processes of ImPACTReconstructorPool
+_pool_reconstructor = None
+
+
+def _init_pool_worker(reconstructor):
+    global _pool_reconstructor
+    _pool_reconstructor = reconstructor
+
+
+def _reconstruct_pool_event(event):
+    event = dict(event)
+    shower_seed = event.pop("shower_seed")
+    energy_seed = event.pop("energy_seed")
+
+    _pool_reconstructor.set_event_properties(**event)
+    return _pool_reconstructor.predict(shower_seed, energy_seed)
+
+
+class ImPACTReconstructorPool:
+    """Run `ImPACTReconstructor` over many events on a pool of worker
+    processes.
+
+    The templates for all requested telescope types are loaded once in the
+    parent process before the workers are started. With the default "fork"
+    start method the workers inherit them, so the template memory is shared
+    between all workers instead of being loaded again by each of them.
+
+    Each job is a dictionary of the arguments of
+    `ImPACTReconstructor.set_event_properties` plus the "shower_seed" and
+    "energy_seed" passed to `ImPACTReconstructor.predict`, and the result
+    is the tuple of reconstructed shower and energy containers.
+
+    Parameters
+    ----------
+    tel_types: list
+        Telescope types for which templates are loaded
+    n_workers: int
+        Number of worker processes, defaults to the number of CPUs
+    start_method: str
+        multiprocessing start method, only "fork" shares the templates
+    kwargs:
+        Passed to `ImPACTReconstructor`
+
+    Examples
+    --------
+    >>> with ImPACTReconstructorPool(["LSTCam"], root_dir=template_dir) as pool:
+    ...     for shower, energy in pool.imap(events):
+    ...         print(shower.alt, shower.az, energy.energy)
+    """
+
+    def __init__(self, tel_types, n_workers=None, start_method="fork", **kwargs):
+        self.reconstructor = ImPACTReconstructor(**kwargs)
+        self.reconstructor.initialise_templates({t: t for t in tel_types})
+
+        self.n_workers = n_workers or os.cpu_count()
+        self.start_method = start_method
+        self._pool = None
+
+    def start(self):
+        """Start the worker processes"""
+        if self._pool is None:
+            context = multiprocessing.get_context(self.start_method)
+            self._pool = context.Pool(self.n_workers,
+                                      initializer=_init_pool_worker,
+                                      initargs=(self.reconstructor,))
+
+    def close(self):
+        """Wait for all submitted jobs and stop the worker processes"""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def submit(self, event):
+        """Submit a single event, returning an `multiprocessing.pool.AsyncResult`"""
+        self.start()
+        return self._pool.apply_async(_reconstruct_pool_event, (event,))
+
+    def imap(self, events, chunksize=1):
+        """Iterate over the reconstruction results of ``events``, in order"""
+        self.start()
+        return self._pool.imap(_reconstruct_pool_event, events, chunksize)
+
+    def map(self, events, chunksize=1):
+        """Return a list of the reconstruction results of ``events``"""
+        return list(self.imap(events, chunksize))
+
+
 def spread_line_seed(hillas, tel_x, tel_y, source_x, source_y, tilt_x, tilt_y, energy,
                      shift_frac = [2, 1.5, 1, 0.5, 0 ,-0.5, -1, -1.5]):
     """
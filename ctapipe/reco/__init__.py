@@ -1,9 +1,9 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 from .HillasReconstructor import HillasReconstructor, Reconstructor
-from .ImPACT import ImPACTReconstructor
+from .ImPACT import ImPACTReconstructor, ImPACTReconstructorPool
 from .energy_regressor import EnergyRegressor
 from .shower_max import ShowerMaxEstimator
 
 
 __all__ = ['HillasReconstructor', 'Reconstructor', 'ImPACTReconstructor',
-           'EnergyRegressor', 'ShowerMaxEstimator']
+           'ImPACTReconstructorPool', 'EnergyRegressor', 'ShowerMaxEstimator']
@@ -3,6 +3,7 @@ import numpy as np
 from astropy import units as u
 
 from .regressor_classifier_base import RegressorClassifierBase
+from ..utils.grouping import group_mean, group_median, group_std
 from sklearn.ensemble import RandomForestRegressor
 
 
@@ -34,7 +35,9 @@ class EnergyRegressor(RegressorClassifierBase):
         scikit-learn regressors don't work with astropy unit. so, tell
         in advance in which unit we want to deal here.
     kwargs
-        arguments to be passed on to the constructor of the regressors
+        arguments to be passed on to the constructor of the regressors,
+        except for `n_parallel_models` and `parallel_backend`, cf.
+        `RegressorClassifierBase`
 
     """
 
@@ -69,38 +72,52 @@ class EnergyRegressor(RegressorClassifierBase):
 
         """
 
-        predict_mean = []
-        predict_median = []
-        predict_std = []
-        for evt in event_list:
-            predicts = []
-            weights = []
-            for cam_id, tels in evt.items():
-                try:
-                    t_res = self.model_dict[cam_id].predict(tels).tolist()
-                    predicts += t_res
-                except KeyError:
-                    # QUESTION if there is no trained classifier for
-                    # `cam_id`, raise an error or just pass this
-                    # camera type?
-                    raise KeyError("cam_id '{}' in event_list but no model defined: {}"
-                                   .format(cam_id, [k for k in self.model_dict]))
-
-                try:
-                    # if a `namedtuple` is provided, we can weight the different images
-                    # using some of the provided features
-                    weights += [t.sum_signal_cam / t.impact_dist for t in tels]
-                except AttributeError:
-                    # otherwise give every image the same weight
-                    weights += [1] * len(tels)
-
-            predict_mean.append(np.average(predicts, weights=weights))
-            predict_median.append(np.median(predicts))
-            predict_std.append(np.std(predicts))
-
-        return {"mean": np.array(predict_mean) * self.unit,
-                "median": np.array(predict_median) * self.unit,
-                "std": np.array(predict_std) * self.unit}
+        features, event_index, weights = self.event_list_to_columns(event_list)
+        return self.predict_by_event_columns(
+            features, event_index, weights, n_events=len(event_list)
+        )
+
+    def predict_by_event_columns(self, features, event_index,
+                                 weights=None, n_events=None):
+        """columnar version of `.predict_by_event`: the regressor of every
+        telescope identifier is called only once on all its images and the
+        predictions are combined event-wise with grouped reductions.
+
+        Parameters
+        ----------
+        features : dictionary of arrays
+            maps the telescope identifiers to the (n_images, n_features)
+            array of the feature-lists of all images of that type
+        event_index : dictionary of arrays
+            maps the telescope identifiers to the index of the event
+            every image belongs to
+        weights : dictionary of arrays, optional
+            weights of the images for the mean, by default all images
+            have the same weight
+        n_events : int, optional
+            number of events, by default the largest event index + 1
+
+        Returns
+        -------
+        dict :
+            dictionary that contains various statistical modes (mean,
+            median, standard deviation) of the predicted quantity of
+            every telescope for all events; nan for events without images
+
+        Raises
+        ------
+        KeyError:
+            if there is a telescope identifier in `features` that is not a
+            key in the regressor dictionary
+
+        """
+        predicts, weights, offsets = self._predict_columns(
+            "predict", features, event_index, weights, n_events
+        )
+
+        return {"mean": group_mean(predicts, offsets, weights) * self.unit,
+                "median": group_median(predicts, offsets) * self.unit,
+                "std": group_std(predicts, offsets) * self.unit}
 
     def predict_by_telescope_type(self, event_list):
         """same as `predict_dict` only that it returns a list of dictionaries
@@ -126,7 +143,8 @@ class EnergyRegressor(RegressorClassifierBase):
         return predict_list_dict
 
     @classmethod
-    def load(cls, path, cam_id_list, unit=u.TeV):
+    def load(cls, path, cam_id_list, unit=u.TeV,
+             n_parallel_models=1, parallel_backend=None):
         """this is only here to overwrite the unit argument with an astropy
         quantity
 
@@ -145,6 +163,11 @@ class EnergyRegressor(RegressorClassifierBase):
             scikit-learn regressor do not work with units. so append
             this one to the predictions. assuming that the models
             where trained with consistent units. (default: u.TeV)
+        n_parallel_models: int
+            number of camera types whose models are evaluated
+            concurrently, cf. `RegressorClassifierBase`
+        parallel_backend: string or None
+            joblib backend used if `n_parallel_models != 1`
 
         Returns
         -------
@@ -153,4 +176,6 @@ class EnergyRegressor(RegressorClassifierBase):
             quantity you have trained for
 
         """
-        return super().load(path, cam_id_list, unit)
+        return super().load(path, cam_id_list, unit,
+                            n_parallel_models=n_parallel_models,
+                            parallel_backend=parallel_backend)
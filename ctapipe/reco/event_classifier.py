@@ -5,6 +5,7 @@ import pandas as pd
 from sklearn.ensemble import RandomForestClassifier
 
 from .regressor_classifier_base import RegressorClassifierBase
+from ..utils.grouping import group_mean
 
 __all__ = ['proba_drifting','EventClassifier']
 
@@ -30,32 +31,41 @@ class EventClassifier(RegressorClassifierBase):
         super().__init__(model=classifier, cam_id_list=cam_id_list, **kwargs)
 
     def predict_proba_by_event(self, X):
-        predict_proba = []
-        for evt in X:
-            tel_probas = None
-            tel_weights = []
-            for cam_id, tels in evt.items():
-                these_probas = self.model_dict[cam_id].predict_proba(tels)
-                if tel_probas is not None:
-                    tel_probas = np.append(these_probas, tel_probas, axis=0)
-                else:
-                    tel_probas = these_probas
-                try:
-                    # if a `namedtuple` is provided, we can weight the
-                    # different images using some of the provided features
-                    tel_weights += [t.sum_signal_cam / t.impact_dist for t in
-                                    tels]
-                except AttributeError:
-                    # otherwise give every image the same weight
-                    tel_weights += [1] * len(tels)
-
-            predict_proba.append(
-                np.average(proba_drifting(tel_probas),
-                           weights=tel_weights,
-                           axis=0)
-            )
-
-        return np.array(predict_proba)
+        features, event_index, weights = self.event_list_to_columns(X)
+        return self.predict_proba_by_event_columns(
+            features, event_index, weights, n_events=len(X)
+        )
+
+    def predict_proba_by_event_columns(self, features, event_index,
+                                       weights=None, n_events=None):
+        """
+        Columnar version of `predict_proba_by_event`: the classifier of
+        every telescope identifier is called only once on all its images
+        and the probabilities are averaged event-wise.
+
+        Parameters
+        ----------
+        features: dictionary of arrays
+            maps the telescope identifiers to the (n_images, n_features)
+            array of the feature-lists of all images of that type
+        event_index: dictionary of arrays
+            maps the telescope identifiers to the index of the event
+            every image belongs to
+        weights: dictionary of arrays, optional
+            weights of the images, by default all images have the same weight
+        n_events: int, optional
+            number of events, by default the largest event index + 1
+
+        Returns
+        -------
+        numpy.ndarray of shape (n_events, n_classes), nan for events
+        without images
+        """
+        probas, weights, offsets = self._predict_columns(
+            "predict_proba", features, event_index, weights, n_events,
+            n_outputs=len(self.classes_),
+        )
+        return group_mean(proba_drifting(probas), offsets, weights)
 
     def predict_by_event(self, X):
         proba = self.predict_proba_by_event(X)
@@ -13,11 +13,16 @@ import itertools
 import astropy.units as u
 from ctapipe.reco.reco_algorithms import Reconstructor
 from ctapipe.io.containers import ReconstructedShowerContainer
+from ctapipe.core.instrumentation import instrumented
 from ctapipe.instrument import get_atmosphere_profile_functions
+from ctapipe.utils.grouping import group_offsets, group_pairs, group_sum
 
 from astropy.coordinates import SkyCoord, AltAz
+from astropy.coordinates.matrix_utilities import rotation_matrix, matrix_product
+from astropy.table import Table
 from ctapipe.coordinates import NominalFrame
 from ctapipe.coordinates import TiltedGroundFrame, project_to_ground
+from ctapipe.coordinates.ground_frames import get_shower_trans_matrix
 
 __all__ = [
     'HillasIntersection'
@@ -42,15 +47,26 @@ class HillasIntersection(Reconstructor):
     Uncertainties on the positions are provided by taking the spread of the
     crossing points, however this means that no uncertainty can be provided
     for multiplicity 2 events.
+
+    Parameters
+    ----------
+    atmosphere_profile_name: str
+        Name of the atmosphere profile used to convert the height of
+        maximum to the depth of maximum
+    observation_level: astropy.units.Quantity
+        Height of the telescopes above sea level
     """
 
-    def __init__(self, atmosphere_profile_name="paranal"):
+    def __init__(self, atmosphere_profile_name="paranal",
+                 observation_level=2100 * u.m):
 
         # We need a conversion function from height above ground to depth of maximum
         # To do this we need the conversion table from CORSIKA
         _ = get_atmosphere_profile_functions(atmosphere_profile_name)
         self.thickness_profile, self.altitude_profile = _
+        self.observation_level = observation_level
 
+    @instrumented()
     def predict(self, hillas_parameters, tel_x, tel_y, array_direction):
         """
 
@@ -80,9 +96,9 @@ class HillasIntersection(Reconstructor):
         err_y *= u.rad
 
         nom = SkyCoord(
-            x=src_x * u.rad,
-            y=src_y * u.rad,
-            frame=NominalFrame(array_direction=array_direction)
+            delta_az=src_x * u.rad,
+            delta_alt=src_y * u.rad,
+            frame=NominalFrame(origin=array_direction)
         )
         horiz = nom.transform_to(AltAz())
 
@@ -99,7 +115,7 @@ class HillasIntersection(Reconstructor):
         result.core_y = grd.y
 
         x_max = self.reconstruct_xmax(
-            nom.x, nom.y,
+            nom.delta_az, nom.delta_alt,
             tilt.x, tilt.y,
             hillas_parameters,
             tel_x, tel_y,
@@ -331,7 +347,7 @@ class HillasIntersection(Reconstructor):
         mean_height *= np.cos(zen)
 
         # Add on the height of the detector above sea level
-        mean_height += 2100  # TODO: replace with instrument info
+        mean_height += self.observation_level.to_value(u.m)
 
         if mean_height > 100000 or np.isnan(mean_height):
             mean_height = 100000
@@ -344,6 +360,148 @@ class HillasIntersection(Reconstructor):
 
         return x_max
 
+    def predict_batch(self, event_index, tel_ids, x, y, psi, intensity,
+                      tel_x, tel_y, array_direction, weighting="Konrad"):
+        """
+        Reconstruct many events in one call from columnar hillas parameters
+        in the nominal system, with one row per image. This performs the
+        same reconstruction as `predict`, vectorized over all events.
+
+        Events with less than two images get NaN values and
+        ``is_valid = False``.
+
+        Parameters
+        ----------
+        event_index: array-like
+            event identifier of each image, images of the same event have to
+            be in consecutive rows
+        tel_ids: array-like
+            telescope id of each image
+        x, y: astropy.units.Quantity
+            hillas centroid in the nominal system
+        psi: astropy.units.Quantity
+            hillas orientation angle
+        intensity: array-like
+            image intensity
+        tel_x: dict
+            Dictionary containing telescope position on ground for all
+            telescopes
+        tel_y: dict
+            Dictionary containing telescope position on ground for all
+            telescopes
+        array_direction: AltAz
+            Pointing direction of the array
+        weighting: str
+            Weighting scheme for averaging of crossing points, "Konrad"
+            or "HESS"
+
+        Returns
+        -------
+        astropy.table.Table:
+            one row per event, with the columns ``event_index``, ``alt``,
+            ``az``, ``alt_uncert``, ``az_uncert``, ``core_x``, ``core_y``,
+            ``core_uncert``, ``h_max``, ``multiplicity`` and ``is_valid``
+        """
+        events, offsets = group_offsets(event_index)
+        tel_ids = np.asanyarray(tel_ids)
+        cog_x = u.Quantity(x).to_value(u.rad)
+        cog_y = u.Quantity(y).to_value(u.rad)
+        psi = u.Quantity(psi).to_value(u.rad)
+        intensity = np.asanyarray(intensity, dtype=np.float64)
+
+        unique_ids, tel_index = np.unique(tel_ids, return_inverse=True)
+        pos_x = np.array([tel_x[t].to_value(u.m) for t in unique_ids])[tel_index]
+        pos_y = np.array([tel_y[t].to_value(u.m) for t in unique_ids])[tel_index]
+
+        if weighting == "Konrad":
+            weight_fn = self.weight_konrad
+        elif weighting == "HESS":
+            weight_fn = self.weight_hess
+        else:
+            raise ValueError(f"Unknown weighting scheme '{weighting}'")
+
+        first, second, pair_offsets = group_pairs(offsets)
+        weight = weight_fn(intensity[first], intensity[second])
+        weight *= self.weight_sin(psi[first], psi[second])
+
+        def weighted_mean_std(values_x, values_y):
+            sum_weight = group_sum(weight, pair_offsets)
+            mean_x = group_sum(values_x * weight, pair_offsets) / sum_weight
+            mean_y = group_sum(values_y * weight, pair_offsets) / sum_weight
+            pair_event = np.repeat(np.arange(len(events)), np.diff(pair_offsets))
+            var_x = group_sum(
+                (values_x - mean_x[pair_event]) ** 2 * weight, pair_offsets
+            ) / sum_weight
+            var_y = group_sum(
+                (values_y - mean_y[pair_event]) ** 2 * weight, pair_offsets
+            ) / sum_weight
+            return mean_x, mean_y, np.sqrt(var_x), np.sqrt(var_y)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # direction, see reconstruct_nominal
+            sx, sy = self.intersect_lines(cog_x[first], cog_y[first], psi[first],
+                                          cog_x[second], cog_y[second], psi[second])
+            src_x, src_y, err_x, err_y = weighted_mean_std(sx, sy)
+
+            # core, see reconstruct_tilted
+            cx, cy = self.intersect_lines(pos_x[first], pos_y[first], psi[first],
+                                          pos_x[second], pos_y[second], psi[second])
+            core_x, core_y, core_err_x, core_err_y = weighted_mean_std(cx, cy)
+
+            # depth of maximum, see reconstruct_xmax
+            image_event = np.repeat(np.arange(len(events)), np.diff(offsets))
+            height = get_shower_height(src_x[image_event], src_y[image_event],
+                                       cog_x, cog_y,
+                                       core_x[image_event], core_y[image_event],
+                                       pos_x, pos_y)
+            mean_height = (
+                group_sum(height * intensity, offsets) / group_sum(intensity, offsets)
+            )
+
+        alt0 = array_direction.alt.to_value(u.rad)
+        az0 = array_direction.az.to_value(u.rad)
+        zen = np.pi / 2 - alt0
+
+        mean_height *= np.cos(zen)
+        mean_height += self.observation_level.to_value(u.m)
+        mean_height[(mean_height > 100000) | np.isnan(mean_height)] = 100000
+        x_max = self.thickness_profile(mean_height * u.m) / np.cos(zen)
+
+        # nominal system to horizontal system, as the NominalFrame transformation
+        to_nominal = matrix_product(rotation_matrix(-alt0 * u.rad, 'y'),
+                                    rotation_matrix(az0 * u.rad, 'z'))
+        cos_src_y = np.cos(src_y)
+        direction = np.column_stack([
+            cos_src_y * np.cos(src_x),
+            cos_src_y * np.sin(src_x),
+            np.sin(src_y),
+        ]) @ to_nominal
+        alt = np.arctan2(direction[:, 2], np.hypot(direction[:, 0], direction[:, 1]))
+        az = np.arctan2(direction[:, 1], direction[:, 0]) % (2 * np.pi)
+
+        # tilted system to ground, see project_to_ground
+        trans = get_shower_trans_matrix(az0, alt0)
+        ground = np.column_stack([core_x, core_y]) @ trans[:2]
+        ground_x = ground[:, 0] - trans[2][0] * ground[:, 2] / trans[2][2]
+        ground_y = ground[:, 1] - trans[2][1] * ground[:, 2] / trans[2][2]
+
+        multiplicity = np.diff(offsets)
+        src_error = np.sqrt(err_x ** 2 + err_y ** 2)
+
+        return Table({
+            'event_index': events,
+            'alt': alt * u.rad,
+            'az': az * u.rad,
+            'alt_uncert': np.rad2deg(src_error) * u.deg,
+            'az_uncert': np.rad2deg(src_error) * u.deg,
+            'core_x': ground_x * u.m,
+            'core_y': ground_y * u.m,
+            'core_uncert': np.sqrt(core_err_x ** 2 + core_err_y ** 2) * u.m,
+            'h_max': x_max,
+            'multiplicity': multiplicity,
+            'is_valid': (multiplicity >= 2) & np.isfinite(alt),
+        })
+
     @staticmethod
     def intersect_lines(xp1, yp1, phi1, xp2, yp2, phi2):
         """
@@ -5,6 +5,14 @@ import numpy as np
 from astropy import units as u
 from sklearn.preprocessing import StandardScaler
 
+try:
+    import joblib
+except ImportError:
+    # older scikit-learn versions ship their own copy of joblib
+    from sklearn.externals import joblib
+
+from ..utils.grouping import group_offsets_from_index
+
 
 class RegressorClassifierBase:
     """This class collects one model for every camera type -- given by
@@ -35,19 +43,40 @@ class RegressorClassifierBase:
         scikit-learn regressors don't work with astropy unit. so, tell
         in advance in which unit we want to deal here in case we need
         one. (default: 1)
+    n_parallel_models: int
+        number of camera types whose models are trained or evaluated
+        concurrently, -1 to use all cores. (default: 1)
+        This is independent of the `n_jobs` each model might use
+        itself, which can be passed with `kwargs`; make sure that
+        `n_parallel_models * n_jobs` does not exceed the number of cores.
+    parallel_backend: string or None
+        joblib backend used if `n_parallel_models != 1`, e.g. "loky"
+        (processes, the default) or "threading". With processes, the
+        models are copied to the workers for every call, so for
+        prediction with large models "threading" can be faster.
     kwargs: **dict
         arguments to be passed on to the constructor of the regressors
 
     """
 
-    def __init__(self, model, cam_id_list, unit=1, **kwargs):
+    def __init__(self, model, cam_id_list, unit=1,
+                 n_parallel_models=1, parallel_backend=None, **kwargs):
         self.model_dict = {}
         self.input_features_dict = {}
         self.output_features_dict = {}
         self.unit = unit
+        self.n_parallel_models = n_parallel_models
+        self.parallel_backend = parallel_backend
         for cam_id in cam_id_list or []:
             self.model_dict[cam_id] = model(**deepcopy(kwargs))
 
+    def _parallel(self, n_tasks):
+        """joblib executor for running `n_tasks` per-camera-type tasks"""
+        n_jobs = self.n_parallel_models
+        if n_jobs > 0:
+            n_jobs = min(n_jobs, n_tasks)
+        return joblib.Parallel(n_jobs=n_jobs, backend=self.parallel_backend)
+
     def __getattr__(self, attr):
         """We interface this class with the "first" model in `.model_dict`
         and relay all function calls over to it. This gives access to
@@ -152,6 +181,133 @@ class RegressorClassifierBase:
                     trainTarget[cam_id] += [target] * len(tels)
         return trainFeatures, trainTarget
 
+    def event_list_to_columns(self, event_list):
+        """Convert a list of events to the columnar layout used by the
+        `..._by_event_columns` prediction methods: for every camera
+        identifier one 2D array of features, one row per image, and the
+        index of the event in `event_list` each image belongs to.
+
+        Parameters
+        ----------
+        event_list : list of "events"
+            cf. `.reshuffle_event_list` under Notes
+
+        Returns
+        -------
+        features : dictionary of arrays
+            maps the camera identifiers to arrays of shape
+            (n_images, n_features)
+        event_index : dictionary of arrays
+            maps the camera identifiers to the event index of every image
+        weights : dictionary of arrays
+            maps the camera identifiers to the weight of every image,
+            `sum_signal_cam / impact_dist` if the feature-lists provide
+            these attributes (e.g. a `namedtuple`), otherwise 1
+
+        Raises
+        ------
+        KeyError:
+            in case `event_list` contains keys that were not provided with
+            `cam_id_list` during `.__init__` or `.load`.
+
+        """
+        features = {}
+        event_index = {}
+        weights = {}
+
+        for i, evt in enumerate(event_list):
+            for cam_id, tels in evt.items():
+                if cam_id not in self.model_dict:
+                    raise KeyError("cam_id '{}' in event_list but no model defined: {}"
+                                   .format(cam_id, [k for k in self.model_dict]))
+
+                features.setdefault(cam_id, []).extend(tels)
+                event_index.setdefault(cam_id, []).extend([i] * len(tels))
+                cam_weights = weights.setdefault(cam_id, [])
+                try:
+                    # if a `namedtuple` is provided, we can weight the
+                    # different images using some of the provided features
+                    cam_weights += [t.sum_signal_cam / t.impact_dist for t in tels]
+                except AttributeError:
+                    # otherwise give every image the same weight
+                    cam_weights += [1] * len(tels)
+
+        features = {cam_id: np.asarray(f) for cam_id, f in features.items()}
+        event_index = {cam_id: np.asarray(i, dtype=np.intp)
+                       for cam_id, i in event_index.items()}
+        weights = {cam_id: np.asarray(w, dtype=np.float64)
+                   for cam_id, w in weights.items()}
+
+        return features, event_index, weights
+
+    def _predict_columns(self, method, features, event_index,
+                         weights=None, n_events=None, n_outputs=None):
+        """Call `method` of the models once per camera identifier on all
+        images of that camera type and sort the results by event.
+
+        Parameters
+        ----------
+        method : string
+            name of the model method to call, e.g. "predict"
+        features, event_index, weights :
+            cf. `.event_list_to_columns`, `weights` may be None or miss
+            some camera identifiers, in which case the images get the
+            same weight
+        n_events : int, optional
+            total number of events, by default the largest event index + 1
+        n_outputs : int, optional
+            number of values `method` returns per image, if more than one
+
+        Returns
+        -------
+        results : numpy.ndarray
+            output of `method` for all images, sorted by event
+        weights : numpy.ndarray
+            the corresponding weights
+        offsets : numpy.ndarray
+            offsets of the events in `results`, cf.
+            `ctapipe.utils.grouping.group_offsets`
+
+        """
+        weights = weights or {}
+        tasks = []
+        indices = []
+        all_weights = []
+
+        for cam_id, cam_features in features.items():
+            if cam_id not in self.model_dict:
+                raise KeyError("cam_id '{}' in features but no model defined: {}"
+                               .format(cam_id, [k for k in self.model_dict]))
+
+            cam_event_index = np.asanyarray(event_index[cam_id], dtype=np.intp)
+            if len(cam_event_index) == 0:
+                continue
+
+            tasks.append(joblib.delayed(_call_model)(
+                self.model_dict[cam_id], method, cam_features
+            ))
+            indices.append(cam_event_index)
+            if weights.get(cam_id) is None:
+                all_weights.append(np.ones(len(cam_event_index)))
+            else:
+                all_weights.append(np.asanyarray(weights[cam_id], dtype=np.float64))
+
+        results = self._parallel(len(tasks))(tasks) if tasks else []
+
+        if not results:
+            shape = (0, ) if n_outputs is None else (0, n_outputs)
+            results.append(np.empty(shape))
+            indices.append(np.empty(0, dtype=np.intp))
+            all_weights.append(np.empty(0))
+
+        order, offsets = group_offsets_from_index(
+            np.concatenate(indices), n_events
+        )
+        results = np.concatenate(results)[order]
+        all_weights = np.concatenate(all_weights)[order]
+
+        return results, all_weights, offsets
+
     def fit(self, X, y, sample_weight=None):
         """This function fits a model against the collected features;
         separately for every telescope identifier.
@@ -184,6 +340,8 @@ class RegressorClassifierBase:
         """
 
         sample_weight = sample_weight or {}
+        cam_ids = []
+        tasks = []
 
         for cam_id in X:
             if cam_id not in y:
@@ -194,19 +352,18 @@ class RegressorClassifierBase:
                 raise KeyError("cam_id '{}' in X but no model defined: {}"
                                .format(cam_id, [k for k in self.model_dict]))
 
-            # add a `None` entry in the weights dictionary in case there is no entry yet
-            if cam_id not in sample_weight:
-                sample_weight[cam_id] = None
-
             # for every `cam_id` train one model (as long as there are events in `X`)
             if len(X[cam_id]):
-                try:
-                    self.model_dict[cam_id].fit(X[cam_id], y[cam_id],
-                                                sample_weight=sample_weight[cam_id])
-                except (TypeError, ValueError):
-                    # some models do not like `sample_weight` in the `fit` call...
-                    # catch the exception and try again without the weights
-                    self.model_dict[cam_id].fit(X[cam_id], y[cam_id])
+                cam_ids.append(cam_id)
+                tasks.append(joblib.delayed(_fit_model)(
+                    self.model_dict[cam_id], X[cam_id], y[cam_id],
+                    sample_weight.get(cam_id),
+                ))
+
+        if tasks:
+            # with a process backend, the fitted models are copies
+            fitted_models = self._parallel(len(tasks))(tasks)
+            self.model_dict.update(zip(cam_ids, fitted_models))
 
         return self
 
@@ -257,7 +414,6 @@ class RegressorClassifierBase:
 
         """
 
-        from sklearn.externals import joblib
         for cam_id, model in self.model_dict.items():
             try:
                 # assume that there is a `{cam_id}` keyword to replace
@@ -271,7 +427,8 @@ class RegressorClassifierBase:
                 joblib.dump(model, path.format(cam_id))
 
     @classmethod
-    def load(cls, path, cam_id_list, unit=1):
+    def load(cls, path, cam_id_list, unit=1,
+             n_parallel_models=1, parallel_backend=None):
         """Load the pickled dictionary of model from disk, create a husk
         `cls` instance and fill the model dictionary.
 
@@ -291,19 +448,27 @@ class RegressorClassifierBase:
             units. so append this one to the predictions in case you
             deal with unified targets (like energy).  assuming that
             the models where trained with consistent units.  clf
+        n_parallel_models: int
+            number of camera types whose models are evaluated
+            concurrently, cf. `RegressorClassifierBase`
+        parallel_backend: string or None
+            joblib backend used if `n_parallel_models != 1`
+
+        Returns
+        -------
         self : RegressorClassifierBase
             in derived classes, this will return a ready-to-use
             instance of that class to predict any problem you have
             trained for
 
         """
-        from sklearn.externals import joblib
-
         # need to get an instance of this class `cam_id_list=None`
         # prevents `.__init__` to initialise `.model_dict` itself,
         # since we are going to set it with the pickled models
         # manually
-        self = cls(cam_id_list=None, unit=unit)
+        self = cls(cam_id_list=None, unit=unit,
+                   n_parallel_models=n_parallel_models,
+                   parallel_backend=parallel_backend)
         for key in cam_id_list:
             try:
                 # assume that there is a `{cam_id}` keyword to replace
@@ -399,3 +564,19 @@ class RegressorClassifierBase:
             axs.ravel()[j].axis('off')
 
         return fig
+
+
+def _fit_model(model, X, y, sample_weight=None):
+    """fit a single model, returns the fitted model"""
+    try:
+        model.fit(X, y, sample_weight=sample_weight)
+    except (TypeError, ValueError):
+        # some models do not like `sample_weight` in the `fit` call...
+        # catch the exception and try again without the weights
+        model.fit(X, y)
+    return model
+
+
+def _call_model(model, method, X):
+    """call `method` of a single model on `X`"""
+    return getattr(model, method)(X)
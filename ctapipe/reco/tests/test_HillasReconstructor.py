@@ -3,10 +3,17 @@ from astropy import units as u
 
 from ctapipe.image.cleaning import tailcuts_clean
 from ctapipe.image.hillas import hillas_parameters, HillasParameterizationError
+from ctapipe.instrument import (
+    CameraGeometry,
+    OpticsDescription,
+    SubarrayDescription,
+    TelescopeDescription,
+)
 from ctapipe.io import event_source
+from ctapipe.io.containers import HillasParametersContainer, InstrumentContainer
 from ctapipe.reco.HillasReconstructor import HillasReconstructor, HillasPlane
 from ctapipe.utils import get_dataset_path
-from astropy.coordinates import SkyCoord, AltAz
+from astropy.coordinates import SkyCoord, AltAz, Angle
 
 
 def test_estimator_results():
@@ -80,6 +87,103 @@ def test_h_max_results():
     # np.testing.assert_allclose(fitted_core_position.value, [0, 0], atol=1e-3)
 
 
+def make_test_subarray():
+    optics = OpticsDescription(mirror_type='DC', tel_type='MST',
+                               tel_subtype='', equivalent_focal_length=16 * u.m)
+    camera = CameraGeometry.make_rectangular()
+    positions = {1: [-100, 50, 0] * u.m, 2: [120, 10, 2] * u.m,
+                 3: [0, -140, -1] * u.m}
+    return SubarrayDescription(
+        'test',
+        tel_positions=positions,
+        tel_descriptions={t: TelescopeDescription(optics, camera) for t in positions},
+    )
+
+
+def make_test_hillas_dict():
+    return {
+        1: HillasParametersContainer(x=0.1 * u.m, y=0.05 * u.m, intensity=200,
+                                     length=0.1 * u.m, width=0.03 * u.m,
+                                     psi=Angle(30 * u.deg)),
+        2: HillasParametersContainer(x=-0.12 * u.m, y=0.02 * u.m, intensity=400,
+                                     length=0.15 * u.m, width=0.04 * u.m,
+                                     psi=Angle(-20 * u.deg)),
+        3: HillasParametersContainer(x=0.02 * u.m, y=-0.15 * u.m, intensity=150,
+                                     length=0.08 * u.m, width=0.02 * u.m,
+                                     psi=Angle(80 * u.deg)),
+    }
+
+
+def test_parallel_pointing_matches_astropy():
+    """
+    the numpy implementation for parallel pointing has to give the same
+    results as the implementation using the astropy coordinate frames
+    """
+    inst = InstrumentContainer()
+    inst.subarray = make_test_subarray()
+    hillas_dict = make_test_hillas_dict()
+
+    pointing_alt = {t: 70 * u.deg for t in hillas_dict}
+    pointing_az = {t: 10 * u.deg for t in hillas_dict}
+
+    fast = HillasReconstructor().predict(hillas_dict, inst, pointing_alt,
+                                         pointing_az)
+    slow = HillasReconstructor(use_astropy_frames=True).predict(
+        hillas_dict, inst, pointing_alt, pointing_az
+    )
+
+    for field in ('alt', 'az', 'alt_uncert'):
+        np.testing.assert_allclose(fast[field].to_value(u.deg),
+                                   slow[field].to_value(u.deg), atol=1e-6)
+    for field in ('core_x', 'core_y', 'h_max'):
+        np.testing.assert_allclose(u.Quantity(fast[field]).value,
+                                   u.Quantity(slow[field]).value,
+                                   rtol=1e-6, atol=1e-6)
+
+
+def test_predict_batch():
+    """
+    reconstructing a table of images at once has to give the same results
+    as reconstructing event by event
+    """
+    inst = InstrumentContainer()
+    inst.subarray = make_test_subarray()
+    hillas_dict = make_test_hillas_dict()
+    fit = HillasReconstructor()
+
+    # events with 3, 1 and 2 images
+    events = [hillas_dict, {2: hillas_dict[2]}, {1: hillas_dict[1], 3: hillas_dict[3]}]
+    rows = [(event_id, tel_id, h)
+            for event_id, event in enumerate(events)
+            for tel_id, h in event.items()]
+
+    result = fit.predict_batch(
+        event_index=[r[0] for r in rows],
+        tel_ids=[r[1] for r in rows],
+        x=u.Quantity([r[2].x for r in rows]),
+        y=u.Quantity([r[2].y for r in rows]),
+        psi=u.Quantity([r[2].psi for r in rows]),
+        intensity=[r[2].intensity for r in rows],
+        length=u.Quantity([r[2].length for r in rows]),
+        width=u.Quantity([r[2].width for r in rows]),
+        subarray=inst.subarray,
+        pointing_alt=70 * u.deg,
+        pointing_az=10 * u.deg,
+    )
+
+    assert len(result) == 3
+    assert result['is_valid'].tolist() == [True, False, True]
+    assert result['multiplicity'].tolist() == [3, 1, 2]
+
+    for row, event in zip(result[result['is_valid']], [events[0], events[2]]):
+        expected = fit.predict(event, inst,
+                               {t: 70 * u.deg for t in event},
+                               {t: 10 * u.deg for t in event})
+        for field in ('alt', 'az', 'alt_uncert', 'core_x', 'core_y', 'h_max'):
+            np.testing.assert_allclose(row[field], u.Quantity(expected[field]).value,
+                                       rtol=1e-8, atol=1e-8)
+
+
 def test_reconstruction():
     """
     a test of the complete fit procedure on one event including:
@@ -5,9 +5,9 @@ from numpy.testing import assert_allclose
 
 from ctapipe.io.containers import (ReconstructedShowerContainer,
                                    ReconstructedEnergyContainer)
-from ctapipe.reco.ImPACT import ImPACTReconstructor
+from ctapipe.reco.ImPACT import ImPACTReconstructor, ImPACTReconstructorPool
 from ctapipe.io.containers import HillasParametersContainer
-from astropy.coordinates import Angle
+from astropy.coordinates import Angle, AltAz, SkyCoord
 
 
 class TestImPACT():
@@ -46,6 +46,48 @@ class TestImPACT():
         assert_allclose(self.impact_reco.peak_x[0]*(180/np.pi), 1, rtol=0, atol=0.001)
         assert_allclose(self.impact_reco.peak_y[0]*(180/np.pi), 1, rtol=0, atol=0.001)
 
+    def test_event_buffers(self):
+        """
+        Test that padded event arrays are reused and padding is masked
+        """
+        pixel_x = np.array([0., 1., 0., -1.]) * u.deg
+        pixel_y = np.array([-1., 0., 1., 0.]) * u.deg
+        image = np.array([1, 0, 1, 1])
+
+        self.impact_reco.set_event_properties({1: image, 2: image[:2]},
+                                              {1: image, 2: image[:2]},
+                                              {1: pixel_x, 2: pixel_x[:2]},
+                                              {1: pixel_y, 2: pixel_y[:2]},
+                                              {1: "DUMMY", 2: "DUMMY"},
+                                              {1: 0 * u.m, 2: 10 * u.m},
+                                              {1: 0 * u.m, 2: 10 * u.m},
+                                              array_direction=[0 * u.deg,
+                                                               0 * u.deg],
+                                              hillas={1: self.h1, 2: self.h1})
+
+        assert self.impact_reco.image.shape == (2, 4)
+        assert_allclose(self.impact_reco.pixel_x[0], pixel_x.to_value(u.rad))
+        assert_allclose(self.impact_reco.tel_pos_x, [0, 10])
+        assert self.impact_reco.image_mask.tolist() == [[True, False, True, True],
+                                                        [True, False, False, False]]
+        first_image = self.impact_reco.image
+
+        self.impact_reco.set_event_properties({1: image, 2: image},
+                                              {1: image, 2: image},
+                                              {1: pixel_x, 2: pixel_x},
+                                              {1: pixel_y, 2: pixel_y},
+                                              {1: "DUMMY", 2: "DUMMY"},
+                                              {1: 0 * u.m, 2: 10 * u.m},
+                                              {1: 0 * u.m, 2: 10 * u.m},
+                                              array_direction=[0 * u.deg,
+                                                               0 * u.deg],
+                                              hillas={1: self.h1, 2: self.h1})
+
+        assert self.impact_reco.image is first_image
+        assert self.impact_reco.image_mask[1].tolist() == [True, False, True, True]
+        # the per-telescope time gradients of the likelihood are buffered too
+        assert self.impact_reco._buffers[(2, 4)]["time_gradients"].shape == (2, 2)
+
     def test_rotation(self):
         """Test pixel rotation function"""
         x = np.array([1])
@@ -144,3 +186,111 @@ class TestImPACT():
 
         like = self.impact_reco.get_likelihood(0, 0, 0, 100, 1, 0)
         assert like is not np.nan and like > 0
+
+
+class StubTemplate:
+    """Gaussian image template, replacing the template library"""
+
+    def __call__(self, energy, impact, x_max, pix_x, pix_y, mask=None):
+        amplitude = 100 * energy[:, np.newaxis] * np.exp(-impact[:, np.newaxis] / 200)
+        return amplitude * np.exp(-0.5 * ((pix_x - 0.5)**2 / 0.1 + pix_y**2 / 0.02))
+
+
+def make_stub_reconstructor():
+    reco = ImPACTReconstructor(minimiser="L-BFGS-B")
+    reco.prediction["LSTCam"] = StubTemplate()
+    return reco
+
+
+def make_events(n_events, n_tels=3):
+    """Events of a small square camera with poisson images, as keyword
+    arguments of predict_event"""
+    rng = np.random.RandomState(0)
+    grid = np.linspace(-2, 2, 15)
+    pixel_x, pixel_y = np.meshgrid(grid, grid)
+    pixel_x = pixel_x.ravel() * u.deg
+    pixel_y = pixel_y.ravel() * u.deg
+
+    tel_ids = list(range(1, n_tels + 1))
+    hillas = HillasParametersContainer(x=0.5 * u.deg, y=0.2 * u.deg,
+                                       r=0.5 * u.deg, phi=Angle(0.3 * u.rad),
+                                       intensity=100,
+                                       length=0.4 * u.deg, width=0.1 * u.deg,
+                                       psi=Angle(0.3 * u.rad),
+                                       skewness=0, kurtosis=0)
+
+    events = []
+    for _ in range(n_events):
+        events.append(dict(
+            image={t: rng.poisson(5, pixel_x.size).astype(float) for t in tel_ids},
+            time={t: np.zeros(pixel_x.size) for t in tel_ids},
+            pixel_x={t: pixel_x for t in tel_ids},
+            pixel_y={t: pixel_y for t in tel_ids},
+            type_tel={t: "LSTCam" for t in tel_ids},
+            tel_x={t: 100 * i * u.m for i, t in enumerate(tel_ids)},
+            tel_y={t: 0 * u.m for t in tel_ids},
+            array_direction=SkyCoord(alt=70 * u.deg, az=0 * u.deg, frame=AltAz()),
+            hillas={t: hillas for t in tel_ids},
+            shower_seed=ReconstructedShowerContainer(alt=70 * u.deg, az=0 * u.deg,
+                                                     core_x=50 * u.m,
+                                                     core_y=20 * u.m),
+            energy_seed=ReconstructedEnergyContainer(energy=1 * u.TeV),
+        ))
+    return events
+
+
+def predict_serial(reco, event):
+    event = dict(event)
+    shower_seed = event.pop("shower_seed")
+    energy_seed = event.pop("energy_seed")
+    reco.set_event_properties(**event)
+    return reco.predict(shower_seed, energy_seed)
+
+
+def test_predict():
+    """predict runs through for a complete event"""
+    shower, energy = predict_serial(make_stub_reconstructor(), make_events(1)[0])
+
+    assert shower.is_valid
+    assert np.isfinite(shower.alt.value) and np.isfinite(shower.az.value)
+    assert energy.energy.unit == u.TeV
+
+
+def test_predict_event_keeps_state():
+    """predict_event leaves the event state of the reconstructor untouched"""
+    reco = make_stub_reconstructor()
+    first, second = make_events(2)
+    predict_serial(reco, first)
+
+    image, pixel_x = reco.image, reco.pixel_x
+    image_values = image.copy()
+    buffers = dict(reco._buffers)
+
+    second = dict(second)
+    result = reco.predict_event(**second)
+
+    assert reco.image is image and reco.pixel_x is pixel_x
+    assert_allclose(reco.image, image_values)
+    assert reco._buffers == buffers
+
+    expected = predict_serial(make_stub_reconstructor(), second)
+    assert_allclose(result[0].alt.value, expected[0].alt.value)
+    assert_allclose(result[1].energy.value, expected[1].energy.value)
+
+
+def test_reconstructor_pool():
+    """the pool gives the same results as the serial reconstruction"""
+    events = make_events(3)
+
+    pool = ImPACTReconstructorPool([], n_workers=2, minimiser="L-BFGS-B")
+    pool.reconstructor.prediction["LSTCam"] = StubTemplate()
+    with pool:
+        results = pool.map(events)
+
+    reco = make_stub_reconstructor()
+    for event, (shower, energy) in zip(events, results):
+        expected_shower, expected_energy = predict_serial(reco, event)
+        assert_allclose(shower.alt.value, expected_shower.alt.value)
+        assert_allclose(shower.az.value, expected_shower.az.value)
+        assert_allclose(shower.core_x.value, expected_shower.core_x.value)
+        assert_allclose(energy.energy.value, expected_energy.energy.value)
@@ -31,6 +31,24 @@ def test_fit_save_load():
         return reg, cam_id_list
 
 
+def test_load_parallel():
+    reg, cam_id_list = test_prepare_model()
+    with TemporaryDirectory() as d:
+        temp_path = "/".join([d, "reg_{cam_id}.pkl"])
+        reg.save(temp_path)
+        loaded = EnergyRegressor.load(temp_path, cam_id_list,
+                                      n_parallel_models=2,
+                                      parallel_backend="threading")
+
+    assert loaded.n_parallel_models == 2
+    assert loaded.parallel_backend == "threading"
+    prediction = loaded.predict_by_event([{"ASTRICam": [[10, 1]]},
+                                          {"FlashCam": [[2, 20]]}])
+    expected = reg.predict_by_event([{"ASTRICam": [[10, 1]]},
+                                     {"FlashCam": [[2, 20]]}])
+    assert_allclose(prediction["mean"].value, expected["mean"].value)
+
+
 def test_predict_by_event():
     np.random.seed(3)
 
@@ -44,3 +62,33 @@ def test_predict_by_event():
                                        {"FlashCam": [[2, 20]]},
                                        {"FlashCam": [[3, 30]]}])
     assert_allclose(prediction["mean"].value, [1, 2, 3], rtol=0.2)
+
+
+def test_predict_by_event_columns():
+    np.random.seed(3)
+
+    reg, cam_id_list = test_prepare_model()
+    event_list = [{"ASTRICam": [[10, 1], [20, 2]], "FlashCam": [[3, 30]]},
+                  {"FlashCam": [[1, 10], [2, 20], [0.9, 9]]},
+                  {"ASTRICam": [[30, 3]]}]
+
+    features, event_index, weights = reg.event_list_to_columns(event_list)
+    assert features["ASTRICam"].shape == (3, 2)
+    assert event_index["ASTRICam"].tolist() == [0, 0, 2]
+    assert event_index["FlashCam"].tolist() == [0, 1, 1, 1]
+
+    prediction = reg.predict_by_event_columns(features, event_index)
+
+    # same as predicting every event on its own
+    for i, event in enumerate(event_list):
+        predicts = np.concatenate([
+            reg.model_dict[cam_id].predict(tels)
+            for cam_id, tels in event.items()
+        ])
+        assert_allclose(prediction["mean"][i].to_value(u.TeV), np.mean(predicts))
+        assert_allclose(prediction["median"][i].to_value(u.TeV), np.median(predicts))
+        assert_allclose(prediction["std"][i].to_value(u.TeV), np.std(predicts))
+
+    # events without any image get nan
+    prediction = reg.predict_by_event_columns(features, event_index, n_events=4)
+    assert np.isnan(prediction["mean"][3])
@@ -5,7 +5,7 @@ from sklearn.neural_network import MLPClassifier
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
 
-from ctapipe.reco.event_classifier import EventClassifier
+from ctapipe.reco.event_classifier import EventClassifier, proba_drifting
 
 
 def test_pipeline_classifier():
@@ -119,6 +119,32 @@ def test_predict_by_event():
     assert (prediction == ["b", "a", "a"]).all()
 
 
+def test_predict_proba_by_event_columns():
+    clf, cam_id_list = test_prepare_model()
+    event_list = [{"ASTRICam": [[10, 1]], "FlashCam": [[3, 30], [2, 20]]},
+                  {"FlashCam": [[10, 1]]},
+                  {"ASTRICam": [[3, 30], [2, 20]]}]
+
+    features, event_index, _ = clf.event_list_to_columns(event_list)
+    weights = {"ASTRICam": np.array([2.0, 1.0, 1.0]),
+               "FlashCam": np.array([1.0, 1.0, 1.0])}
+    proba = clf.predict_proba_by_event_columns(features, event_index, weights)
+
+    assert proba.shape == (3, 2)
+    expected = np.average(
+        proba_drifting(np.concatenate([
+            clf.model_dict["ASTRICam"].predict_proba([[10, 1]]),
+            clf.model_dict["FlashCam"].predict_proba([[3, 30], [2, 20]]),
+        ])),
+        weights=[2, 1, 1],
+        axis=0,
+    )
+    assert np.allclose(proba[0], expected)
+    assert np.allclose(
+        proba[1:], clf.predict_proba_by_event(event_list[1:])
+    )
+
+
 def test_Qfactor():
     """
     TODO: how to test validity of Q-factor values?
@@ -1,7 +1,10 @@
 from ctapipe.reco.hillas_intersection import HillasIntersection
+from ctapipe.io.containers import HillasParametersContainer
+from astropy.coordinates import SkyCoord, AltAz, Angle
 import astropy.units as u
 from numpy.testing import assert_allclose
 import numpy as np
+import pytest
 
 
 def test_intersect():
@@ -42,5 +45,59 @@ def test_parallel():
     assert_allclose(sx, np.nan, atol=1e-6)
     assert_allclose(sy, np.nan, atol=1e-6)
 
-test_intersect()
-test_parallel()
+
+def test_predict_batch():
+    """
+    Check that reconstructing a table of images gives the same result as
+    reconstructing event by event
+    """
+    hill = HillasIntersection()
+    hillas = {
+        1: HillasParametersContainer(x=0.01 * u.rad, y=0.005 * u.rad,
+                                     intensity=200, psi=Angle(30 * u.deg)),
+        2: HillasParametersContainer(x=-0.012 * u.rad, y=0.002 * u.rad,
+                                     intensity=400, psi=Angle(-20 * u.deg)),
+        3: HillasParametersContainer(x=0.002 * u.rad, y=-0.015 * u.rad,
+                                     intensity=150, psi=Angle(80 * u.deg)),
+    }
+    tel_x = {1: -100 * u.m, 2: 120 * u.m, 3: 0 * u.m}
+    tel_y = {1: 50 * u.m, 2: 10 * u.m, 3: -140 * u.m}
+    array_direction = SkyCoord(alt=70 * u.deg, az=10 * u.deg, frame=AltAz())
+
+    events = [hillas, {2: hillas[2]}, {1: hillas[1], 3: hillas[3]}]
+    rows = [(event_id, tel_id, h)
+            for event_id, event in enumerate(events)
+            for tel_id, h in event.items()]
+
+    columns = dict(
+        event_index=[r[0] for r in rows],
+        tel_ids=[r[1] for r in rows],
+        x=u.Quantity([r[2].x for r in rows]),
+        y=u.Quantity([r[2].y for r in rows]),
+        psi=u.Quantity([r[2].psi for r in rows]),
+        intensity=[r[2].intensity for r in rows],
+        tel_x=tel_x,
+        tel_y=tel_y,
+        array_direction=array_direction,
+    )
+    result = hill.predict_batch(**columns)
+
+    assert result['is_valid'].tolist() == [True, False, True]
+
+    for row, event in zip(result[result['is_valid']], [events[0], events[2]]):
+        expected = hill.predict(event, tel_x, tel_y, array_direction)
+        for field in ('alt', 'az', 'alt_uncert', 'core_x', 'core_y',
+                      'core_uncert', 'h_max'):
+            assert_allclose(
+                u.Quantity(row[field], result[field].unit),
+                u.Quantity(expected[field]).to(result[field].unit),
+                rtol=1e-6
+            )
+
+    with pytest.raises(ValueError):
+        hill.predict_batch(**columns, weighting="unknown")
+
+    # a higher observation level gives a smaller depth of maximum
+    high = HillasIntersection(observation_level=3000 * u.m)
+    high_result = high.predict_batch(**columns)
+    assert high_result['h_max'][0] < result['h_max'][0]
@@ -81,3 +81,32 @@ def test_show_importances():
     assert len(ax.get_xticklabels()) == 2
     for t in ax.get_xticklabels():
         assert t.get_text() in ['f1', 'f2']
+
+
+@pytest.mark.parametrize("backend", ["loky", "threading"])
+def test_parallel_models(backend):
+    cam_id_list = ["FlashCam", "ASTRICam"]
+    feature_list = {"FlashCam": [[1, 10], [2, 20], [3, 30], [0.9, 9]],
+                    "ASTRICam": [[10, 1], [20, 2], [30, 3], [9, 0.9]]}
+    target_list = {"FlashCam": [0, 1, 1, 0],
+                   "ASTRICam": [1, 0, 0, 0]}
+
+    models = [
+        RegressorClassifierBase(
+            model=RandomForestClassifier,
+            cam_id_list=cam_id_list,
+            n_parallel_models=n_parallel_models,
+            parallel_backend=backend,
+            n_estimators=10,
+            random_state=0,
+        ).fit(feature_list, target_list)
+        for n_parallel_models in (1, 2)
+    ]
+
+    event_index = {cam_id: [0, 0, 1, 2] for cam_id in cam_id_list}
+    results = [
+        model._predict_columns("predict_proba", feature_list, event_index)
+        for model in models
+    ]
+    for sequential, parallel in zip(*results):
+        assert (sequential == parallel).all()
@@ -0,0 +1,58 @@
+import pytest
+
+from ctapipe.benchmarks.runner import (
+    _parameter_sets,
+    find_benchmarks,
+    run_benchmark,
+)
+
+
+class SingleParameter:
+    params = ['a', 'b']
+
+
+class MultipleParameters:
+    params = [[1, 2], ['x', 'y', 'z']]
+
+
+class Counter:
+    params = [1, 2]
+
+    def setup(self, n):
+        self.calls = 0
+
+    def time_count(self, n):
+        self.calls += n
+
+    def teardown(self, n):
+        assert self.calls > 0
+
+
+def test_parameter_sets():
+    assert _parameter_sets(SingleParameter) == [('a', ), ('b', )]
+    assert len(_parameter_sets(MultipleParameters)) == 6
+    assert _parameter_sets(object) == [()]
+
+
+def test_run_benchmark():
+    assert run_benchmark(Counter, 'time_count', (2, ), repeat=2, number=10) >= 0
+
+
+def test_find_benchmarks():
+    benchmarks = find_benchmarks(r'Cleaning\.time_tailcuts_clean')
+    names = [name for name, *_ in benchmarks]
+    assert names == [
+        f'image.Cleaning.time_tailcuts_clean({camera})'
+        for camera in ['CHEC', 'NectarCam', 'LSTCam', 'SCTCam']
+    ]
+
+
+@pytest.mark.parametrize(
+    'benchmark',
+    find_benchmarks(r'\((CHEC|1|2)\b'),
+    ids=lambda benchmark: benchmark[0],
+)
+def test_benchmarks_run(benchmark):
+    """ all benchmarks must run, once with the smallest inputs """
+    name, cls, method, params = benchmark
+    run_benchmark(cls, method, params, repeat=1, number=1)
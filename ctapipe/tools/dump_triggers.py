@@ -18,6 +18,8 @@ MAX_TELS = 1000
 class DumpTriggersTool(Tool):
     description = Unicode(__doc__)
     name = 'ctapipe-dump-triggers'
+    input_trait = 'DumpTriggersTool.infile'
+    merge_attributes = ['events']
 
     # =============================================
     # configuration parameters:
@@ -92,9 +94,16 @@ class DumpTriggersTool(Tool):
                                    np.int32, np.uint8])
 
         self.events['TRIGGERED_TELS'].shape = (0, MAX_TELS)
+        # the times are relative within each input file, also when
+        # multiple files are processed with input_glob
         self.events['T_REL'].unit = u.s
-        self.events['T_REL'].description = 'Time relative to first event'
+        self.events['T_REL'].description = (
+            'Time relative to the first event of the input file'
+        )
         self.events['DELTA_T'].unit = u.s
+        self.events['DELTA_T'].description = (
+            'Time since the previous event of the input file'
+        )
         self.events.meta['INPUT'] = self.infile
 
         self._current_trigpattern = np.zeros(MAX_TELS)
@@ -112,6 +121,9 @@ class DumpTriggersTool(Tool):
         finish up and write out results (called automatically after
         `start()`)
         """
+        # the tables merged from multiple files only know their own input
+        self.events.meta['INPUT'] = self.input_glob or self.infile
+
         # write out the final table
         try:
             if self.outfile.endswith('fits') or self.outfile.endswith('fits.gz'):
@@ -27,6 +27,8 @@ class ChargeResolutionGenerator(Tool):
     name = "ChargeResolutionGenerator"
     description = ("Calculate the Charge Resolution from a sim_telarray "
                    "simulation and store within a HDF5 file.")
+    input_trait = 'SimTelEventSource.input_url'
+    merge_attributes = ['calculator']
 
     telescopes = List(Int, None, allow_none=True,
                       help='Telescopes to include from the event file. '
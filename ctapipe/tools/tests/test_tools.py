@@ -26,6 +26,23 @@ def test_dump_triggers(tmpdir):
     assert outfile.exists()
 
 
+def test_dump_triggers_merged_input(tmpdir):
+    """ the merged table of multiple input files names all of them """
+    from astropy.table import Table
+    from ctapipe.tools.dump_triggers import DumpTriggersTool
+
+    outfile = str(tmpdir.join("triggers.fits"))
+    tool = DumpTriggersTool(
+        infile='run1.simtel.gz',
+        input_glob='run*.simtel.gz',
+        outfile=outfile,
+    )
+    tool.setup()
+    tool.finish()
+
+    assert Table.read(outfile).meta['INPUT'] == 'run*.simtel.gz'
+
+
 def test_dump_instrument(tmpdir):
     from ctapipe.tools.dump_instrument import DumpInstrumentTool
 
@@ -1,9 +1,36 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
-from .fitshistogram import Histogram
-from .json2fits import json_to_fits
-from .dynamic_class import dynamic_class_from_module
-from .table_interpolator import TableInterpolator
-from .unstructured_interpolator import UnstructuredInterpolator
-from .datasets import (find_all_matching_datasets, get_table_dataset, get_dataset_path,
-                       find_in_path, get_dataset)
-from .CutFlow import CutFlow, PureCountingCut, UndefinedCut
+from .lazy import lazy_import_attributes
+
+__all__ = [
+    'Histogram',
+    'json_to_fits',
+    'dynamic_class_from_module',
+    'TableInterpolator',
+    'UnstructuredInterpolator',
+    'find_all_matching_datasets',
+    'get_table_dataset',
+    'get_dataset_path',
+    'find_in_path',
+    'get_dataset',
+    'CutFlow',
+    'PureCountingCut',
+    'UndefinedCut',
+]
+
+# the submodules are only imported on first access, as they pull in
+# heavy dependencies (astropy tables and wcs, scipy, pkg_resources)
+lazy_import_attributes(__name__, {
+    'Histogram': '.fitshistogram',
+    'json_to_fits': '.json2fits',
+    'dynamic_class_from_module': '.dynamic_class',
+    'TableInterpolator': '.table_interpolator',
+    'UnstructuredInterpolator': '.unstructured_interpolator',
+    'find_all_matching_datasets': '.datasets',
+    'get_table_dataset': '.datasets',
+    'get_dataset_path': '.datasets',
+    'find_in_path': '.datasets',
+    'get_dataset': '.datasets',
+    'CutFlow': '.CutFlow',
+    'PureCountingCut': '.CutFlow',
+    'UndefinedCut': '.CutFlow',
+})
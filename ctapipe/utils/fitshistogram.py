@@ -156,6 +156,24 @@ class Histogram:
         self.data += hist
         self._numsamples += len(datapoints)
 
+    def merge(self, other):
+        """
+        add the contents of another `Histogram` with the same binning to
+        this one, e.g. to combine histograms filled from different files
+
+        Parameters
+        ----------
+        other: Histogram
+            histogram with the same bins and ranges
+        """
+        if (np.any(self._nbins != other._nbins)
+                or not np.allclose(self._ranges, other._ranges)):
+            raise ValueError("Cannot merge histograms with different binning: "
+                             "{} and {}".format(self, other))
+
+        self.data += other.data
+        self._numsamples += other._numsamples
+
     def bin_centers(self, index):
         """
         returns array of bin centers for the given index
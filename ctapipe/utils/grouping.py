@@ -0,0 +1,242 @@
+"""
+Helpers to work on ragged, columnar data, where the rows belonging to the
+same group (e.g. the images of one event) are stored next to each other and
+identified by a group index. The groups are described by the offsets of their
+first rows (CSR layout), so group-wise reductions can be done with
+`numpy.ufunc.reduceat` instead of Python loops.
+"""
+import numpy as np
+
+__all__ = [
+    'group_offsets',
+    'group_offsets_from_index',
+    'group_sum',
+    'group_mean',
+    'group_std',
+    'group_median',
+    'group_pairs',
+]
+
+
+def group_offsets(group_index):
+    """
+    Find the groups in a group index column.
+
+    Parameters
+    ----------
+    group_index: array-like
+        group identifier of each row, rows of the same group have to be
+        contiguous
+
+    Returns
+    -------
+    groups: numpy.ndarray
+        group identifier of each group
+    offsets: numpy.ndarray
+        index of the first row of each group, with the total number of rows
+        appended, so group ``i`` is ``offsets[i]:offsets[i + 1]``
+    """
+    group_index = np.asanyarray(group_index)
+    if len(group_index) == 0:
+        return group_index[:0], np.zeros(1, dtype=np.intp)
+
+    starts = np.flatnonzero(group_index[1:] != group_index[:-1]) + 1
+    offsets = np.concatenate([[0], starts, [len(group_index)]]).astype(np.intp)
+    groups = group_index[offsets[:-1]]
+
+    if len(np.unique(groups)) != len(groups):
+        raise ValueError('Rows of the same group have to be contiguous')
+
+    return groups, offsets
+
+
+def group_offsets_from_index(group_index, n_groups=None):
+    """
+    Sort rows by an integer group index and compute the group offsets.
+
+    In contrast to `group_offsets`, the rows of a group do not need to be
+    contiguous, and group ``i`` is always the ``i``-th group, so groups
+    without rows are kept as empty groups.
+
+    Parameters
+    ----------
+    group_index: array-like
+        non-negative integer group index of each row
+    n_groups: int or None
+        total number of groups, defaults to ``max(group_index) + 1``
+
+    Returns
+    -------
+    order: numpy.ndarray
+        indices that sort the rows by group, rows of the same group keep
+        their relative order
+    offsets: numpy.ndarray
+        offsets of the groups in the sorted rows, see `group_offsets`
+    """
+    group_index = np.asanyarray(group_index, dtype=np.intp)
+    if n_groups is None:
+        n_groups = group_index.max() + 1 if len(group_index) else 0
+
+    order = np.argsort(group_index, kind='stable')
+    offsets = np.zeros(n_groups + 1, dtype=np.intp)
+    np.cumsum(np.bincount(group_index, minlength=n_groups), out=offsets[1:])
+    return order, offsets
+
+
+def group_sum(values, offsets):
+    """
+    Sum ``values`` along the first axis for each group.
+
+    Parameters
+    ----------
+    values: array-like
+        values to sum, with one row per entry of the group index
+    offsets: array-like
+        group offsets as returned by `group_offsets` or `group_pairs`
+
+    Returns
+    -------
+    numpy.ndarray: sums, one row per group, zero for empty groups
+    """
+    values = np.asanyarray(values)
+    offsets = np.asanyarray(offsets)
+    starts = offsets[:-1]
+    non_empty = offsets[1:] > starts
+
+    sums = np.zeros((len(starts), ) + values.shape[1:], dtype=values.dtype)
+    if np.any(non_empty):
+        sums[non_empty] = np.add.reduceat(values, starts[non_empty], axis=0)
+    return sums
+
+
+def group_mean(values, offsets, weights=None):
+    """
+    (Weighted) mean of ``values`` along the first axis for each group.
+
+    Parameters
+    ----------
+    values: array-like
+        values to average, with one row per entry of the group index
+    offsets: array-like
+        group offsets as returned by `group_offsets`
+    weights: array-like or None
+        one weight per row, if None all rows have the same weight
+
+    Returns
+    -------
+    numpy.ndarray: means, one row per group, nan for empty groups
+    """
+    values = np.asanyarray(values, dtype=np.float64)
+    if weights is None:
+        weights = np.ones(len(values))
+    weights = np.asanyarray(weights, dtype=np.float64)
+
+    # broadcast the weights over the trailing axes of the values
+    row_weights = weights.reshape((-1, ) + (1, ) * (values.ndim - 1))
+    sum_weights = group_sum(weights, offsets).reshape(
+        (-1, ) + (1, ) * (values.ndim - 1)
+    )
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return group_sum(values * row_weights, offsets) / sum_weights
+
+
+def group_std(values, offsets):
+    """
+    Standard deviation of ``values`` along the first axis for each group,
+    same as `numpy.std` with ``ddof=0``.
+
+    Parameters
+    ----------
+    values: array-like
+        values, with one row per entry of the group index
+    offsets: array-like
+        group offsets as returned by `group_offsets`
+
+    Returns
+    -------
+    numpy.ndarray: standard deviations, one row per group, nan for empty groups
+    """
+    values = np.asanyarray(values, dtype=np.float64)
+    counts = np.diff(offsets)
+    mean = group_mean(values, offsets)
+
+    deviation = values - np.repeat(mean, counts, axis=0)
+    return np.sqrt(group_mean(deviation**2, offsets))
+
+
+def group_median(values, offsets):
+    """
+    Median of one dimensional ``values`` for each group,
+    same as `numpy.median` for groups without nan values.
+
+    Parameters
+    ----------
+    values: array-like
+        values, one per entry of the group index
+    offsets: array-like
+        group offsets as returned by `group_offsets`
+
+    Returns
+    -------
+    numpy.ndarray: medians, one per group, nan for empty groups
+    """
+    values = np.asanyarray(values, dtype=np.float64)
+    offsets = np.asanyarray(offsets)
+    counts = np.diff(offsets)
+    group = np.repeat(np.arange(len(counts)), counts)
+
+    # sort by value inside each group
+    sorted_values = values[np.lexsort((values, group))]
+
+    non_empty = counts > 0
+    starts = offsets[:-1][non_empty]
+    lower = starts + (counts[non_empty] - 1) // 2
+    upper = starts + counts[non_empty] // 2
+
+    medians = np.full(len(counts), np.nan)
+    medians[non_empty] = 0.5 * (sorted_values[lower] + sorted_values[upper])
+    return medians
+
+
+def group_pairs(offsets):
+    """
+    Indices of all pairs of rows ``(i, j)`` with ``i < j`` inside each group.
+
+    The pairs are generated for all groups of the same size at once, so the
+    only Python loop is over the distinct group sizes.
+
+    Parameters
+    ----------
+    offsets: array-like
+        group offsets as returned by `group_offsets`
+
+    Returns
+    -------
+    first: numpy.ndarray
+        row index of the first element of each pair
+    second: numpy.ndarray
+        row index of the second element of each pair
+    pair_offsets: numpy.ndarray
+        offsets of the pairs of each group, pairs are sorted by group
+    """
+    offsets = np.asanyarray(offsets)
+    starts = offsets[:-1]
+    sizes = np.diff(offsets)
+    n_pairs = sizes * (sizes - 1) // 2
+
+    pair_offsets = np.zeros(len(sizes) + 1, dtype=np.intp)
+    np.cumsum(n_pairs, out=pair_offsets[1:])
+
+    first = np.empty(pair_offsets[-1], dtype=np.intp)
+    second = np.empty(pair_offsets[-1], dtype=np.intp)
+
+    for size in np.unique(sizes[sizes > 1]):
+        groups = np.flatnonzero(sizes == size)
+        i, j = np.triu_indices(size, 1)
+        # position of the pairs of these groups in the output
+        positions = pair_offsets[groups][:, np.newaxis] + np.arange(len(i))
+        first[positions] = starts[groups][:, np.newaxis] + i
+        second[positions] = starts[groups][:, np.newaxis] + j
+
+    return first, second, pair_offsets
@@ -0,0 +1,57 @@
+"""
+Lazy loading of the public attributes of a package.
+
+Packages like `ctapipe.io` expose classes from many submodules, which in turn
+import heavy dependencies (pytables, astropy tables, scipy, ...). With
+`lazy_import_attributes`, a submodule is only imported the first time one of
+its attributes is accessed on the package, so a plain ``import ctapipe.io``
+stays cheap.
+"""
+import importlib
+import sys
+from types import ModuleType
+
+__all__ = ['lazy_import_attributes']
+
+
+class _LazyModule(ModuleType):
+    """
+    Module type resolving missing attributes from the submodule that
+    defines them.
+    """
+
+    def __getattr__(self, name):
+        # only called if `name` is not yet in the module's __dict__
+        submodule = self.__dict__.get('_lazy_attributes', {}).get(name)
+        if submodule is None:
+            raise AttributeError(
+                f"module '{self.__name__}' has no attribute '{name}'"
+            )
+
+        value = getattr(importlib.import_module(submodule, self.__name__), name)
+        # cache, so the lookup happens only once
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self._lazy_attributes))
+
+
+def lazy_import_attributes(module_name, attributes):
+    """
+    Make the given attributes of a module lazily imported.
+
+    Usually called at the end of a package's ``__init__.py`` with
+    ``__name__`` as ``module_name``.
+
+    Parameters
+    ----------
+    module_name: str
+        name of the module providing the attributes
+    attributes: dict
+        maps the attribute names to the (relative) name of the
+        submodule defining them, e.g. ``{'Histogram': '.fitshistogram'}``
+    """
+    module = sys.modules[module_name]
+    module.__dict__.setdefault('_lazy_attributes', {}).update(attributes)
+    module.__class__ = _LazyModule
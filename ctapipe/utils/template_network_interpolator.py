@@ -23,7 +23,7 @@ class TemplateNetworkInterpolator:
         self.interpolator = UnstructuredInterpolator(input_dict, remember_last=True,
                                                      bounds=((-5, 1),(-1.5, 1.5)))
 
-    def __call__(self, energy, impact, xmax, xb, yb):
+    def __call__(self, energy, impact, xmax, xb, yb, mask=None):
         """
         Evaluate interpolated templates for a set of shower parameters and pixel positions
 
@@ -39,6 +39,9 @@ class TemplateNetworkInterpolator:
             Pixel X position at which to evaluate template
         yb: array-like
             Pixel X position at which to evaluate template
+        mask: array-like
+            Boolean array of pixels to evaluate, pixels outside the mask are
+            skipped (optional)
 
         Returns
         -------
@@ -46,6 +49,8 @@ class TemplateNetworkInterpolator:
         """
         array = np.stack((energy, impact, xmax), axis=-1)
         points = ma.dstack((xb, yb))
+        if mask is not None:
+            points[~np.asarray(mask)] = ma.masked
 
         interpolated_value = self.interpolator(array, points)
         interpolated_value[interpolated_value<0] = 0
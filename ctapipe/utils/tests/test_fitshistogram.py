@@ -111,3 +111,21 @@ def test_histogram_resample_inplace():
 
         # at least check the resampling is undoable
         assert np.isclose(val0[0], val2[0])
+
+
+def test_histogram_merge():
+    hist1 = Histogram(nbins=[5, 10], ranges=[[-2.5, 2.5], [-1, 1]])
+    hist2 = Histogram(nbins=[5, 10], ranges=[[-2.5, 2.5], [-1, 1]])
+    data = np.random.normal(size=(100, 2))
+    hist1.fill(data[:60])
+    hist2.fill(data[60:])
+
+    expected = Histogram(nbins=[5, 10], ranges=[[-2.5, 2.5], [-1, 1]])
+    expected.fill(data)
+
+    hist1.merge(hist2)
+    assert (hist1.data == expected.data).all()
+    assert hist1.outliers == expected.outliers
+
+    with pytest.raises(ValueError):
+        hist1.merge(Histogram(nbins=[5, 5], ranges=[[-2.5, 2.5], [-1, 1]]))
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from ctapipe.utils.grouping import (
+    group_offsets,
+    group_offsets_from_index,
+    group_mean,
+    group_median,
+    group_std,
+    group_pairs,
+    group_sum,
+)
+
+
+def test_group_offsets():
+    groups, offsets = group_offsets([5, 5, 5, 2, 7, 7])
+    assert groups.tolist() == [5, 2, 7]
+    assert offsets.tolist() == [0, 3, 4, 6]
+
+    with pytest.raises(ValueError):
+        group_offsets([1, 2, 1])
+
+
+def test_group_sum():
+    offsets = np.array([0, 3, 3, 4, 6])
+    values = np.arange(6)
+
+    assert group_sum(values, offsets).tolist() == [3, 0, 3, 9]
+
+    values_2d = np.column_stack([values, -values])
+    assert group_sum(values_2d, offsets)[:, 1].tolist() == [-3, 0, -3, -9]
+
+
+def test_group_pairs():
+    offsets = np.array([0, 3, 4, 6])
+    first, second, pair_offsets = group_pairs(offsets)
+
+    assert pair_offsets.tolist() == [0, 3, 3, 4]
+    assert list(zip(first, second)) == [(0, 1), (0, 2), (1, 2), (4, 5)]
+
+
+def test_group_offsets_from_index():
+    order, offsets = group_offsets_from_index([2, 0, 2, 0, 3], n_groups=5)
+    assert order.tolist() == [1, 3, 0, 2, 4]
+    assert offsets.tolist() == [0, 2, 2, 4, 5, 5]
+
+
+def test_group_reductions():
+    rng = np.random.RandomState(0)
+    counts = np.array([3, 0, 1, 4, 7])
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    values = rng.normal(size=offsets[-1])
+    weights = rng.uniform(size=offsets[-1])
+
+    mean = group_mean(values, offsets, weights)
+    median = group_median(values, offsets)
+    std = group_std(values, offsets)
+    assert np.isnan(mean[1]) and np.isnan(median[1]) and np.isnan(std[1])
+
+    for i in [0, 2, 3, 4]:
+        group = slice(offsets[i], offsets[i + 1])
+        assert np.isclose(mean[i], np.average(values[group], weights=weights[group]))
+        assert np.isclose(median[i], np.median(values[group]))
+        assert np.isclose(std[i], np.std(values[group]))
+
+    # rows of multi dimensional values are averaged column-wise
+    values_2d = np.column_stack([values, 2 * values])
+    assert np.allclose(
+        group_mean(values_2d, offsets)[:, 1],
+        2 * group_mean(values, offsets),
+        equal_nan=True,
+    )
@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+def test_lazy_attributes():
+    import ctapipe.utils
+    from ctapipe.utils.fitshistogram import Histogram
+
+    assert 'Histogram' in dir(ctapipe.utils)
+    assert ctapipe.utils.Histogram is Histogram
+
+    # submodules can still be imported from the package
+    from ctapipe.utils import datasets
+    assert ctapipe.utils.get_dataset_path is datasets.get_dataset_path
+
+    with pytest.raises(AttributeError):
+        ctapipe.utils.does_not_exist
+
+
+def test_import_time():
+    """
+    Importing ctapipe.io must not import the heavy dependencies
+    of the io submodules
+    """
+    code = '\n'.join([
+        'import sys',
+        'import ctapipe.io',
+        'print(",".join(sorted(sys.modules)))',
+    ])
+    # make sure the subprocess finds the same ctapipe
+    import ctapipe
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [
+        os.path.dirname(os.path.dirname(ctapipe.__file__)),
+        env.get('PYTHONPATH'),
+    ]))
+    output = subprocess.check_output([sys.executable, '-c', code], env=env)
+    modules = output.decode().strip().splitlines()[-1].split(',')
+
+    for heavy in ('tables', 'astropy.table', 'scipy', 'ctapipe.io.hdf5tableio'):
+        assert heavy not in modules
@@ -72,6 +72,18 @@ if name == "nt":
     GIT_COMMAND = find_git_on_windows()
 
 
+def is_git_checkout(directory=CURRENT_DIRECTORY):
+    """check if directory is inside a git working tree, without calling git"""
+    directory = path.abspath(directory)
+    while True:
+        if path.exists(path.join(directory, ".git")):
+            return True
+        parent = path.dirname(directory)
+        if parent == directory:
+            return False
+        directory = parent
+
+
 def get_git_describe_version(abbrev=7):
     """return the string output of git desribe"""
     try:
@@ -152,7 +164,11 @@ def get_version(pep440=False):
     git-describe is used to get the version information.
 
     The file VERSION will need to be changed manually.
+
+    Git is only called for a git checkout of ctapipe.
     """
+    if not is_git_checkout():  # installed package, skip the git subprocess
+        return read_release_version()
 
     raw_git_version = get_git_describe_version()
     if not raw_git_version:  # not a git repository